@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hatchling.builders.wheel import WheelBuilder
 
 __all__ = [
     "build_editable",
@@ -47,7 +50,7 @@ def get_requires_for_build_wheel(config_settings: dict[str, Any] | None = None)
 def build_wheel(
     wheel_directory: str,
     config_settings: dict[str, Any] | None = None,  # noqa: ARG001
-    metadata_directory: str | None = None,  # noqa: ARG001
+    metadata_directory: str | None = None,
 ) -> str:
     """
     https://peps.python.org/pep-0517/#build-wheel
@@ -55,6 +58,11 @@ def build_wheel(
     from hatchling.builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd())
+    if metadata_directory is not None:
+        builder.metadata.reuse_core_metadata(
+            builder.config.core_metadata_constructor, os.path.join(metadata_directory, "METADATA")
+        )
+
     return os.path.basename(next(builder.build(directory=wheel_directory, versions=["standard"])))
 
 
@@ -72,7 +80,7 @@ def get_requires_for_build_editable(config_settings: dict[str, Any] | None = Non
 def build_editable(
     wheel_directory: str,
     config_settings: dict[str, Any] | None = None,  # noqa: ARG001
-    metadata_directory: str | None = None,  # noqa: ARG001
+    metadata_directory: str | None = None,
 ) -> str:
     """
     https://peps.python.org/pep-0660/#build-editable
@@ -80,9 +88,26 @@ def build_editable(
     from hatchling.builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd())
+    if metadata_directory is not None:
+        builder.metadata.reuse_core_metadata(
+            builder.config.core_metadata_constructor,
+            os.path.join(metadata_directory, "METADATA"),
+            _get_editable_extra_dependencies(builder),
+        )
+
     return os.path.basename(next(builder.build(directory=wheel_directory, versions=["editable"])))
 
 
+def _get_editable_extra_dependencies(builder: WheelBuilder) -> list[str]:
+    from hatchling.builders.constants import EDITABLES_REQUIREMENT
+
+    # Mirrors the dependencies that editable wheels add when no build hooks modify them
+    if not builder.config.dev_mode_dirs and builder.config.dev_mode_exact:
+        return [EDITABLES_REQUIREMENT]
+
+    return []
+
+
 # Any builder that has build-time hooks like Hatchling and setuptools cannot technically keep PEP 517's identical
 # metadata promise e.g. C extensions would require different tags in the `WHEEL` file. Therefore, we consider the
 # methods as mostly being for non-frontend tools like tox and dependency updaters. So Hatchling only writes the
@@ -114,7 +139,7 @@ if "PIP_BUILD_TRACKER" not in os.environ:
             os.mkdir(directory)
 
         with open(os.path.join(directory, "METADATA"), "w", encoding="utf-8") as f:
-            f.write(builder.config.core_metadata_constructor(builder.metadata))
+            f.write(builder.metadata.render_core_metadata(builder.config.core_metadata_constructor))
 
         return os.path.basename(directory)
 
@@ -125,7 +150,6 @@ if "PIP_BUILD_TRACKER" not in os.environ:
         """
         https://peps.python.org/pep-0660/#prepare-metadata-for-build-editable
         """
-        from hatchling.builders.constants import EDITABLES_REQUIREMENT
         from hatchling.builders.wheel import WheelBuilder
 
         builder = WheelBuilder(os.getcwd())
@@ -134,11 +158,11 @@ if "PIP_BUILD_TRACKER" not in os.environ:
         if not os.path.isdir(directory):
             os.mkdir(directory)
 
-        extra_dependencies = []
-        if not builder.config.dev_mode_dirs and builder.config.dev_mode_exact:
-            extra_dependencies.append(EDITABLES_REQUIREMENT)
-
         with open(os.path.join(directory, "METADATA"), "w", encoding="utf-8") as f:
-            f.write(builder.config.core_metadata_constructor(builder.metadata, extra_dependencies=extra_dependencies))
+            f.write(
+                builder.metadata.render_core_metadata(
+                    builder.config.core_metadata_constructor, _get_editable_extra_dependencies(builder)
+                )
+            )
 
         return os.path.basename(directory)
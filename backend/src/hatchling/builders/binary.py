@@ -1,16 +1,28 @@
 from __future__ import annotations
 
 import os
+import queue
 import sys
 from typing import TYPE_CHECKING, Any
 
 from hatchling.builders.config import BuilderConfig
+from hatchling.builders.constants import BuildEnvVars
 from hatchling.builders.plugin.interface import BuilderInterface
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+# PyApp options that the builder sets for each executable
+PER_EXECUTABLE_OPTIONS = frozenset((
+    "PYAPP_PROJECT_NAME",
+    "PYAPP_PROJECT_VERSION",
+    "PYAPP_PYTHON_VERSION",
+    "PYAPP_EXEC_SPEC",
+    "PYAPP_REPO",
+))
+
+
 class BinaryBuilderConfig(BuilderConfig):
     SUPPORTED_VERSIONS = ("3.12", "3.11", "3.10", "3.9", "3.8", "3.7")
 
@@ -20,6 +32,7 @@ class BinaryBuilderConfig(BuilderConfig):
         self.__scripts: list[str] | None = None
         self.__python_version: str | None = None
         self.__pyapp_version: str | None = None
+        self.__build_workers: int | None = None
 
     @property
     def scripts(self) -> list[str]:
@@ -81,6 +94,23 @@ class BinaryBuilderConfig(BuilderConfig):
 
         return self.__pyapp_version
 
+    @property
+    def build_workers(self) -> int:
+        if self.__build_workers is None:
+            build_workers = self.target_config.get("build-workers", 1)
+
+            if not isinstance(build_workers, int) or isinstance(build_workers, bool):
+                message = f"Field `tool.hatch.build.targets.{self.plugin_name}.build-workers` must be an integer"
+                raise TypeError(message)
+
+            if build_workers < 0:
+                message = f"Field `tool.hatch.build.targets.{self.plugin_name}.build-workers` must not be negative"
+                raise ValueError(message)
+
+            self.__build_workers = build_workers or os.cpu_count() or 1
+
+        return self.__build_workers
+
 
 class BinaryBuilder(BuilderInterface):
     """
@@ -114,6 +144,8 @@ class BinaryBuilder(BuilderInterface):
         import shutil
         import tempfile
 
+        from hatchling.builders.utils import exclusive_lock
+
         cargo_path = os.environ.get("CARGO", "")
         if not cargo_path:
             if not shutil.which("cargo"):
@@ -141,50 +173,113 @@ class BinaryBuilder(BuilderInterface):
         # cross compilation: https://github.com/cross-rs/cross/issues/1215
         repo_path = os.environ.get("PYAPP_REPO", "")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            exe_name = "pyapp.exe" if on_windows else "pyapp"
-            if repo_path:
-                context_dir = repo_path
-                target_dir = os.path.join(temp_dir, "build")
-                if build_target:
-                    temp_exe_path = os.path.join(target_dir, build_target, "release", exe_name)
-                else:
-                    temp_exe_path = os.path.join(target_dir, "release", exe_name)
-                install_command = [cargo_path, "build", "--release", "--target-dir", target_dir]
-            else:
-                context_dir = temp_dir
-                temp_exe_path = os.path.join(temp_dir, "bin", exe_name)
-                install_command = [cargo_path, "install", "pyapp", "--force", "--root", temp_dir]
-                if self.config.pyapp_version:
-                    install_command.extend(["--version", self.config.pyapp_version])
-
-            if self.config.scripts:
-                for script in self.config.scripts:
-                    env = dict(base_env)
-                    env["PYAPP_EXEC_SPEC"] = self.metadata.core.scripts[script]
-
-                    self.cargo_build(install_command, cwd=context_dir, env=env)
-
-                    exe_stem = (
-                        f"{script}-{self.metadata.version}-{build_target}"
-                        if build_target
-                        else f"{script}-{self.metadata.version}"
-                    )
-                    exe_path = os.path.join(app_dir, f"{exe_stem}.exe" if on_windows else exe_stem)
-                    shutil.move(temp_exe_path, exe_path)
-            else:
-                self.cargo_build(install_command, cwd=context_dir, env=base_env)
+        exe_name = "pyapp.exe" if on_windows else "pyapp"
+        builds = []
+        if self.config.scripts:
+            for script in self.config.scripts:
+                env = dict(base_env)
+                env["PYAPP_EXEC_SPEC"] = self.metadata.core.scripts[script]
 
                 exe_stem = (
-                    f"{self.metadata.name}-{self.metadata.version}-{build_target}"
+                    f"{script}-{self.metadata.version}-{build_target}"
                     if build_target
-                    else f"{self.metadata.name}-{self.metadata.version}"
+                    else f"{script}-{self.metadata.version}"
                 )
-                exe_path = os.path.join(app_dir, f"{exe_stem}.exe" if on_windows else exe_stem)
-                shutil.move(temp_exe_path, exe_path)
+                builds.append((env, os.path.join(app_dir, f"{exe_stem}.exe" if on_windows else exe_stem)))
+        else:
+            exe_stem = (
+                f"{self.metadata.name}-{self.metadata.version}-{build_target}"
+                if build_target
+                else f"{self.metadata.name}-{self.metadata.version}"
+            )
+            builds.append((base_env, os.path.join(app_dir, f"{exe_stem}.exe" if on_windows else exe_stem)))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = self.get_pyapp_cache_directory(temp_dir, cargo_path, build_target, repo_path)
+            workers = min(self.config.build_workers, len(builds))
+
+            # Each worker reuses a target directory for every executable it builds so that the dependencies of PyApp
+            # are only compiled once and, as the embedded configuration differs, only PyApp itself is rebuilt
+            target_dirs: queue.SimpleQueue[str] = queue.SimpleQueue()
+            for i in range(workers):
+                target_dirs.put(os.path.join(cache_dir, f"target-{i}"))
+
+            def build(i: int, env: dict[str, str], exe_path: str) -> None:
+                target_dir = target_dirs.get()
+                try:
+                    if repo_path:
+                        context_dir = repo_path
+                        if build_target:
+                            temp_exe_path = os.path.join(target_dir, build_target, "release", exe_name)
+                        else:
+                            temp_exe_path = os.path.join(target_dir, "release", exe_name)
+                        install_command = [cargo_path, "build", "--release", "--target-dir", target_dir]
+                    else:
+                        context_dir = os.path.join(temp_dir, str(i))
+                        temp_exe_path = os.path.join(context_dir, "bin", exe_name)
+                        install_command = [
+                            cargo_path,
+                            "install",
+                            "pyapp",
+                            "--force",
+                            "--root",
+                            context_dir,
+                            "--target-dir",
+                            target_dir,
+                        ]
+                        if self.config.pyapp_version:
+                            install_command.extend(["--version", self.config.pyapp_version])
+
+                    os.makedirs(context_dir, exist_ok=True)
+                    # Target directories in the build cache are shared with concurrent builds of other processes,
+                    # which must not replace the executable before it is moved
+                    with exclusive_lock(f"{target_dir}.lock"):
+                        self.cargo_build(install_command, cwd=context_dir, env=env)
+                        shutil.move(temp_exe_path, exe_path)
+                finally:
+                    target_dirs.put(target_dir)
+
+            if workers == 1:
+                for i, (env, exe_path) in enumerate(builds):
+                    build(i, env, exe_path)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(build, i, env, exe_path) for i, (env, exe_path) in enumerate(builds)]
+                    for future in futures:
+                        future.result()
 
         return app_dir
 
+    def get_pyapp_cache_directory(self, temp_dir: str, cargo_path: str, build_target: str, repo_path: str) -> str:
+        """
+        Compilation output is kept in the build cache when the `HATCH_BUILD_CACHE` environment variable is set,
+        keyed by everything that prevents it from being reused, and otherwise only for the current build.
+        """
+        cache_root = os.environ.get(BuildEnvVars.CACHE)
+        if not cache_root:
+            return os.path.join(temp_dir, "pyapp")
+
+        import hashlib
+        import json
+
+        # Options set by users rather than those that differ for every project or executable
+        options = {
+            name: value
+            for name, value in os.environ.items()
+            if name.startswith("PYAPP_") and name not in PER_EXECUTABLE_OPTIONS
+        }
+        key = {
+            "cargo": cargo_path,
+            "target": build_target,
+            "repo": os.path.abspath(repo_path) if repo_path else "",
+            "version": "" if repo_path else self.config.pyapp_version,
+            "options": options,
+        }
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(cache_root, "pyapp", digest[:32])
+
     def cargo_build(self, *args: Any, **kwargs: Any) -> None:
         import subprocess
 
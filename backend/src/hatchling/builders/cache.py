@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatchling.builders.plugin.interface import BuilderInterface
+
+
+def update_file_hash(hash_obj: hashlib._Hash, path: str) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(65536):
+            hash_obj.update(chunk)
+
+
+def get_build_hook_versions(builder: BuilderInterface) -> dict[str, str]:
+    """
+    Returns the version of the distribution providing each configured third-party build hook. Hooks that are
+    not provided by an installed distribution are identified by the contents of the module defining them.
+    """
+    from importlib.metadata import PackageNotFoundError, packages_distributions
+    from importlib.metadata import version as distribution_version
+
+    versions: dict[str, str] = {}
+    distributions: dict[str, list[str]] | None = None
+    for hook_name in sorted(builder.config.hook_config):
+        if hook_name == "custom":
+            continue
+
+        hook_class = builder.plugin_manager.build_hook.get(hook_name)
+        if hook_class is None:
+            continue
+
+        module_name = hook_class.__module__
+        if module_name.split(".")[0] == "hatchling":
+            continue
+
+        if distributions is None:
+            distributions = packages_distributions()
+
+        for distribution_name in distributions.get(module_name.split(".")[0], []):
+            try:
+                versions[hook_name] = f"{distribution_name}=={distribution_version(distribution_name)}"
+            except PackageNotFoundError:  # no cov
+                continue
+            break
+        else:
+            module_path = getattr(sys.modules.get(module_name), "__file__", None)
+            if module_path and os.path.isfile(module_path):
+                hash_obj = hashlib.sha256()
+                update_file_hash(hash_obj, module_path)
+                versions[hook_name] = hash_obj.hexdigest()
+            else:
+                versions[hook_name] = module_name
+
+    return versions
+
+
+def get_build_input_digest(builder: BuilderInterface, version: str) -> str:
+    """
+    Returns a digest of everything a build of `version` is expected to depend on: the selected files, the
+    resolved core metadata, the build configuration including that of build hooks, the build hook scripts,
+    the versions of third-party build hooks, the builder, the version of Hatchling and the interpreter and platform, since build hooks may infer tags.
+    Editable builds also depend on the location of the project, which they embed.
+    """
+    import sysconfig
+
+    from hatchling.__about__ import __version__
+    from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
+    from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+    builder_class = type(builder)
+    inputs = {
+        "hatchling": __version__,
+        "builder": f"{builder_class.__module__}.{builder_class.__qualname__}",
+        "target": builder.PLUGIN_NAME,
+        "version": version,
+        "build-config": builder.build_config,
+        "hooks": builder.config.hook_config,
+        "hook-versions": get_build_hook_versions(builder),
+        "source-date-epoch": os.environ.get("SOURCE_DATE_EPOCH"),
+        "metadata": builder.metadata.render_core_metadata(get_core_metadata_constructors()[DEFAULT_METADATA_VERSION]),
+        "implementation": sys.implementation.name,
+        "python": ".".join(map(str, sys.version_info[:3])),
+        "abi": sysconfig.get_config_var("SOABI") or sysconfig.get_config_var("EXT_SUFFIX"),
+        "platform": sysconfig.get_platform(),
+        "macosx-deployment-target": os.environ.get("MACOSX_DEPLOYMENT_TARGET"),
+    }
+    if version == "editable":
+        inputs["root"] = os.path.normcase(os.path.abspath(builder.root))
+
+    hash_obj = hashlib.sha256()
+    hash_obj.update(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8"))
+
+    # Build hooks defined by the project are code that may change without any configuration changing
+    for hook_name, hook_config in sorted(builder.config.hook_config.items()):
+        if hook_name == "custom":
+            script = os.path.normpath(os.path.join(builder.root, hook_config.get("path", DEFAULT_BUILD_SCRIPT)))
+            hash_obj.update(script.encode("utf-8"))
+            if os.path.isfile(script):
+                update_file_hash(hash_obj, script)
+
+    for included_file in builder.recurse_included_files():
+        file_stat = os.stat(included_file.path)
+        hash_obj.update(
+            f"\0{included_file.distribution_path}\0{included_file.relative_path}\0{file_stat.st_mode}\0"
+            f"{file_stat.st_size}\0{file_stat.st_mtime_ns}\0".encode()
+        )
+        update_file_hash(hash_obj, included_file.path)
+
+    return hash_obj.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Artifacts of a target stored by the digest of their build inputs, keeping only the most recent artifact of
+    each version of the target.
+    """
+
+    def __init__(self, directory: str, project_name: str, target_name: str) -> None:
+        self.directory = os.path.join(directory, project_name, target_name)
+
+    def get(self, version: str, digest: str, directory: str) -> str | None:
+        """
+        Copies the artifact of `version` built from inputs matching `digest` into `directory`, returning its path.
+        """
+        entry = os.path.join(self.directory, version, digest)
+        try:
+            (artifact_name,) = os.listdir(entry)
+            artifact = os.path.join(directory, artifact_name)
+            shutil.copyfile(os.path.join(entry, artifact_name), artifact)
+        except (OSError, ValueError):
+            return None
+
+        return artifact
+
+    def add(self, version: str, digest: str, artifact: str) -> None:
+        """
+        Stores `artifact` as the artifact of `version` built from inputs matching `digest`. Failure to do so
+        does not affect the build.
+        """
+        import tempfile
+
+        version_directory = os.path.join(self.directory, version)
+        try:
+            os.makedirs(version_directory, exist_ok=True)
+            staging = tempfile.mkdtemp(prefix=".", dir=version_directory)
+        except OSError:
+            return
+
+        try:
+            shutil.copyfile(artifact, os.path.join(staging, os.path.basename(artifact)))
+
+            for entry in os.listdir(version_directory):
+                if not entry.startswith("."):
+                    shutil.rmtree(os.path.join(version_directory, entry), ignore_errors=True)
+
+            os.replace(staging, os.path.join(version_directory, digest))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
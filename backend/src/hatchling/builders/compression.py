@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import struct
+import time
+import zipfile
+import zlib
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    import pathspec
+
+GZIP_COMPRESS_LEVEL = 9
+# Same as pigz, the size of the blocks that are compressed independently
+PARALLEL_BLOCK_SIZE = 131072
+# The maximum distance of DEFLATE back-references
+DICTIONARY_SIZE = 32768
+
+COMPRESSION_METHODS = {"stored": zipfile.ZIP_STORED, "deflated": zipfile.ZIP_DEFLATED}
+# Only the beginning of files is sampled to detect data that is already compressed, like images or archives
+INCOMPRESSIBLE_SAMPLE_SIZE = 16384
+# Smaller files are always compressed as the detection would cost about as much as the compression
+INCOMPRESSIBLE_MIN_SIZE = 4096
+INCOMPRESSIBLE_RATIO = 0.95
+
+
+def compress_block(data: bytes, dictionary: bytes, *, level: int, last: bool) -> bytes:
+    options = (level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY)
+    compressor = zlib.compressobj(*options, zdict=dictionary) if dictionary else zlib.compressobj(*options)
+
+    # A sync flush ends the block on a byte boundary so that blocks may be concatenated
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipFile:
+    """
+    A write-only gzip stream that, like pigz, splits data into fixed-size blocks that are compressed by a pool of
+    threads and concatenated into a single member. Each block is primed with the end of the preceding block to
+    retain most of the compression ratio. The output only depends on the data, modification time and level, not
+    the number of workers.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        *,
+        max_workers: int,
+        mtime: int | None = None,
+        level: int = GZIP_COMPRESS_LEVEL,
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.fileobj = fileobj
+        self.level = level
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_pending = 2 * max_workers
+        self.closed = False
+
+        self.__buffer = bytearray()
+        self.__dictionary = b""
+        self.__pending: deque[Future[bytes]] = deque()
+        self.__crc = 0
+        self.__size = 0
+
+        self.__write_header(int(time.time()) if mtime is None else mtime)
+
+    def write(self, data: bytes) -> int:
+        if self.closed:
+            message = "write to closed file"
+            raise ValueError(message)
+
+        self.__crc = zlib.crc32(data, self.__crc)
+        self.__size += len(data)
+        self.__buffer += data
+
+        while len(self.__buffer) >= PARALLEL_BLOCK_SIZE:
+            block = bytes(self.__buffer[:PARALLEL_BLOCK_SIZE])
+            del self.__buffer[:PARALLEL_BLOCK_SIZE]
+            self.__submit(block, last=False)
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self.__size
+
+    def flush(self) -> None:
+        self.fileobj.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        try:
+            self.__submit(bytes(self.__buffer), last=True)
+            self.__buffer.clear()
+            while self.__pending:
+                self.fileobj.write(self.__pending.popleft().result())
+
+            self.fileobj.write(struct.pack("<II", self.__crc, self.__size & 0xFFFFFFFF))
+        finally:
+            self.closed = True
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __submit(self, block: bytes, *, last: bool) -> None:
+        self.__pending.append(
+            self.executor.submit(compress_block, block, self.__dictionary, level=self.level, last=last)
+        )
+        self.__dictionary = block[-DICTIONARY_SIZE:]
+
+        # Bound the memory held by blocks that are compressed but not yet written
+        while len(self.__pending) > self.max_pending or (self.__pending and self.__pending[0].done()):
+            self.fileobj.write(self.__pending.popleft().result())
+
+    def __write_header(self, mtime: int) -> None:
+        # https://www.rfc-editor.org/rfc/rfc1952#section-2.3
+        if self.level == GZIP_COMPRESS_LEVEL:
+            extra_flags = 2
+        elif self.level == 1:
+            extra_flags = 4
+        else:
+            extra_flags = 0
+
+        # Same as `gzip.GzipFile` without a file name: deflate, no flags and an unknown operating system
+        self.fileobj.write(struct.pack("<BBBBIBB", 0x1F, 0x8B, 8, 0, mtime, extra_flags, 255))
+
+    def __enter__(self) -> ParallelGzipFile:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def is_incompressible(sample: bytes) -> bool:
+    """
+    Whether compressing data that begins with `sample` is unlikely to reduce its size meaningfully.
+    """
+    if len(sample) < INCOMPRESSIBLE_MIN_SIZE:
+        return False
+
+    return len(zlib.compress(sample[:INCOMPRESSIBLE_SAMPLE_SIZE], 1)) >= len(sample) * INCOMPRESSIBLE_RATIO
+
+
+class CompressionPolicy:
+    """
+    Decides how each entry of a ZIP archive is compressed. The first rule whose pattern matches the path of an
+    entry determines its compression method and level, otherwise entries that are detected to be incompressible
+    are stored and the rest use the default method and level.
+    """
+
+    def __init__(
+        self,
+        rules: list[tuple[pathspec.GitIgnoreSpec, int, int | None]] | None = None,
+        *,
+        method: int = zipfile.ZIP_DEFLATED,
+        level: int | None = None,
+        detect_incompressible: bool = True,
+    ) -> None:
+        self.rules = rules or []
+        self.method = method
+        self.level = level
+        self.detect_incompressible = detect_incompressible
+
+    def get_compression(self, relative_path: str, sample: bytes = b"") -> tuple[int, int | None]:
+        """
+        Returns the compression method and level, where `None` is the default level, for the entry at
+        `relative_path` whose contents begin with `sample`.
+        """
+        for spec, method, level in self.rules:
+            if spec.match_file(relative_path):
+                return method, level
+
+        if self.method == zipfile.ZIP_STORED:
+            return zipfile.ZIP_STORED, None
+
+        if self.detect_incompressible and is_incompressible(sample):
+            return zipfile.ZIP_STORED, None
+
+        return self.method, self.level
+
+
+def set_zip_info_compression(zip_info: zipfile.ZipInfo, method: int, level: int | None) -> None:
+    zip_info.compress_type = method
+    # Python 3.13 made the attribute public
+    if hasattr(zip_info, "compress_level"):
+        zip_info.compress_level = level
+    else:
+        zip_info._compresslevel = level  # type: ignore[attr-defined] # noqa: SLF001
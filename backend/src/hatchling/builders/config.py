@@ -7,7 +7,12 @@ from typing import TYPE_CHECKING, Any, TypeVar
 
 import pathspec
 
-from hatchling.builders.constants import DEFAULT_BUILD_DIRECTORY, EXCLUDED_DIRECTORIES, BuildEnvVars
+from hatchling.builders.constants import (
+    DEFAULT_BUILD_DIRECTORY,
+    EXCLUDED_DIRECTORIES,
+    FILE_ENUMERATION_METHODS,
+    BuildEnvVars,
+)
 from hatchling.builders.utils import normalize_inclusion_map, normalize_relative_directory, normalize_relative_path
 from hatchling.metadata.utils import normalize_project_name
 from hatchling.utils.fs import locate_file
@@ -303,6 +308,25 @@ class BuilderConfig:
 
         return ignore_vcs
 
+    @cached_property
+    def file_enumeration(self) -> str:
+        if "file-enumeration" in self.target_config:
+            file_enumeration = self.target_config["file-enumeration"]
+            file_enumeration_location = f"tool.hatch.build.targets.{self.plugin_name}.file-enumeration"
+        else:
+            file_enumeration = self.build_config.get("file-enumeration", "walk")
+            file_enumeration_location = "tool.hatch.build.file-enumeration"
+
+        if not isinstance(file_enumeration, str):
+            message = f"Field `{file_enumeration_location}` must be a string"
+            raise TypeError(message)
+
+        if file_enumeration not in FILE_ENUMERATION_METHODS:
+            message = f"Field `{file_enumeration_location}` must be one of: {', '.join(FILE_ENUMERATION_METHODS)}"
+            raise ValueError(message)
+
+        return file_enumeration
+
     @cached_property
     def require_runtime_dependencies(self) -> bool:
         if "require-runtime-dependencies" in self.target_config:
@@ -31,6 +31,14 @@ EXCLUDED_FILES = frozenset((
     ".git",
 ))
 
+# The first is the default
+FILE_ENUMERATION_METHODS = (
+    # Walk the file system
+    "walk",
+    # Read the index of the Git work tree
+    "git",
+)
+
 
 class BuildEnvVars:
     LOCATION = "HATCH_BUILD_LOCATION"
@@ -40,6 +48,8 @@ class BuildEnvVars:
     HOOK_ENABLE_PREFIX = "HATCH_BUILD_HOOK_ENABLE_"
     CLEAN = "HATCH_BUILD_CLEAN"
     CLEAN_HOOKS_AFTER = "HATCH_BUILD_CLEAN_HOOKS_AFTER"
+    CACHE = "HATCH_BUILD_CACHE"
+    PROFILE = "HATCH_BUILD_PROFILE"
 
 
 EDITABLES_REQUIREMENT = "editables~=0.3"
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import TYPE_CHECKING
+
+from hatchling.builders.utils import safe_walk
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# https://git-scm.com/docs/index-format
+SYMLINK_MODE = "120000"
+GITLINK_MODE = "160000"
+
+
+class GitFileIndex:
+    """
+    The files of a Git work tree that are candidates for inclusion: tracked files that still exist and untracked
+    files that are not ignored by any `.gitignore` file, `.git/info/exclude` or the global exclusion file. Ignored
+    directories are never descended into unless ignored files are requested.
+    """
+
+    def __init__(self, root: str, files: Iterable[str], directories: Iterable[str]) -> None:
+        self.root = root
+
+        # Relative directory -> child directory names, file names
+        self.__directories: dict[str, set[str]] = {"": set()}
+        self.__files: dict[str, list[str]] = {"": []}
+        # Directories that Git does not enumerate, such as submodules, nested repositories and symbolic links,
+        # and therefore must be walked
+        self.__opaque_directories: set[str] = set()
+
+        for relative_path in files:
+            parent, _, name = relative_path.rpartition(os.sep)
+            self.__add_directory(parent)
+            self.__files[parent].append(name)
+
+        for relative_path in directories:
+            parent, _, name = relative_path.rpartition(os.sep)
+            self.__add_directory(parent)
+            self.__directories[parent].add(name)
+            self.__opaque_directories.add(relative_path)
+
+    def __add_directory(self, relative_path: str) -> None:
+        while relative_path not in self.__directories:
+            self.__directories[relative_path] = set()
+            self.__files[relative_path] = []
+
+            parent, _, name = relative_path.rpartition(os.sep)
+            self.__directories.setdefault(parent, set()).add(name)
+            self.__files.setdefault(parent, [])
+            relative_path = parent
+
+    def walk(self) -> Iterable[tuple[str, list[str], list[str]]]:
+        """
+        Same as `os.walk`, including pruning by modifying the directory names in place.
+        """
+        yield from self.__walk("")
+
+    def __walk(self, relative_path: str) -> Iterable[tuple[str, list[str], list[str]]]:
+        if relative_path in self.__opaque_directories:
+            yield from safe_walk(os.path.join(self.root, relative_path))
+            return
+
+        dirs = sorted(self.__directories.get(relative_path, ()))
+        files = list(self.__files.get(relative_path, ()))
+        yield os.path.join(self.root, relative_path) if relative_path else self.root, dirs, files
+
+        for name in dirs:
+            yield from self.__walk(os.path.join(relative_path, name) if relative_path else name)
+
+
+def run_git_ls_files(root: str, *args: str) -> list[str] | None:
+    try:
+        process = subprocess.run(
+            ["git", "ls-files", "-z", *args],  # noqa: S607
+            cwd=root,
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+
+    if process.returncode:
+        return None
+
+    return [os.fsdecode(entry) for entry in process.stdout.split(b"\0") if entry]
+
+
+def is_ignored_by_git(root: str) -> bool:
+    try:
+        process = subprocess.run(
+            ["git", "check-ignore", "-q", "."],  # noqa: S607
+            cwd=root,
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return False
+
+    # Exit code 1 means not ignored, anything else is an error
+    return process.returncode == 0
+
+
+def get_git_file_index(root: str, *, include_ignored: bool = False) -> GitFileIndex | None:
+    """
+    Returns the file index of the Git work tree at `root`, or `None` if it is not inside of one, the work tree
+    ignores it, Git knows of no files within it or Git is not available.
+    """
+    entries = run_git_ls_files(root, "-t", "--stage", "--cached", "--deleted", "--others", "--exclude-standard")
+    # A root that is ignored by the work tree containing it, such as an unpacked source distribution in an
+    # ignored build directory, has no candidates although none of its files are ignored on their own
+    if not entries or is_ignored_by_git(root):
+        return None
+
+    candidates: dict[str, str] = {}
+    deleted: set[str] = set()
+    for entry in entries:
+        tag, _, info = entry.partition(" ")
+        if tag == "?":
+            mode, path = "", info
+        else:
+            metadata, _, path = info.partition("\t")
+            mode = metadata.split(" ", 1)[0]
+
+        if tag == "R":
+            deleted.add(path)
+        else:
+            candidates.setdefault(path, mode)
+
+    if include_ignored:
+        ignored = run_git_ls_files(root, "--others", "--ignored", "--exclude-standard", "--directory")
+        if ignored is None:
+            return None
+
+        for path in ignored:
+            candidates.setdefault(path, "")
+
+    files = []
+    directories = []
+    for path, mode in candidates.items():
+        if path in deleted:
+            continue
+
+        relative_path = os.path.normpath(path)
+        # Only symbolic links require a check as they may refer to directories, which are walked like the rest
+        is_directory = (
+            path.endswith("/")
+            or mode == GITLINK_MODE
+            or (mode == SYMLINK_MODE and os.path.isdir(os.path.join(root, relative_path)))
+        )
+        if is_directory:
+            directories.append(relative_path)
+        else:
+            files.append(relative_path)
+
+    return GitFileIndex(root, files, directories)
@@ -125,11 +125,46 @@ class BuildHookInterface(Generic[BuilderConfigBound]):  # no cov
         """
         return []
 
+    def inputs(self) -> list[str]:
+        """
+        A list of glob patterns, relative to the project root, matching the files that the
+        [initialization](#hatchling.builders.hooks.plugin.interface.BuildHookInterface.initialize) stage
+        depends on, defaulting to the `inputs` option. When defined, the stage is skipped if none of the
+        matching files, the [outputs](#hatchling.builders.hooks.plugin.interface.BuildHookInterface.outputs),
+        the configuration of the hook nor the build data it receives have changed since it last ran, and the
+        modifications it made to the build data are applied instead.
+        """
+        return self.__get_paths_option("inputs")
+
+    def outputs(self) -> list[str]:
+        """
+        A list of paths, relative to the project root, of the files and directories that the
+        [initialization](#hatchling.builders.hooks.plugin.interface.BuildHookInterface.initialize) stage
+        creates, defaulting to the `outputs` option. The stage always runs if any of them is missing or
+        has been modified.
+        """
+        return self.__get_paths_option("outputs")
+
+    def __get_paths_option(self, option: str) -> list[str]:
+        paths = self.config.get(option, [])
+        if not isinstance(paths, list):
+            message = f"Option `{option}` for build hook `{self.PLUGIN_NAME}` must be an array"
+            raise TypeError(message)
+
+        for i, path in enumerate(paths, 1):
+            if not isinstance(path, str):
+                message = f"Entry #{i} of option `{option}` for build hook `{self.PLUGIN_NAME}` must be a string"
+                raise TypeError(message)
+
+        return paths
+
     def clean(self, versions: list[str]) -> None:
         """
         This occurs before the build process if the `-c`/`--clean` flag was passed to
         the [`build`](../../cli/reference.md#hatch-build) command, or when invoking
-        the [`clean`](../../cli/reference.md#hatch-clean) command.
+        the [`clean`](../../cli/reference.md#hatch-clean) command. This also discards the
+        records used to skip the initialization stage for hooks that define
+        [inputs](#hatchling.builders.hooks.plugin.interface.BuildHookInterface.inputs).
         """
 
     def initialize(self, version: str, build_data: dict[str, Any]) -> None:
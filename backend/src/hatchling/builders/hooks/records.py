@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# Build data that the build system provides rather than hooks
+IMMUTABLE_BUILD_DATA = frozenset(("build_hooks",))
+
+
+def get_file_hash(path: str) -> str:
+    hash_obj = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(65536):
+            hash_obj.update(chunk)
+
+    return hash_obj.hexdigest()
+
+
+def iter_files(root: str, relative_path: str) -> Iterable[str]:
+    path = os.path.join(root, relative_path)
+    if not os.path.isdir(path):
+        yield relative_path
+        return
+
+    for current, directories, files in os.walk(path):
+        directories.sort()
+        for name in sorted(files):
+            yield os.path.relpath(os.path.join(current, name), root)
+
+
+def get_build_data_changes(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Returns the modifications of build data as operations that may be replayed, or `None` if they cannot be
+    recorded. Lists that are extended and mappings that are updated only record the new items so that replaying
+    them preserves modifications made by other build hooks.
+    """
+    changes: dict[str, Any] = {}
+    for key, value in after.items():
+        if key in IMMUTABLE_BUILD_DATA:
+            continue
+
+        if key not in before:
+            changes[key] = {"set": value}
+            continue
+
+        previous = before[key]
+        if value == previous:
+            continue
+
+        if isinstance(value, list) and isinstance(previous, list) and value[: len(previous)] == previous:
+            changes[key] = {"extend": value[len(previous) :]}
+        elif (
+            isinstance(value, dict)
+            and isinstance(previous, dict)
+            and all(k in value for k in previous)
+            and all(isinstance(k, str) for k in value)
+        ):
+            changes[key] = {"update": {k: v for k, v in value.items() if k not in previous or previous[k] != v}}
+        else:
+            changes[key] = {"set": value}
+
+    if any(key not in after for key in before):
+        return None
+
+    try:
+        # Only data that survives serialization unchanged may be replayed
+        if json.loads(json.dumps(changes)) != changes:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    return changes
+
+
+def apply_build_data_changes(build_data: dict[str, Any], changes: dict[str, Any]) -> None:
+    for key, change in changes.items():
+        if "extend" in change:
+            build_data[key].extend(change["extend"])
+        elif "update" in change:
+            build_data[key].update(change["update"])
+        else:
+            build_data[key] = change["set"]
+
+
+class BuildHookRecords:
+    """
+    Records of the initialization stage of build hooks that declare their inputs, so that the stage may be
+    skipped when neither the inputs nor the outputs have changed since it last ran. Records are stored in the
+    `.hatch/build-hooks` directory of the project.
+    """
+
+    def __init__(self, root: str, target_name: str) -> None:
+        self.root = root
+        self.directory = os.path.join(root, ".hatch", "build-hooks", target_name)
+
+    def get_record_path(self, hook_name: str, version: str) -> str:
+        return os.path.join(self.directory, version, f"{hook_name}.json")
+
+    def get_fingerprint(
+        self,
+        hook_name: str,
+        build_hook: BuildHookInterface,
+        version: str,
+        build_data: dict[str, Any],
+        inputs: list[str],
+        outputs: list[str],
+    ) -> str:
+        import glob
+
+        from hatchling.__about__ import __version__
+
+        hook_class = type(build_hook)
+        data = {
+            "hatchling": __version__,
+            "hook": f"{hook_class.__module__}.{hook_class.__qualname__}",
+            "name": hook_name,
+            "config": build_hook.config,
+            "version": version,
+            "project-version": build_hook.metadata.version,
+            "build-data": build_data,
+            "inputs": inputs,
+            "outputs": outputs,
+        }
+
+        hash_obj = hashlib.sha256()
+        hash_obj.update(json.dumps(data, sort_keys=True, default=str).encode("utf-8"))
+
+        input_files: set[str] = set()
+        for pattern in inputs:
+            for relative_path in glob.glob(pattern, root_dir=self.root, recursive=True):
+                input_files.update(iter_files(self.root, relative_path))
+
+        # Contents rather than modification times are compared so that fresh checkouts, as in CI, may be skipped
+        for relative_path in sorted(os.path.normpath(path).replace(os.sep, "/") for path in input_files):
+            hash_obj.update(f"\0{relative_path}\0{get_file_hash(os.path.join(self.root, relative_path))}".encode())
+
+        return hash_obj.hexdigest()
+
+    def get_output_hashes(self, outputs: list[str]) -> dict[str, str] | None:
+        hashes = {}
+        for output in outputs:
+            if not os.path.exists(os.path.join(self.root, output)):
+                return None
+
+            for relative_path in iter_files(self.root, output):
+                hashes[relative_path.replace(os.sep, "/")] = get_file_hash(os.path.join(self.root, relative_path))
+
+        return hashes
+
+    def initialize(
+        self, hook_name: str, build_hook: BuildHookInterface, version: str, build_data: dict[str, Any]
+    ) -> bool:
+        """
+        Runs the initialization stage of `build_hook` unless its record shows that nothing has changed, in which
+        case the recorded modifications of the build data are applied instead. Returns whether the stage ran.
+        """
+        inputs = build_hook.inputs()
+        if not inputs:
+            build_hook.initialize(version, build_data)
+            return True
+
+        outputs = build_hook.outputs()
+        record_path = self.get_record_path(hook_name, version)
+        fingerprint = self.get_fingerprint(hook_name, build_hook, version, build_data, inputs, outputs)
+
+        try:
+            with open(record_path, encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            record = None
+
+        if (
+            isinstance(record, dict)
+            and record.get("fingerprint") == fingerprint
+            and record.get("outputs") == self.get_output_hashes(outputs)
+        ):
+            apply_build_data_changes(build_data, record["build-data"])
+            return False
+
+        before = copy.deepcopy(build_data)
+        build_hook.initialize(version, build_data)
+
+        changes = get_build_data_changes(before, build_data)
+        output_hashes = self.get_output_hashes(outputs)
+        if changes is None or output_hashes is None:
+            self.forget(hook_name, [version])
+            return True
+
+        record = {"fingerprint": fingerprint, "outputs": output_hashes, "build-data": changes}
+        with contextlib.suppress(OSError):
+            os.makedirs(os.path.dirname(record_path), exist_ok=True)
+            with open(f"{record_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(record, f)
+
+            os.replace(f"{record_path}.tmp", record_path)
+
+        return True
+
+    def forget(self, hook_name: str, versions: list[str]) -> None:
+        """
+        Removes the records of `hook_name` for `versions`, or every version if none are given.
+        """
+        if not versions:
+            try:
+                versions = os.listdir(self.directory)
+            except OSError:
+                return
+
+        for version in versions:
+            with contextlib.suppress(OSError):
+                os.remove(self.get_record_path(hook_name, version))
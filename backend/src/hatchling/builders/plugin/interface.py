@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Generic, cast
 
 from hatchling.builders.config import BuilderConfig, BuilderConfigBound, env_var_enabled
 from hatchling.builders.constants import EXCLUDED_DIRECTORIES, EXCLUDED_FILES, BuildEnvVars
+from hatchling.builders.profiling import get_profiler, profile_span
 from hatchling.builders.utils import get_relative_path, safe_walk
 from hatchling.plugin.manager import PluginManagerBound
 
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Iterable
 
     from hatchling.bridge.app import Application
+    from hatchling.builders.cache import ArtifactCache
     from hatchling.builders.hooks.plugin.interface import BuildHookInterface
     from hatchling.metadata.core import ProjectMetadata
 
@@ -88,8 +90,11 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         clean_hooks_after: bool | None = None,
         clean_only: bool | None = False,
     ) -> Generator[str, None, None]:
+        profiler = get_profiler()
+
         # Fail early for invalid project metadata
-        self.metadata.validate_fields()
+        with profile_span(profiler, "validate metadata", "metadata"):
+            self.metadata.validate_fields()
 
         if directory is None:
             directory = (
@@ -116,7 +121,10 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
             hooks_only = env_var_enabled(BuildEnvVars.HOOKS_ONLY)
 
         configured_build_hooks = self.get_build_hooks(directory)
-        build_hooks = list(configured_build_hooks.values())
+
+        from hatchling.builders.hooks.records import BuildHookRecords
+
+        build_hook_records = BuildHookRecords(self.root, self.PLUGIN_NAME)
 
         if clean_only:
             clean = True
@@ -126,8 +134,9 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
             if not hooks_only:
                 self.clean(directory, versions)
 
-            for build_hook in build_hooks:
+            for hook_name, build_hook in configured_build_hooks.items():
                 build_hook.clean(versions)
+                build_hook_records.forget(hook_name, versions)
 
             if clean_only:
                 return
@@ -135,36 +144,100 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         if clean_hooks_after is None:
             clean_hooks_after = env_var_enabled(BuildEnvVars.CLEAN_HOOKS_AFTER)
 
-        for version in versions:
-            self.app.display_debug(f"Building `{self.PLUGIN_NAME}` version `{version}`")
-
-            build_data = self.get_default_build_data()
-            self.set_build_data_defaults(build_data)
-
-            # Allow inspection of configured build hooks and the order in which they run
-            build_data["build_hooks"] = tuple(configured_build_hooks)
-
-            # Execute all `initialize` build hooks
-            for build_hook in build_hooks:
-                build_hook.initialize(version, build_data)
-
-            if hooks_only:
-                self.app.display_debug(f"Only ran build hooks for `{self.PLUGIN_NAME}` version `{version}`")
-                continue
-
-            # Build the artifact
-            with self.config.set_build_data(build_data):
-                artifact = version_api[version](directory, **build_data)
+        artifact_cache = None if hooks_only else self.get_artifact_cache()
+
+        try:
+            for version in versions:
+                if artifact_cache is not None:
+                    from hatchling.builders.cache import get_build_input_digest
+
+                    # Inputs are collected before build hooks run so that nothing they generate is required
+                    with profile_span(profiler, "compute input digest", "cache"):
+                        input_digest = get_build_input_digest(self, version)
+
+                    artifact = artifact_cache.get(version, input_digest, directory)
+                    if artifact is not None:
+                        self.app.display_debug(f"Reused `{self.PLUGIN_NAME}` version `{version}` from the build cache")
+                        yield artifact
+                        continue
+
+                self.app.display_debug(f"Building `{self.PLUGIN_NAME}` version `{version}`")
+
+                build_data = self.get_default_build_data()
+                self.set_build_data_defaults(build_data)
+
+                # Allow inspection of configured build hooks and the order in which they run
+                build_data["build_hooks"] = tuple(configured_build_hooks)
+
+                # Execute all `initialize` build hooks
+                for hook_name, build_hook in configured_build_hooks.items():
+                    with profile_span(
+                        profiler,
+                        f"{hook_name}.initialize",
+                        "hooks",
+                        target=self.PLUGIN_NAME,
+                        version=version,
+                        hook=hook_name,
+                        stage="initialize",
+                    ):
+                        initialized = build_hook_records.initialize(hook_name, build_hook, version, build_data)
+
+                    if not initialized:
+                        self.app.display_debug(
+                            f"Skipped build hook `{hook_name}` as its inputs and outputs are unchanged"
+                        )
+
+                if hooks_only:
+                    self.app.display_debug(f"Only ran build hooks for `{self.PLUGIN_NAME}` version `{version}`")
+                    continue
 
-            # Execute all `finalize` build hooks
-            for build_hook in build_hooks:
-                build_hook.finalize(version, build_data, artifact)
+                # Build the artifact
+                with (
+                    self.config.set_build_data(build_data),
+                    profile_span(
+                        profiler, f"{self.PLUGIN_NAME}:{version}", "build", target=self.PLUGIN_NAME, version=version
+                    ),
+                ):
+                    artifact = version_api[version](directory, **build_data)
+
+                # Execute all `finalize` build hooks
+                for hook_name, build_hook in configured_build_hooks.items():
+                    with profile_span(
+                        profiler,
+                        f"{hook_name}.finalize",
+                        "hooks",
+                        target=self.PLUGIN_NAME,
+                        version=version,
+                        hook=hook_name,
+                        stage="finalize",
+                    ):
+                        build_hook.finalize(version, build_data, artifact)
+
+                if clean_hooks_after:
+                    for hook_name, build_hook in configured_build_hooks.items():
+                        build_hook.clean([version])
+                        build_hook_records.forget(hook_name, [version])
+
+                if artifact_cache is not None:
+                    artifact_cache.add(version, input_digest, artifact)
+
+                yield artifact
+        finally:
+            if profiler is not None:
+                profiler.write()
+
+    def get_artifact_cache(self) -> ArtifactCache | None:
+        """
+        The store of artifacts to reuse when nothing they were built from has changed, which is only enabled when
+        the `HATCH_BUILD_CACHE` environment variable is set to the directory in which to store them.
+        """
+        cache_directory = os.environ.get(BuildEnvVars.CACHE)
+        if not cache_directory:
+            return None
 
-            if clean_hooks_after:
-                for build_hook in build_hooks:
-                    build_hook.clean([version])
+        from hatchling.builders.cache import ArtifactCache
 
-            yield artifact
+        return ArtifactCache(cache_directory, self.metadata.name, self.PLUGIN_NAME)
 
     def recurse_included_files(self) -> Iterable[IncludedFile]:
         """
@@ -175,8 +248,13 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         - `relative_path` - the path relative to the project root; will be an empty string for external files
         - `distribution_path` - the path to be distributed as
         """
-        yield from self.recurse_selected_project_files()
-        yield from self.recurse_forced_files(self.config.get_force_include())
+        profiler = get_profiler()
+        if profiler is None:
+            yield from self.recurse_selected_project_files()
+            yield from self.recurse_forced_files(self.config.get_force_include())
+        else:
+            yield from profiler.iterate("walk", self.recurse_selected_project_files())
+            yield from profiler.iterate("walk", self.recurse_forced_files(self.config.get_force_include()))
 
     def recurse_selected_project_files(self) -> Iterable[IncludedFile]:
         if self.config.only_include:
@@ -184,11 +262,33 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
         else:
             yield from self.recurse_project_files()
 
+    def walk_project_files(self) -> Iterable[tuple[str, list[str], list[str]]]:
+        """
+        Same as `os.walk` for the project root, enumerating candidate files using the configured method.
+        """
+        if self.config.file_enumeration == "git" and not self.config.ignore_vcs:
+            from hatchling.builders.git import get_git_file_index
+
+            # Files ignored by Git may still be selected as artifacts
+            include_ignored = self.config.artifact_spec is not None or self.config.build_artifact_spec is not None
+            file_index = get_git_file_index(self.root, include_ignored=include_ignored)
+            if file_index is not None:
+                return file_index.walk()
+
+        return safe_walk(self.root)
+
     def recurse_project_files(self) -> Iterable[IncludedFile]:
-        for root, dirs, files in safe_walk(self.root):
+        include_path = self.config.include_path
+        directory_is_excluded = self.config.directory_is_excluded
+        profiler = get_profiler()
+        if profiler is not None:
+            include_path = profiler.wrap_phase("match", include_path)
+            directory_is_excluded = profiler.wrap_phase("match", directory_is_excluded)
+
+        for root, dirs, files in self.walk_project_files():
             relative_path = get_relative_path(root, self.root)
 
-            dirs[:] = sorted(d for d in dirs if not self.config.directory_is_excluded(d, relative_path))
+            dirs[:] = sorted(d for d in dirs if not directory_is_excluded(d, relative_path))
 
             files.sort()
             is_package = "__init__.py" in files
@@ -201,7 +301,7 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
                 if self.config.path_is_reserved(distribution_path):
                     continue
 
-                if self.config.include_path(relative_file_path, is_package=is_package):
+                if include_path(relative_file_path, is_package=is_package):
                     yield IncludedFile(
                         os.path.join(root, f), relative_file_path, self.config.get_distribution_path(relative_file_path)
                     )
@@ -239,6 +339,11 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
                 raise FileNotFoundError(msg)
 
     def recurse_explicit_files(self, inclusion_map: dict[str, str]) -> Iterable[IncludedFile]:
+        include_path = self.config.include_path
+        profiler = get_profiler()
+        if profiler is not None:
+            include_path = profiler.wrap_phase("match", include_path)
+
         for source, target_path in inclusion_map.items():
             external = not source.startswith(self.root)
             if os.path.isfile(source):
@@ -266,7 +371,7 @@ class BuilderInterface(ABC, Generic[BuilderConfigBound, PluginManagerBound]):
                         if self.config.path_is_reserved(distribution_path):
                             continue
 
-                        if self.config.include_path(relative_file_path, explicit=True, is_package=is_package):
+                        if include_path(relative_file_path, explicit=True, is_package=is_package):
                             yield IncludedFile(
                                 os.path.join(root, f), "" if external else relative_file_path, distribution_path
                             )
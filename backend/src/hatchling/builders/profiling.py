@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from hatchling.builders.constants import BuildEnvVars
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+    from contextlib import AbstractContextManager
+
+T = TypeVar("T")
+
+# The number of files listed in each of the rankings of the summary
+PROFILE_FILE_COUNT = 20
+
+_profiler: BuildProfiler | None = None
+
+
+def get_profiler() -> BuildProfiler | None:
+    """
+    Returns the profiler of this process when the `HATCH_BUILD_PROFILE` environment variable is set to the path of
+    the summary to write, accumulating every build of the process, or `None` otherwise.
+    """
+    global _profiler  # noqa: PLW0603
+
+    path = os.environ.get(BuildEnvVars.PROFILE)
+    if not path:
+        return None
+
+    path = os.path.abspath(path)
+    if _profiler is None or _profiler.path != path:
+        _profiler = BuildProfiler(path)
+
+    return _profiler
+
+
+def profile_span(profiler: BuildProfiler | None, name: str, phase: str, **args: Any) -> AbstractContextManager[None]:
+    return nullcontext() if profiler is None else profiler.span(name, phase, **args)
+
+
+def profile_phase(profiler: BuildProfiler | None, phase: str, count: int = 1) -> AbstractContextManager[None]:
+    return nullcontext() if profiler is None else profiler.phase(phase, count)
+
+
+def get_trace_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.trace{ext or '.json'}"
+
+
+class BuildProfiler:
+    """
+    Records the wall and CPU time of the phases of builds, and of every file added to an archive, to be written as
+    a JSON summary and a trace in the Chrome trace event format that may be loaded in `chrome://tracing` or
+    https://ui.perfetto.dev.
+
+    Spans are inclusive of everything that happens within them, whereas the time of phases that are measured
+    within iterations, file writers or other phases is only attributed to the innermost phase.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.trace_path = get_trace_path(path)
+        self.pid = os.getpid()
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+        # Phase -> [wall time, CPU time, count]
+        self.phases: dict[str, list[Any]] = {}
+        # (name, phase, thread, start, wall time, CPU time, arguments)
+        self.spans: list[tuple[str, str, int, float, float, float, dict[str, Any]]] = []
+        # (path, size, thread, start, wall time, CPU time)
+        self.files: list[tuple[str, int, int, float, float, float]] = []
+        # The time measured by phases so far, which enclosing phases subtract from their own
+        self.nested_wall_time = 0.0
+        self.nested_cpu_time = 0.0
+
+    def add_phase_time(self, phase: str, wall_time: float, cpu_time: float, count: int = 1) -> None:
+        totals = self.phases.setdefault(phase, [0.0, 0.0, 0])
+        totals[0] += wall_time
+        totals[1] += cpu_time
+        totals[2] += count
+
+    def add_exclusive_phase_time(
+        self, phase: str, wall_time: float, cpu_time: float, nested_wall_time: float, nested_cpu_time: float, count: int
+    ) -> None:
+        """
+        Attributes the time of a measurement to `phase`, except for the time of the phases measured within it
+        since the measurement started, given the totals of nested phases at that point.
+        """
+        self.add_phase_time(
+            phase,
+            wall_time - (self.nested_wall_time - nested_wall_time),
+            cpu_time - (self.nested_cpu_time - nested_cpu_time),
+            count,
+        )
+        self.nested_wall_time = nested_wall_time + wall_time
+        self.nested_cpu_time = nested_cpu_time + cpu_time
+
+    @contextmanager
+    def phase(self, phase: str, count: int = 1) -> Generator[None, None, None]:
+        """
+        Attributes the time spent within the context to `phase`, counting `count` operations.
+        """
+        nested_wall_time = self.nested_wall_time
+        nested_cpu_time = self.nested_cpu_time
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_exclusive_phase_time(
+                phase,
+                time.perf_counter() - start_wall,
+                time.process_time() - start_cpu,
+                nested_wall_time,
+                nested_cpu_time,
+                count,
+            )
+
+    def wrap_phase(self, phase: str, func: Callable[..., T]) -> Callable[..., T]:
+        """
+        Returns `func` attributing the time spent in each call to `phase`.
+        """
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with self.phase(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def span(self, name: str, phase: str, **args: Any) -> Generator[None, None, None]:
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall
+            cpu_time = time.process_time() - start_cpu
+            self.add_phase_time(phase, wall_time, cpu_time)
+            self.spans.append((name, phase, threading.get_ident(), start_wall, wall_time, cpu_time, args))
+
+    def iterate(self, phase: str, iterable: Iterable[T]) -> Generator[T, None, None]:
+        """
+        Yields the items of `iterable`, attributing only the time spent producing them to `phase`.
+        """
+        count = 0
+        iterator = iter(iterable)
+        try:
+            while True:
+                nested_wall_time = self.nested_wall_time
+                nested_cpu_time = self.nested_cpu_time
+                start_wall = time.perf_counter()
+                start_cpu = time.process_time()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    self.add_exclusive_phase_time(
+                        phase,
+                        time.perf_counter() - start_wall,
+                        time.process_time() - start_cpu,
+                        nested_wall_time,
+                        nested_cpu_time,
+                        0,
+                    )
+
+                count += 1
+                yield item
+        finally:
+            self.add_phase_time(phase, 0.0, 0.0, count)
+
+    def wrap_file_writer(self, func: Callable[..., T], get_file: Callable[..., tuple[str, int]]) -> Callable[..., T]:
+        """
+        Returns `func` recording the time spent in each call as the addition of the file that `get_file` describes,
+        given the same arguments, by its path and size. Time not attributed to nested phases, such as `hash` and
+        `compress`, is attributed to the `archive` phase.
+        """
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            nested_wall_time = self.nested_wall_time
+            nested_cpu_time = self.nested_cpu_time
+            start_wall = time.perf_counter()
+            start_cpu = time.process_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - start_wall
+                cpu_time = time.process_time() - start_cpu
+                self.add_exclusive_phase_time("archive", wall_time, cpu_time, nested_wall_time, nested_cpu_time, 1)
+
+                path, size = get_file(*args, **kwargs)
+                self.files.append((path, size, threading.get_ident(), start_wall, wall_time, cpu_time))
+
+        return wrapper
+
+    def get_summary(self) -> dict[str, Any]:
+        import heapq
+        from operator import itemgetter
+
+        from hatchling.__about__ import __version__
+
+        def render_file(entry: tuple[str, int, int, float, float, float]) -> dict[str, Any]:
+            return {"path": entry[0], "size": entry[1], "wall_time": entry[4], "cpu_time": entry[5]}
+
+        def render_span(entry: tuple[str, str, int, float, float, float, dict[str, Any]]) -> dict[str, Any]:
+            return {**entry[6], "wall_time": entry[4], "cpu_time": entry[5]}
+
+        return {
+            "hatchling": __version__,
+            "wall_time": time.perf_counter() - self.start_wall,
+            "cpu_time": time.process_time() - self.start_cpu,
+            "phases": {
+                phase: {"wall_time": wall_time, "cpu_time": cpu_time, "count": count}
+                for phase, (wall_time, cpu_time, count) in sorted(self.phases.items())
+            },
+            "builds": [render_span(span) for span in self.spans if span[1] == "build"],
+            "hooks": [render_span(span) for span in self.spans if span[1] == "hooks"],
+            "largest_files": [
+                render_file(entry) for entry in heapq.nlargest(PROFILE_FILE_COUNT, self.files, key=itemgetter(1))
+            ],
+            "slowest_files": [
+                render_file(entry) for entry in heapq.nlargest(PROFILE_FILE_COUNT, self.files, key=itemgetter(4))
+            ],
+            "trace": self.trace_path,
+        }
+
+    def get_trace(self) -> dict[str, Any]:
+        from operator import itemgetter
+
+        def get_event(
+            name: str, category: str, thread: int, start: float, wall_time: float, args: dict[str, Any]
+        ) -> dict[str, Any]:
+            # Timestamps and durations are in microseconds
+            return {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.start_wall) * 1_000_000,
+                "dur": wall_time * 1_000_000,
+                "pid": self.pid,
+                "tid": thread,
+                "args": args,
+            }
+
+        events = [
+            get_event(name, phase, thread, start, wall_time, {**args, "cpu_time": cpu_time})
+            for name, phase, thread, start, wall_time, cpu_time, args in self.spans
+        ]
+        events.extend(
+            get_event(path, "archive", thread, start, wall_time, {"size": size, "cpu_time": cpu_time})
+            for path, size, thread, start, wall_time, cpu_time in self.files
+        )
+        events.sort(key=itemgetter("ts"))
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self) -> None:
+        import json
+
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.get_summary(), f, indent=2)
+
+        with open(self.trace_path, "w", encoding="utf-8") as f:
+            json.dump(self.get_trace(), f)
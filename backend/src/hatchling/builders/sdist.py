@@ -6,12 +6,14 @@ import tarfile
 import tempfile
 from contextlib import closing
 from copy import copy
+from functools import cached_property
 from io import BytesIO
 from time import time as get_current_timestamp
 from typing import TYPE_CHECKING, Any
 
 from hatchling.builders.config import BuilderConfig
 from hatchling.builders.plugin.interface import BuilderInterface
+from hatchling.builders.profiling import get_profiler
 from hatchling.builders.utils import (
     get_reproducible_timestamp,
     normalize_archive_path,
@@ -24,12 +26,36 @@ from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
     from types import TracebackType
 
+    from hatchling.builders.compression import ParallelGzipFile
+    from hatchling.builders.plugin.interface import IncludedFile
+
+
+# Files up to this size are read ahead of being added when compressing in parallel
+PREFETCH_MAX_FILE_SIZE = 4194304
+
+
+def read_small_file(path: str) -> bytes | None:
+    if os.path.getsize(path) > PREFETCH_MAX_FILE_SIZE:
+        return None
+
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def get_prefetched_file(included_file: IncludedFile, future: Future[bytes | None]) -> tuple[IncludedFile, bytes | None]:
+    try:
+        return included_file, future.result()
+    except OSError:
+        # Let the file be read again to raise the error in the usual place
+        return included_file, None
+
 
 class SdistArchive:
-    def __init__(self, name: str, *, reproducible: bool) -> None:
+    def __init__(self, name: str, *, reproducible: bool, compression_workers: int = 1) -> None:
         """
         https://peps.python.org/pep-0517/#source-distributions
         """
@@ -39,10 +65,22 @@ class SdistArchive:
 
         raw_fd, self.path = tempfile.mkstemp(suffix=".tar.gz")
         self.fd = os.fdopen(raw_fd, "w+b")
-        self.gz = gzip.GzipFile(fileobj=self.fd, mode="wb", mtime=self.timestamp)
-        self.tf = tarfile.TarFile(fileobj=self.gz, mode="w", format=tarfile.PAX_FORMAT)
+        self.gz: gzip.GzipFile | ParallelGzipFile
+        if compression_workers > 1:
+            from hatchling.builders.compression import ParallelGzipFile
+
+            self.gz = ParallelGzipFile(self.fd, max_workers=compression_workers, mtime=self.timestamp)
+        else:
+            self.gz = gzip.GzipFile(fileobj=self.fd, mode="wb", mtime=self.timestamp)
+        self.tf = tarfile.TarFile(fileobj=self.gz, mode="w", format=tarfile.PAX_FORMAT)  # type: ignore[arg-type]
         self.gettarinfo = lambda *args, **kwargs: self.normalize_tar_metadata(self.tf.gettarinfo(*args, **kwargs))
 
+        profiler = get_profiler()
+        if profiler is not None:
+            self.addfile = profiler.wrap_file_writer(
+                self.tf.addfile, lambda tar_info, *_: (tar_info.name, tar_info.size)
+            )
+
     def create_file(self, contents: str | bytes, *relative_paths: str) -> None:
         if not isinstance(contents, bytes):
             contents = contents.encode("utf-8")
@@ -54,7 +92,7 @@ class SdistArchive:
             tar_info.mtime = int(get_current_timestamp())
 
         with closing(BytesIO(contents)) as buffer:
-            self.tf.addfile(tar_info, buffer)
+            self.addfile(tar_info, buffer)
 
     def normalize_tar_metadata(self, tar_info: tarfile.TarInfo | None) -> tarfile.TarInfo | None:
         if not self.reproducible or tar_info is None:
@@ -141,6 +179,19 @@ class SdistBuilderConfig(BuilderConfig):
 
         return self.__support_legacy
 
+    @cached_property
+    def compression_workers(self) -> int:
+        compression_workers = self.target_config.get("compression-workers", 1)
+        if not isinstance(compression_workers, int) or isinstance(compression_workers, bool):
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.compression-workers` must be an integer"
+            raise TypeError(message)
+
+        if compression_workers < 0:
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.compression-workers` must not be negative"
+            raise ValueError(message)
+
+        return compression_workers or os.cpu_count() or 1
+
 
 class SdistBuilder(BuilderInterface):
     """
@@ -167,8 +218,13 @@ class SdistBuilder(BuilderInterface):
     def build_standard(self, directory: str, **build_data: Any) -> str:
         found_packages = set()
 
-        with SdistArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive:
-            for included_file in self.recurse_included_files():
+        compression_workers = self.config.compression_workers
+        with SdistArchive(
+            self.artifact_project_id, reproducible=self.config.reproducible, compression_workers=compression_workers
+        ) as archive:
+            for included_file, contents in self.iter_file_contents(
+                self.recurse_included_files(), max_workers=compression_workers
+            ):
                 if self.config.support_legacy:
                     possible_package, file_name = os.path.split(included_file.relative_path)
                     if file_name == "__init__.py":
@@ -184,14 +240,18 @@ class SdistBuilder(BuilderInterface):
                     continue
 
                 if tar_info.isfile():
-                    with open(included_file.path, "rb") as f:
-                        archive.addfile(tar_info, f)
+                    if contents is not None and len(contents) == tar_info.size:
+                        with closing(BytesIO(contents)) as buffer:
+                            archive.addfile(tar_info, buffer)
+                    else:
+                        with open(included_file.path, "rb") as f:
+                            archive.addfile(tar_info, f)
                 else:  # no cov
                     # TODO: Investigate if this is necessary (for symlinks, etc.)
                     archive.addfile(tar_info)
 
             archive.create_file(
-                self.config.core_metadata_constructor(self.metadata, extra_dependencies=build_data["dependencies"]),
+                self.metadata.render_core_metadata(self.config.core_metadata_constructor, build_data["dependencies"]),
                 "PKG-INFO",
             )
 
@@ -207,6 +267,33 @@ class SdistBuilder(BuilderInterface):
         normalize_artifact_permissions(target)
         return target
 
+    @staticmethod
+    def iter_file_contents(
+        included_files: Iterable[IncludedFile], *, max_workers: int
+    ) -> Iterator[tuple[IncludedFile, bytes | None]]:
+        """
+        Yields every included file along with its contents if, when there is more than one worker, the file is small
+        enough to have been read ahead by a pool of threads while preceding files were being added.
+        """
+        if max_workers <= 1:
+            for included_file in included_files:
+                yield included_file, None
+
+            return
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque = deque()
+            for included_file in included_files:
+                pending.append((included_file, executor.submit(read_small_file, included_file.path)))
+                if len(pending) > 4 * max_workers:
+                    yield get_prefetched_file(*pending.popleft())
+
+            while pending:
+                yield get_prefetched_file(*pending.popleft())
+
     @property
     def artifact_project_id(self) -> str:
         return (
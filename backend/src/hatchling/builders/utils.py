@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import os
 import shutil
+import sys
 from base64 import urlsafe_b64encode
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Generator, Iterable
     from zipfile import ZipInfo
 
+# Reading directories is I/O bound, especially on network file systems where every call is a round trip
+WALK_MAX_WORKERS = 8
+
 
 def replace_file(src: str, dst: str) -> None:
     try:
@@ -19,17 +24,116 @@ def replace_file(src: str, dst: str) -> None:
         os.remove(src)
 
 
-def safe_walk(path: str) -> Iterable[tuple[str, list[str], list[str]]]:
-    seen = set()
-    for root, dirs, files in os.walk(path, followlinks=True):
-        stat = os.stat(root)
-        identifier = stat.st_dev, stat.st_ino
-        if identifier in seen:
-            del dirs[:]
-            continue
+@contextmanager
+def exclusive_lock(path: str) -> Generator[None, None, None]:
+    """
+    Holds an exclusive lock on the file at `path`, which is created if necessary, blocking until any other
+    process releases it.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                f.seek(0)
+                try:
+                    # Retries for 10 seconds before raising
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                except OSError:
+                    continue
+
+                break
+
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def scan_directory(path: str) -> tuple[list[str], list[str], dict[str, str]] | None:
+    """
+    Returns the sorted names of the directories and other files in `path`, along with the resolved paths of
+    directories that are symbolic links, or `None` if it cannot be read. Only the latter require a `stat` call
+    as the type of every other entry is provided by the directory listing itself.
+    """
+    dirs = []
+    files = []
+    links = {}
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    files.append(entry.name)
+                    continue
+
+                dirs.append(entry.name)
+                # Junctions on Windows are not reported as symbolic links
+                if entry.is_symlink() or (sys.version_info >= (3, 12) and entry.is_junction()):
+                    links[entry.name] = os.path.realpath(entry.path)
+    except OSError:
+        return None
 
-        seen.add(identifier)
-        yield root, dirs, files
+    dirs.sort()
+    files.sort()
+    return dirs, files, links
+
+
+def safe_walk(path: str, *, max_workers: int = WALK_MAX_WORKERS) -> Iterable[tuple[str, list[str], list[str]]]:
+    """
+    Same as `os.walk` with `followlinks=True`, including pruning by modifying the directory names in place,
+    except that names are sorted and every directory is visited at most once so that symbolic link loops
+    terminate. Subdirectories are read concurrently ahead of being visited.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        seen: set[str] = set()
+        # Directories that are not links resolve to their parent's resolved path joined with their name
+        stack = [(path, os.path.realpath(path), executor.submit(scan_directory, path))]
+        while stack:
+            root, resolved_root, future = stack.pop()
+            if resolved_root in seen:
+                continue
+
+            seen.add(resolved_root)
+            listing = future.result()
+            if listing is None:
+                continue
+
+            dirs, files, links = listing
+            yield root, dirs, files
+
+            # Only scan what remains after pruning
+            subdirectories = []
+            for name in dirs:
+                resolved_path = links.get(name) or os.path.join(resolved_root, name)
+                if resolved_path not in seen:
+                    subdirectory = os.path.join(root, name)
+                    subdirectories.append((
+                        subdirectory,
+                        resolved_path,
+                        executor.submit(scan_directory, subdirectory),
+                    ))
+
+            stack.extend(reversed(subdirectories))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def get_known_python_major_versions() -> map:
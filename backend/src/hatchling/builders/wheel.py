@@ -9,12 +9,14 @@ import tempfile
 import zipfile
 from functools import cached_property
 from io import StringIO
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, cast
 
 from hatchling.__about__ import __version__
+from hatchling.builders.compression import CompressionPolicy, set_zip_info_compression
 from hatchling.builders.config import BuilderConfig
 from hatchling.builders.constants import EDITABLES_REQUIREMENT
 from hatchling.builders.plugin.interface import BuilderInterface
+from hatchling.builders.profiling import get_profiler, profile_phase
 from hatchling.builders.utils import (
     format_file_hash,
     get_known_python_major_versions,
@@ -32,7 +34,10 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Sequence
     from types import TracebackType
 
+    import pathspec
+
     from hatchling.builders.plugin.interface import IncludedFile
+    from hatchling.builders.profiling import BuildProfiler
 
 
 TIME_TUPLE = tuple[int, int, int, int, int, int]
@@ -41,6 +46,12 @@ TIME_TUPLE = tuple[int, int, int, int, int, int]
 # line, so anything longer cannot be a functional shebang and is left untouched.
 MAX_SHEBANG_LENGTH = 256
 
+# https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT section 4.3.7
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+LOCAL_FILE_HEADER_SIZE = 30
+
+MAX_COMPRESSION_LEVEL = 9
+
 
 class FileSelectionOptions(NamedTuple):
     include: list[str]
@@ -72,7 +83,39 @@ class RecordFile:
 class _WheelZipFile(zipfile.ZipFile):
     def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         filename = name.filename if isinstance(name, zipfile.ZipInfo) else name
-        if mode == "w" and filename in self.NameToInfo:
+        if mode == "w":
+            self.__check_duplicate(filename)
+
+        return super().open(name, mode, pwd, force_zip64=force_zip64)
+
+    def write_compressed(self, zip_info: zipfile.ZipInfo, source: ReusableWheel, source_info: zipfile.ZipInfo) -> None:
+        """
+        Adds an entry whose compressed data is copied verbatim from an entry of another archive.
+        """
+        self.__check_duplicate(zip_info.filename)
+
+        zip_info.compress_type = source_info.compress_type
+        zip_info.CRC = source_info.CRC
+        zip_info.compress_size = source_info.compress_size
+        zip_info.file_size = source_info.file_size
+        zip_info.flag_bits = 0
+
+        with self._lock:  # type: ignore[attr-defined]
+            self._writecheck(zip_info)  # type: ignore[attr-defined]
+            self._didModify = True
+
+            # Same as writing through `open` so that the header is identical to that of a fresh build
+            zip64 = zip_info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+            zip_info.header_offset = self.fp.tell()  # type: ignore[union-attr]
+            self.fp.write(zip_info.FileHeader(zip64))  # type: ignore[union-attr]
+            source.copy_data(source_info, self.fp)  # type: ignore[arg-type]
+
+            self.filelist.append(zip_info)
+            self.NameToInfo[zip_info.filename] = zip_info
+            self.start_dir = self.fp.tell()  # type: ignore[union-attr]
+
+    def __check_duplicate(self, filename: str) -> None:
+        if filename in self.NameToInfo:
             message = (
                 f"A second file is being added to the wheel archive at the same path: `{filename}`.\n\n"
                 f"The most likely cause of this is an entry in the "
@@ -81,17 +124,150 @@ class _WheelZipFile(zipfile.ZipFile):
             )
             raise ValueError(message)
 
-        return super().open(name, mode, pwd, force_zip64=force_zip64)
+
+class ReusableWheel:
+    """
+    A previously built wheel whose compressed entries may be copied into a new wheel, for files whose size and
+    hash recorded in the `RECORD` file match those of the file being added.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.fd = open(path, "rb")  # noqa: SIM115
+        try:
+            self.zf = zipfile.ZipFile(self.fd)
+            # The version, and therefore the name of the metadata directory, may differ
+            record_path = next(
+                name for name in self.zf.namelist() if name.endswith(".dist-info/RECORD") and name.count("/") == 1
+            )
+            record_contents = self.zf.read(record_path).decode("utf-8")
+        except BaseException:
+            self.fd.close()
+            raise
+
+        self.records: dict[str, tuple[str, str]] = {
+            path: (file_hash, size) for path, file_hash, size in csv.reader(StringIO(record_contents))
+        }
+
+    @classmethod
+    def open(cls, path: str) -> ReusableWheel | None:
+        try:
+            return cls(path)
+        except (OSError, StopIteration, ValueError, zipfile.BadZipFile):
+            return None
+
+    def get_entry(
+        self, relative_path: str, file_path: str, file_size: int, compress_type: int
+    ) -> tuple[zipfile.ZipInfo, str] | None:
+        """
+        Returns the entry for `relative_path` along with its recorded hash if it was compressed with the same
+        method and the contents of `file_path` are the same.
+        """
+        record = self.records.get(relative_path)
+        if record is None or record[1] != str(file_size):
+            return None
+
+        try:
+            zip_info = self.zf.getinfo(relative_path)
+        except KeyError:
+            return None
+
+        if zip_info.file_size != file_size or zip_info.compress_type != compress_type or zip_info.flag_bits & 0x1:
+            return None
+
+        hash_obj = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(65536):
+                hash_obj.update(chunk)
+
+        file_hash = f"sha256={format_file_hash(hash_obj.digest())}"
+        if file_hash != record[0]:
+            return None
+
+        return zip_info, file_hash
+
+    def copy_data(self, zip_info: zipfile.ZipInfo, target: BinaryIO) -> None:
+        import struct
+
+        self.fd.seek(zip_info.header_offset)
+        header = self.fd.read(LOCAL_FILE_HEADER_SIZE)
+        if len(header) != LOCAL_FILE_HEADER_SIZE or not header.startswith(LOCAL_FILE_HEADER_SIGNATURE):
+            message = f"Invalid local file header for entry `{zip_info.filename}` in: {self.path}"
+            raise zipfile.BadZipFile(message)
+
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        copy_file_data(
+            self.fd,
+            zip_info.header_offset + LOCAL_FILE_HEADER_SIZE + name_length + extra_length,
+            zip_info.compress_size,
+            target,
+        )
+
+    def close(self) -> None:
+        self.zf.close()
+        self.fd.close()
+
+
+def copy_file_data(source: BinaryIO, offset: int, size: int, target: BinaryIO) -> None:
+    """
+    Copies `size` bytes starting at `offset` of `source` to the current position of `target`, within the kernel
+    if possible.
+    """
+    target.flush()
+    target_offset = target.tell()
+
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while copied < size:
+                count = os.copy_file_range(
+                    source.fileno(), target.fileno(), size - copied, offset + copied, target_offset + copied
+                )
+                if not count:
+                    break
+
+                copied += count
+        except OSError:
+            pass
+
+        if copied == size:
+            target.seek(target_offset + size)
+            return
+
+        target.seek(target_offset)
+
+    source.seek(offset)
+    remaining = size
+    while remaining:
+        chunk = source.read(min(remaining, 1048576))
+        if not chunk:
+            message = "Unexpected end of file while copying archive data"
+            raise zipfile.BadZipFile(message)
+
+        target.write(chunk)
+        remaining -= len(chunk)
 
 
 class WheelArchive:
-    def __init__(self, project_id: str, *, reproducible: bool) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        *,
+        reproducible: bool,
+        previous: str | None = None,
+        compression: CompressionPolicy | None = None,
+    ) -> None:
         """
         https://peps.python.org/pep-0427/#abstract
+
+        The compressed contents of unchanged files are copied from the `previous` wheel, if any.
         """
         self.metadata_directory = f"{project_id}.dist-info"
         self.shared_data_directory = f"{project_id}.data"
         self.time_tuple: TIME_TUPLE | None = None
+        self.compression = CompressionPolicy() if compression is None else compression
+        self.reused_files = 0
+        self.previous = None if previous is None else ReusableWheel.open(previous)
 
         self.reproducible = reproducible
         if self.reproducible:
@@ -103,6 +279,16 @@ class WheelArchive:
         self.fd = os.fdopen(raw_fd, "w+b")
         self.zf = _WheelZipFile(self.fd, "w", compression=zipfile.ZIP_DEFLATED)
 
+        self.profiler = get_profiler()
+        if self.profiler is not None:
+            self.add_file = self.profiler.wrap_file_writer(  # type: ignore[method-assign]
+                self.add_file,
+                lambda included_file: (included_file.distribution_path, os.path.getsize(included_file.path)),
+            )
+            self.write_file = self.profiler.wrap_file_writer(  # type: ignore[method-assign]
+                self.write_file, lambda relative_path, contents, **_: (relative_path, len(contents))
+            )
+
     @staticmethod
     def get_reproducible_time_tuple() -> TIME_TUPLE:
         from datetime import datetime, timezone
@@ -129,17 +315,32 @@ class WheelArchive:
         else:
             zip_info = zipfile.ZipInfo.from_file(included_file.path, relative_path)
 
-        zip_info.compress_type = zipfile.ZIP_DEFLATED
-
         hash_obj = hashlib.sha256()
-        with open(included_file.path, "rb") as in_file, self.zf.open(zip_info, "w") as out_file:
-            while True:
-                chunk = in_file.read(16384)
-                if not chunk:
-                    break
-
-                hash_obj.update(chunk)
-                out_file.write(chunk)
+        with open(included_file.path, "rb") as in_file:
+            chunk = in_file.read(16384)
+            compress_type, compress_level = self.compression.get_compression(relative_path, chunk)
+            set_zip_info_compression(zip_info, compress_type, compress_level)
+
+            if self.previous is not None:
+                with profile_phase(self.profiler, "hash"):
+                    entry = self.previous.get_entry(relative_path, included_file.path, file_stat.st_size, compress_type)
+
+                if entry is not None:
+                    previous_info, file_hash = entry
+                    with profile_phase(self.profiler, "copy"):
+                        self.zf.write_compressed(zip_info, self.previous, previous_info)
+
+                    self.reused_files += 1
+                    return relative_path, file_hash, str(file_stat.st_size)
+
+            if self.profiler is None:
+                with self.zf.open(zip_info, "w") as out_file:
+                    while chunk:
+                        hash_obj.update(chunk)
+                        out_file.write(chunk)
+                        chunk = in_file.read(16384)
+            else:
+                self.__write_entry_profiled(self.profiler, zip_info, in_file, chunk, hash_obj)
 
         hash_digest = format_file_hash(hash_obj.digest())
         return relative_path, f"sha256={hash_digest}", str(file_stat.st_size)
@@ -198,12 +399,38 @@ class WheelArchive:
         else:
             set_zip_info_mode(zip_info, mode)
 
-        hash_obj = hashlib.sha256(contents)
+        with profile_phase(self.profiler, "hash"):
+            hash_obj = hashlib.sha256(contents)
+
         hash_digest = format_file_hash(hash_obj.digest())
-        self.zf.writestr(zip_info, contents, compress_type=zipfile.ZIP_DEFLATED)
+        compress_type, compress_level = self.compression.get_compression(relative_path, contents[:16384])
+        with profile_phase(self.profiler, "compress"):
+            self.zf.writestr(zip_info, contents, compress_type=compress_type, compresslevel=compress_level)
 
         return relative_path, f"sha256={hash_digest}", str(len(contents))
 
+    def __write_entry_profiled(
+        self, profiler: BuildProfiler, zip_info: zipfile.ZipInfo, in_file: BinaryIO, chunk: bytes, hash_obj: Any
+    ) -> None:
+        # Every chunk is measured so the time spent reading the file is attributed to neither phase
+        with profiler.phase("compress"):
+            out_file = self.zf.open(zip_info, "w")
+
+        try:
+            while chunk:
+                with profiler.phase("hash", 0):
+                    hash_obj.update(chunk)
+
+                with profiler.phase("compress", 0):
+                    out_file.write(chunk)
+
+                chunk = in_file.read(16384)
+        finally:
+            with profiler.phase("compress", 0):
+                out_file.close()
+
+        profiler.add_phase_time("hash", 0.0, 0.0)
+
     def __enter__(self) -> WheelArchive:  # noqa: PYI034
         return self
 
@@ -212,6 +439,8 @@ class WheelArchive:
     ) -> None:
         self.zf.close()
         self.fd.close()
+        if self.previous is not None:
+            self.previous.close()
 
 
 class WheelBuilderConfig(BuilderConfig):
@@ -473,6 +702,95 @@ class WheelBuilderConfig(BuilderConfig):
 
         return bypass_selection
 
+    @cached_property
+    def compression_level(self) -> int | None:
+        compression_level = self.target_config.get("compression-level")
+        if compression_level is None:
+            return None
+
+        if not isinstance(compression_level, int) or isinstance(compression_level, bool):
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.compression-level` must be an integer"
+            raise TypeError(message)
+
+        if not 0 <= compression_level <= MAX_COMPRESSION_LEVEL:
+            message = (
+                f"Field `tool.hatch.build.targets.{self.plugin_name}.compression-level` must be between 0 and "
+                f"{MAX_COMPRESSION_LEVEL}"
+            )
+            raise ValueError(message)
+
+        return compression_level
+
+    @cached_property
+    def compression_rules(self) -> list[tuple[pathspec.GitIgnoreSpec, int, int | None]]:
+        import pathspec
+
+        from hatchling.builders.compression import COMPRESSION_METHODS
+
+        compression_rules = self.target_config.get("compression-rules", {})
+        if not isinstance(compression_rules, dict):
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.compression-rules` must be a mapping"
+            raise TypeError(message)
+
+        rules = []
+        for i, (pattern, compression) in enumerate(compression_rules.items(), 1):
+            if not pattern:
+                message = (
+                    f"Pattern #{i} in field `tool.hatch.build.targets.{self.plugin_name}.compression-rules` "
+                    f"cannot be an empty string"
+                )
+                raise ValueError(message)
+
+            if compression in COMPRESSION_METHODS:
+                method, level = COMPRESSION_METHODS[compression], None
+            elif (
+                isinstance(compression, int)
+                and not isinstance(compression, bool)
+                and 0 <= compression <= MAX_COMPRESSION_LEVEL
+            ):
+                method, level = zipfile.ZIP_DEFLATED, compression
+            else:
+                message = (
+                    f"Compression for pattern `{pattern}` in field "
+                    f"`tool.hatch.build.targets.{self.plugin_name}.compression-rules` must be one of "
+                    f"{', '.join(f'`{method}`' for method in COMPRESSION_METHODS)} or a level between 0 and "
+                    f"{MAX_COMPRESSION_LEVEL}"
+                )
+                raise ValueError(message)
+
+            rules.append((pathspec.GitIgnoreSpec.from_lines([pattern]), method, level))
+
+        return rules
+
+    @cached_property
+    def detect_incompressible(self) -> bool:
+        detect_incompressible = self.target_config.get("detect-incompressible", True)
+        if not isinstance(detect_incompressible, bool):
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.detect-incompressible` must be a boolean"
+            raise TypeError(message)
+
+        return detect_incompressible
+
+    def get_compression_policy(self, *, editable: bool = False) -> CompressionPolicy:
+        """
+        Editable wheels are installed right away, so their files are stored unless a rule says otherwise.
+        """
+        return CompressionPolicy(
+            self.compression_rules,
+            method=zipfile.ZIP_STORED if editable else zipfile.ZIP_DEFLATED,
+            level=self.compression_level,
+            detect_incompressible=self.detect_incompressible,
+        )
+
+    @cached_property
+    def incremental(self) -> bool:
+        incremental = self.target_config.get("incremental", False)
+        if not isinstance(incremental, bool):
+            message = f"Field `tool.hatch.build.targets.{self.plugin_name}.incremental` must be a boolean"
+            raise TypeError(message)
+
+        return incremental
+
     if sys.platform in {"darwin", "win32"}:
 
         @staticmethod
@@ -521,8 +839,15 @@ class WheelBuilder(BuilderInterface):
             else:
                 build_data["tag"] = self.get_default_tag()
 
+        previous = self.get_previous_artifact(directory, build_data["tag"]) if self.config.incremental else None
+
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                previous=previous,
+                compression=self.config.get_compression_policy(),
+            ) as archive,
             RecordFile() as records,
         ):
             for included_file in self.recurse_included_files():
@@ -540,6 +865,31 @@ class WheelBuilder(BuilderInterface):
         normalize_artifact_permissions(target)
         return target
 
+    def get_previous_artifact(self, directory: str, tag: str) -> str | None:
+        """
+        Returns the most recently built wheel in `directory` with the same name and tag, of any version.
+        """
+        name = self.artifact_project_id.rsplit("-", 1)[0]
+        suffix = f"-{tag}.whl"
+
+        candidates = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith(f"{name}-") and entry.name.endswith(suffix)):
+                        continue
+
+                    # Wheels with a build tag or of another project whose name starts with the same component
+                    if "-" in entry.name[len(name) + 1 : -len(suffix)]:
+                        continue
+
+                    if entry.is_file():
+                        candidates.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return None
+
+        return max(candidates)[1] if candidates else None
+
     def build_editable(self, directory: str, **build_data: Any) -> str:
         if self.config.dev_mode_dirs:
             return self.build_editable_explicit(directory, **build_data)
@@ -552,7 +902,11 @@ class WheelBuilder(BuilderInterface):
         build_data["tag"] = self.get_default_tag()
 
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                compression=self.config.get_compression_policy(editable=True),
+            ) as archive,
             RecordFile() as records,
         ):
             exposed_packages = {}
@@ -634,7 +988,11 @@ class WheelBuilder(BuilderInterface):
         build_data["tag"] = self.get_default_tag()
 
         with (
-            WheelArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive,
+            WheelArchive(
+                self.artifact_project_id,
+                reproducible=self.config.reproducible,
+                compression=self.config.get_compression_policy(editable=True),
+            ) as archive,
             RecordFile() as records,
         ):
             directories = sorted(
@@ -785,7 +1143,7 @@ Root-Is-Purelib: {"true" if build_data["pure_python"] else "false"}
         self, archive: WheelArchive, records: RecordFile, extra_dependencies: Sequence[str] = ()
     ) -> None:
         record = archive.write_metadata(
-            "METADATA", self.config.core_metadata_constructor(self.metadata, extra_dependencies=extra_dependencies)
+            "METADATA", self.metadata.render_core_metadata(self.config.core_metadata_constructor, extra_dependencies)
         )
         records.write(record)
 
@@ -827,29 +1185,14 @@ Root-Is-Purelib: {"true" if build_data["pure_python"] else "false"}
         return metadata_file.lstrip()
 
     def get_default_tag(self) -> str:
-        known_major_versions = list(get_known_python_major_versions())
-        max_version_part = 100
-        supported_python_versions = []
-        for major_version in known_major_versions:
-            for minor_version in range(max_version_part):
-                # Try an artificially high patch version to account for common cases like `>=3.11.4` or `>=3.10,<3.11`
-                if self.metadata.core.python_constraint.contains(f"{major_version}.{minor_version}.{max_version_part}"):
-                    supported_python_versions.append(f"py{major_version}")
-                    break
-
-        # Slow path, try all permutations to account for narrow support ranges like `<=3.11.4`
-        if not supported_python_versions:
-            for major_version in known_major_versions:
-                for minor_version in range(max_version_part):
-                    for patch_version in range(max_version_part):
-                        if self.metadata.core.python_constraint.contains(
-                            f"{major_version}.{minor_version}.{patch_version}"
-                        ):
-                            supported_python_versions.append(f"py{major_version}")
-                            break
-                    else:
-                        continue
-                    break
+        from hatchling.utils.specifiers import VersionRanges
+
+        python_ranges = VersionRanges.from_specifier_set(self.metadata.core.python_constraint)
+        supported_python_versions = [
+            f"py{major_version}"
+            for major_version in get_known_python_major_versions()
+            if python_ranges.supports(major_version)
+        ]
 
         return f"{'.'.join(supported_python_versions)}-none-any"
 
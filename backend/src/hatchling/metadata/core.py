@@ -18,6 +18,8 @@ from hatchling.utils.constants import DEFAULT_CONFIG_FILE
 from hatchling.utils.fs import locate_file
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from packaging.requirements import Requirement
     from packaging.specifiers import SpecifierSet
 
@@ -59,6 +61,9 @@ class ProjectMetadata(Generic[PluginManagerBound]):
         self._version: str | None = None
         self._project_file: str | None = None
 
+        # (constructor, extra dependencies) -> rendered core metadata file
+        self._core_metadata_snapshots: dict[tuple[Callable[..., str], tuple[str, ...]], str] = {}
+
         # App already loaded config
         if config is not None and root is not None:
             self._project_file = os.path.join(root, "pyproject.toml")
@@ -266,6 +271,54 @@ class ProjectMetadata(Generic[PluginManagerBound]):
         _ = self.version
         self.core.validate_fields()
 
+    def render_core_metadata(self, constructor: Callable[..., str], extra_dependencies: Iterable[str] = ()) -> str:
+        """
+        Returns the core metadata file rendered by `constructor`, which happens only once per set of extra
+        dependencies so that every builder sharing this instance reuses it.
+        """
+        key = (constructor, tuple(extra_dependencies))
+        if key not in self._core_metadata_snapshots:
+            self._core_metadata_snapshots[key] = constructor(self, extra_dependencies=key[1])
+
+        return self._core_metadata_snapshots[key]
+
+    def reuse_core_metadata(
+        self, constructor: Callable[..., str], path: str, extra_dependencies: Iterable[str] = ()
+    ) -> bool:
+        """
+        Uses the core metadata file at `path`, such as one written by `prepare_metadata_for_build_wheel`, in place
+        of rendering it with `constructor` if it has the same metadata version and describes the same project
+        version. Returns whether it was used.
+        """
+        from hatchling.metadata.spec import get_core_metadata_constructors
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                contents = f.read()
+        except OSError:
+            return False
+
+        headers: dict[str, str] = {}
+        for line in contents.splitlines():
+            # The body, if any, starts after the first empty line
+            if not line:
+                break
+
+            name, separator, value = line.partition(": ")
+            if separator:
+                headers.setdefault(name, value)
+
+        metadata_versions = {c: version for version, c in get_core_metadata_constructors().items()}
+        if (
+            headers.get("Metadata-Version") != metadata_versions.get(constructor)
+            or normalize_project_name(headers.get("Name", "")) != self.name
+            or headers.get("Version") != self.version
+        ):
+            return False
+
+        self._core_metadata_snapshots[constructor, tuple(extra_dependencies)] = contents
+        return True
+
 
 class BuildMetadata:
     """
@@ -1011,8 +1064,10 @@ class CoreMetadata:
                     key=lambda value: ([(a, int(b) if b else None) for a, b in split_re.findall(value)]),
                 )
 
+            classifier_positions = {classifier: i for i, classifier in enumerate(sorted_classifiers)}
             self._classifiers = sorted(
-                unique_classifiers, key=lambda c: -1 if self.__classifier_is_private(c) else sorted_classifiers.index(c)
+                unique_classifiers,
+                key=lambda c: -1 if self.__classifier_is_private(c) else classifier_positions[c],
             )
 
         return self._classifiers
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from math import inf
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from packaging.specifiers import Specifier, SpecifierSet
+    from packaging.version import Version
+
+# A position between versions in the order of final releases: just before (0) or just after (1) a version
+Bound = tuple[tuple[float, tuple[int, ...]], int]
+Interval = tuple[Bound, Bound]
+
+LOWEST: Bound = ((0, ()), 0)
+HIGHEST: Bound = ((inf, ()), 0)
+
+
+def get_release_key(epoch: int, release: tuple[int, ...]) -> tuple[int, tuple[int, ...]]:
+    # Trailing zeros are insignificant, e.g. `3.11` and `3.11.0` are the same version
+    end = len(release)
+    while end and not release[end - 1]:
+        end -= 1
+
+    return epoch, release[:end]
+
+
+def get_bounds(version: Version) -> tuple[Bound, Bound]:
+    """
+    Returns the positions just before and just after `version` with respect to final releases.
+    """
+    key = get_release_key(version.epoch, version.release)
+    if version.post is not None:
+        # Post-releases come after the release and before any later final release
+        return (key, 1), (key, 1)
+
+    if version.pre is not None or version.dev is not None:
+        # Pre-releases and development releases come before the release and after any earlier final release
+        return (key, 0), (key, 0)
+
+    return (key, 0), (key, 1)
+
+
+def get_prefix_interval(version: Version) -> Interval | None:
+    """
+    Returns the interval of final releases matching the `version.*` prefix, if any.
+    """
+    if version.pre is not None or version.post is not None or version.dev is not None:
+        return None
+
+    release = version.release
+    upper_release = (*release[:-1], release[-1] + 1)
+    return (
+        (get_release_key(version.epoch, release), 0),
+        (get_release_key(version.epoch, upper_release), 0),
+    )
+
+
+def parse_prefix(prefix: str) -> Interval | None:
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        version = Version(prefix)
+    except InvalidVersion:
+        return None
+
+    return get_prefix_interval(version)
+
+
+def get_complement(interval: Interval | None) -> list[Interval]:
+    if interval is None:
+        return [(LOWEST, HIGHEST)]
+
+    lower, upper = interval
+    return [candidate for candidate in ((LOWEST, lower), (upper, HIGHEST)) if candidate[0] < candidate[1]]
+
+
+def get_specifier_intervals(specifier: Specifier) -> list[Interval]:
+    from packaging.version import InvalidVersion, Version
+
+    operator = specifier.operator
+    version_str = specifier.version
+    if operator == "===":
+        try:
+            version = Version(version_str)
+        except InvalidVersion:
+            return []
+
+        operator = "=="
+
+    if version_str.endswith(".*"):
+        prefix_interval = get_prefix_interval(Version(version_str[:-2]))
+        if operator == "==":
+            return [] if prefix_interval is None else [prefix_interval]
+
+        return get_complement(prefix_interval)
+
+    version = Version(version_str)
+    lower, upper = get_bounds(version)
+    if operator == ">=":
+        return [(lower, HIGHEST)]
+
+    if operator == ">":
+        return [(upper, HIGHEST)]
+
+    if operator == "<=":
+        return [(LOWEST, upper)]
+
+    if operator == "<":
+        return [(LOWEST, lower)]
+
+    # Final releases never have a local version label
+    exact_interval = None if version.local or lower == upper else (lower, upper)
+    if operator == "==":
+        return [] if exact_interval is None else [exact_interval]
+
+    if operator == "!=":
+        return get_complement(exact_interval)
+
+    # Compatible release, e.g. `~=3.11.2` is equivalent to `>=3.11.2, ==3.11.*`
+    prefix_interval = get_prefix_interval(Version(f"{version.epoch}!{'.'.join(map(str, version.release[:-1]))}"))
+    return intersect_intervals([(lower, HIGHEST)], [] if prefix_interval is None else [prefix_interval])
+
+
+def intersect_intervals(first: list[Interval], second: list[Interval]) -> list[Interval]:
+    intervals = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        lower = max(first[i][0], second[j][0])
+        upper = min(first[i][1], second[j][1])
+        if lower < upper:
+            intervals.append((lower, upper))
+
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+
+    return intervals
+
+
+class VersionRanges:
+    """
+    The final releases that are allowed by a specifier set, normalized into sorted disjoint intervals so that
+    questions about entire release series, like which major or minor versions of Python are supported, are
+    answered without probing individual versions.
+    """
+
+    def __init__(self, intervals: list[Interval]) -> None:
+        self.intervals = intervals
+
+    @classmethod
+    def from_specifier_set(cls, specifier_set: SpecifierSet | str) -> VersionRanges:
+        from packaging.specifiers import SpecifierSet
+
+        if isinstance(specifier_set, str):
+            specifier_set = SpecifierSet(specifier_set)
+
+        intervals = [(LOWEST, HIGHEST)]
+        for specifier in specifier_set:
+            intervals = intersect_intervals(intervals, get_specifier_intervals(specifier))
+
+        return cls(intervals)
+
+    def supports(self, prefix: str) -> bool:
+        """
+        Whether any final release of the `prefix` series, e.g. `3` or `3.11`, is allowed.
+        """
+        prefix_interval = parse_prefix(prefix)
+        return prefix_interval is not None and bool(intersect_intervals(self.intervals, [prefix_interval]))
+
+    def supports_latest(self, prefix: str) -> bool:
+        """
+        Whether the latest final releases of the `prefix` series are allowed, which is the case for distributions
+        that provide the latest patch release of a minor version of Python.
+        """
+        prefix_interval = parse_prefix(prefix)
+        if prefix_interval is None:
+            return False
+
+        upper = prefix_interval[1]
+        return any(lower < upper <= interval_upper for lower, interval_upper in self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING, Any
 
 from hatchling.version.source.plugin.interface import VersionSourceInterface
 
+if TYPE_CHECKING:
+    import ast
+
+# Keyed by the file path, its stat signature, the expression and the search paths
+_version_cache: dict[tuple[Any, ...], Any] = {}
+
 
 class CodeSource(VersionSourceInterface):
     PLUGIN_NAME = "code"
 
     def get_version_data(self) -> dict:
-        import sys
-        from importlib.util import module_from_spec, spec_from_file_location
-
         relative_path = self.config.get("path")
         if not relative_path:
             message = "option `path` must be specified"
@@ -44,21 +48,122 @@ class CodeSource(VersionSourceInterface):
 
             absolute_search_paths.append(os.path.normpath(os.path.join(self.root, search_path)))
 
-        spec = spec_from_file_location(os.path.splitext(path)[0], path)
-        module = module_from_spec(spec)  # type: ignore[arg-type]
+        stat = os.stat(path)
+        cache_key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns, expression, tuple(absolute_search_paths))
+        if cache_key in _version_cache:
+            return {"version": _version_cache[cache_key]}
 
-        old_search_paths = list(sys.path)
-        try:
-            sys.path[:] = [*absolute_search_paths, *old_search_paths]
-            spec.loader.exec_module(module)  # type: ignore[union-attr]
-        finally:
-            sys.path[:] = old_search_paths
-
-        # Execute the expression to determine the version
-        version = eval(expression, vars(module))  # noqa: S307
+        found, version = get_static_version(path, expression)
+        if not found:
+            version = load_version(path, expression, absolute_search_paths)
 
+        _version_cache[cache_key] = version
         return {"version": version}
 
     def set_version(self, version: str, version_data: dict) -> None:
         message = "Cannot rewrite loaded code"
         raise NotImplementedError(message)
+
+
+def load_version(path: str, expression: str, search_paths: list[str]) -> Any:
+    import sys
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    spec = spec_from_file_location(os.path.splitext(path)[0], path)
+    module = module_from_spec(spec)  # type: ignore[arg-type]
+
+    old_search_paths = list(sys.path)
+    try:
+        sys.path[:] = [*search_paths, *old_search_paths]
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    finally:
+        sys.path[:] = old_search_paths
+
+    # Execute the expression to determine the version
+    return eval(expression, vars(module))  # noqa: S307
+
+
+def get_static_version(path: str, expression: str) -> tuple[bool, Any]:
+    """
+    Resolve the expression without executing any code if it refers to a variable that is only ever
+    assigned a literal at the top level of a Python source file, e.g. `__version__ = "1.2.3"`.
+    The first element of the returned tuple indicates whether the version could be resolved.
+    """
+    import ast
+
+    if not path.endswith(".py") or not expression.isidentifier():
+        return False, None
+
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, ValueError):
+        return False, None
+
+    found = False
+    value = None
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom) and any(alias.name == "*" for alias in statement.names):
+            return False, None
+
+        if expression not in _get_bound_names(statement):
+            continue
+
+        literal_found, literal_value = _get_literal_assignment(statement, expression)
+        if not literal_found:
+            return False, None
+
+        found = True
+        value = literal_value
+
+    return found, value
+
+
+def _get_literal_assignment(statement: ast.stmt, name: str) -> tuple[bool, Any]:
+    import ast
+
+    if isinstance(statement, ast.AnnAssign):
+        targets: list[ast.expr] = [statement.target]
+        value_node = statement.value
+    elif isinstance(statement, ast.Assign):
+        targets = statement.targets
+        value_node = statement.value
+    else:
+        return False, None
+
+    if value_node is None:
+        return False, None
+
+    try:
+        value = ast.literal_eval(value_node)
+    except (TypeError, ValueError):
+        return False, None
+
+    for target in targets:
+        if isinstance(target, ast.Name):
+            if target.id == name:
+                return True, value
+        elif isinstance(target, ast.Tuple) and all(isinstance(element, ast.Name) for element in target.elts):
+            # Unpacking such as `__version__, __author__ = "1.2.3", "..."`
+            names = [element.id for element in target.elts]  # type: ignore[attr-defined]
+            if name in names and isinstance(value, tuple) and len(value) == len(names):
+                return True, value[names.index(name)]
+
+    return False, None
+
+
+def _get_bound_names(statement: ast.stmt) -> set[str]:
+    import ast
+
+    names = set()
+    for node in ast.walk(statement):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node is statement:
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            names.update(node.names)
+
+    return names
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from itertools import count
+
+from core import benchmark
+from generators import generate_file_tree, generate_project
+
+
+@benchmark("recurse_included_files", params=(10_000, 100_000), unit="files", tags=("build",))
+def recurse_included_files(temp_dir, files):
+    from hatchling.builders.wheel import WheelBuilder
+
+    root = generate_file_tree(temp_dir / "project", files)
+    builder = WheelBuilder(str(root))
+
+    def run():
+        included = sum(1 for _ in builder.recurse_included_files())
+        if included < files:
+            message = f"expected at least {files} files, found {included}"
+            raise RuntimeError(message)
+
+    return run
+
+
+def _build(temp_dir, modules, builder_class):
+    root = generate_project(temp_dir / "project", modules)
+    builder = builder_class(str(root))
+    counter = count()
+
+    def run():
+        directory = temp_dir / "dist" / str(next(counter))
+        for _ in builder.build(directory=str(directory)):
+            pass
+
+    return run
+
+
+@benchmark("build.wheel", params=(1000, 10_000), unit="files", tags=("build",))
+def build_wheel(temp_dir, modules):
+    from hatchling.builders.wheel import WheelBuilder
+
+    return _build(temp_dir, modules, WheelBuilder)
+
+
+@benchmark("build.sdist", params=(1000, 10_000), unit="files", tags=("build",))
+def build_sdist(temp_dir, modules):
+    from hatchling.builders.sdist import SdistBuilder
+
+    return _build(temp_dir, modules, SdistBuilder)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from itertools import count
+
+from core import benchmark
+from generators import write_pyproject
+
+HATCH_CONFIG = """\
+mode = "local"
+shell = "none"
+
+[dirs.env]
+virtual = ""
+"""
+
+
+def _isolated_env_vars(temp_dir, data_dir):
+    env_vars = dict(os.environ)
+    for env_var in list(env_vars):
+        if env_var.startswith("HATCH_") or env_var == "VIRTUAL_ENV":
+            env_vars.pop(env_var)
+
+    config_file = temp_dir / "config.toml"
+    if not config_file.is_file():
+        config_file.write_text(HATCH_CONFIG, encoding="utf-8")
+
+    env_vars.update({
+        "HATCH_CONFIG": str(config_file),
+        "HATCH_DATA_DIR": str(data_dir),
+        "HATCH_CACHE_DIR": str(temp_dir / "cache"),
+        "HATCH_PYTHON": "self",
+        "NO_COLOR": "1",
+    })
+    return env_vars
+
+
+def _hatch(*args, cwd, env):
+    subprocess.run([sys.executable, "-m", "hatch", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+
+def _write_run_project(temp_dir):
+    project = temp_dir / "project"
+    # Skipping installation of the project keeps environment creation offline
+    write_pyproject(project, extra='\n[tool.hatch.envs.default]\nskip-install = true\ninstaller = "pip"\n')
+    return project
+
+
+@benchmark("cli.version", tags=("cli",))
+def cli_version(temp_dir, _):
+    env = _isolated_env_vars(temp_dir, temp_dir / "data")
+    return lambda: _hatch("--version", cwd=temp_dir, env=env)
+
+
+@benchmark("cli.run.cold", warmup=False, tags=("cli", "env"))
+def cli_run_cold(temp_dir, _):
+    project = _write_run_project(temp_dir)
+    counter = count()
+
+    def run():
+        # Every round uses a new data directory so that the environment is always created
+        env = _isolated_env_vars(temp_dir, temp_dir / f"data-{next(counter)}")
+        _hatch("run", "python", "-c", "pass", cwd=project, env=env)
+
+    return run
+
+
+@benchmark("cli.run.warm", tags=("cli", "env"))
+def cli_run_warm(temp_dir, _):
+    project = _write_run_project(temp_dir)
+    env = _isolated_env_vars(temp_dir, temp_dir / "data")
+    _hatch("env", "create", cwd=project, env=env)
+    return lambda: _hatch("run", "python", "-c", "pass", cwd=project, env=env)
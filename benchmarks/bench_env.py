@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from core import benchmark
+from generators import generate_matrix_config, generate_requirements, generate_site_packages
+
+
+@benchmark("config.envs", params=(100, 1000), unit="environments", tags=("env",))
+def config_envs(temp_dir, environments):
+    from hatch.plugin.manager import PluginManager
+    from hatch.project.config import ProjectConfig
+
+    config = generate_matrix_config(environments)
+    plugin_manager = PluginManager()
+
+    def run():
+        # The expansion is cached on the instance
+        return ProjectConfig(temp_dir, config, plugin_manager).envs
+
+    return run
+
+
+@benchmark("dependencies_in_sync", params=(100, 1000), unit="distributions", tags=("env", "dep"))
+def dependencies_in_sync(temp_dir, distributions):
+    from hatch.dep.core import Dependency
+    from hatch.dep.sync import InstalledDistributions
+
+    site_packages = generate_site_packages(temp_dir / "site-packages", distributions)
+    dependencies = [Dependency(requirement) for requirement in generate_requirements(distributions)]
+    sys_path = [str(site_packages)]
+    environment = {"python_version": "3.12", "extra": ""}
+
+    def run():
+        distributions = InstalledDistributions(sys_path=sys_path, environment=environment)
+        if not distributions.dependencies_in_sync(dependencies):
+            message = "synthetic dependencies are not in sync"
+            raise RuntimeError(message)
+
+    return run
+
+
+@benchmark("hash_dependencies", params=(100, 1000, 10000), unit="dependencies", tags=("dep",))
+def hash_dependencies(_, dependencies):
+    from hatch.dep.core import Dependency
+    from hatch.utils.dep import hash_dependencies
+
+    requirements = [Dependency(requirement) for requirement in generate_requirements(dependencies)]
+    return lambda: hash_dependencies(requirements)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+BENCHMARKS: list[Benchmark] = []
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # Receives a temporary directory and the parameter, and returns the function to time
+    factory: Callable[[Path, Any], Callable[[], Any]]
+    params: tuple[Any, ...] = (None,)
+    # A description of the parameter, used as the unit of throughput when set
+    unit: str = ""
+    warmup: bool = True
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+    def case_name(self, param: Any) -> str:
+        return self.name if param is None else f"{self.name}[{param}]"
+
+
+def benchmark(
+    name: str, *, params: tuple[Any, ...] = (None,), unit: str = "", warmup: bool = True, tags: tuple[str, ...] = ()
+) -> Callable:
+    """
+    Register a benchmark. The decorated function does all of the setup that should not be timed and
+    returns a function without arguments that is timed once per round.
+    """
+
+    def decorator(factory: Callable) -> Callable:
+        BENCHMARKS.append(
+            Benchmark(name=name, factory=factory, params=params, unit=unit, warmup=warmup, tags=frozenset(tags))
+        )
+        return factory
+
+    return decorator
@@ -0,0 +1,148 @@
+"""
+Generators of synthetic projects and environments. Everything is written to disk without network access
+so that the suite can run offline.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PROJECT_NAME = "bench-project"
+PACKAGE_NAME = "bench_project"
+
+
+def write_pyproject(root: Path, *, name: str = PROJECT_NAME, extra: str = "") -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "pyproject.toml").write_text(
+        f"""\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "{name}"
+version = "0.0.1"
+{extra}""",
+        encoding="utf-8",
+    )
+
+
+def generate_file_tree(root: Path, files: int, *, files_per_directory: int = 50, file_size: int = 0) -> Path:
+    """
+    Generate a package containing the requested number of modules, spread over nested subpackages
+    with at most `files_per_directory` modules each. Every tenth directory also contains a cache
+    directory that should be excluded, like real projects.
+    """
+    write_pyproject(root)
+    package_root = root / "src" / PACKAGE_NAME
+    package_root.mkdir(parents=True, exist_ok=True)
+    (package_root / "__init__.py").touch()
+    content = "x = 1\n" * max(file_size // 6, 0)
+
+    directory = package_root
+    for index in range(files):
+        if index % files_per_directory == 0:
+            directory_index = index // files_per_directory
+            # Limit the depth to mimic the shape of large packages
+            directory = package_root.joinpath(*(f"sub{part}" for part in _split_index(directory_index)))
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / "__init__.py").touch()
+            if directory_index % 10 == 0:
+                cache_directory = directory / "__pycache__"
+                cache_directory.mkdir(exist_ok=True)
+                (cache_directory / "module.cpython-312.pyc").touch()
+
+        (directory / f"module{index}.py").write_text(content, encoding="utf-8")
+
+    return root
+
+
+def generate_project(root: Path, modules: int, *, module_size: int = 4096) -> Path:
+    generate_file_tree(root, modules, file_size=module_size)
+    (root / "README.md").write_text("# Benchmark project\n", encoding="utf-8")
+    return root
+
+
+def generate_site_packages(site_packages: Path, distributions: int, *, requirements_per_distribution: int = 3) -> Path:
+    """
+    Generate `.dist-info` directories for the requested number of distributions. Each distribution
+    requires a few of the ones after it and provides an extra.
+    """
+    site_packages.mkdir(parents=True, exist_ok=True)
+    for index in range(distributions):
+        name = distribution_name(index)
+        dist_info = site_packages / f"{name}-1.{index}.0.dist-info"
+        dist_info.mkdir()
+
+        lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: 1.{index}.0", "Provides-Extra: extra"]
+        lines.extend(
+            f"Requires-Dist: {distribution_name(dependency)}>=1"
+            for dependency in range(index + 1, min(index + 1 + requirements_per_distribution, distributions))
+        )
+        lines.append(f'Requires-Dist: {distribution_name((index + 1) % distributions)}; extra == "extra"')
+        (dist_info / "METADATA").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        (dist_info / "RECORD").touch()
+        (dist_info / "INSTALLER").write_text("pip\n", encoding="utf-8")
+
+    return site_packages
+
+
+def generate_requirements(count: int) -> list[str]:
+    """
+    Generate requirement strings with a mix of specifiers, extras and markers.
+    """
+    requirements = []
+    for index in range(count):
+        name = distribution_name(index)
+        match index % 4:
+            case 0:
+                requirements.append(name)
+            case 1:
+                requirements.append(f"{name}>=1.{index}")
+            case 2:
+                requirements.append(f"{name}[extra]>=1,<{index + 2}")
+            case _:
+                requirements.append(f"{name}>=1; python_version >= '3.8'")
+
+    return requirements
+
+
+def generate_matrix_config(environments: int) -> dict:
+    """
+    Generate a `tool.hatch` table with a single matrix that expands to at least the requested number
+    of environments.
+    """
+    pythons = ["3.9", "3.10", "3.11", "3.12", "3.13"]
+    features = [f"feature{index}" for index in range(max(environments // (len(pythons) * 4), 1))]
+    return {
+        "envs": {
+            "default": {"dependencies": generate_requirements(10), "scripts": {"test": "pytest {args}"}},
+            "matrix": {
+                "matrix": [{"python": pythons, "feature": features, "mode": ["a", "b", "c", "d"]}],
+                "overrides": {
+                    "matrix": {
+                        "feature": {"dependencies": [{"value": "coverage", "if": features[:1]}]},
+                        "mode": {"env-vars": [{"key": "MODE", "value": "1", "if": ["a"]}]},
+                    }
+                },
+            },
+        }
+    }
+
+
+def distribution_name(index: int) -> str:
+    return f"dist-{index}"
+
+
+def _split_index(index: int) -> list[int]:
+    parts = []
+    while True:
+        index, remainder = divmod(index, 10)
+        parts.append(remainder)
+        if not index:
+            break
+
+    return parts[::-1]
@@ -0,0 +1,163 @@
+"""
+Run the benchmark suite and optionally write the results as JSON, or compare them against the results
+of a previous run, e.g. of another commit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import bench_build  # noqa: F401
+import bench_cli  # noqa: F401
+import bench_env  # noqa: F401
+from core import BENCHMARKS
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_VERSION = 1
+
+
+def get_commit() -> str:
+    try:
+        process = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+    return process.stdout.strip()
+
+
+def run_case(benchmark, param, rounds: int) -> dict:
+    with tempfile.TemporaryDirectory() as d:
+        temp_dir = Path(d).resolve()
+
+        start = time.perf_counter()
+        function = benchmark.factory(temp_dir, param)
+        setup = time.perf_counter() - start
+
+        if benchmark.warmup:
+            function()
+
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+
+    result = {
+        "name": benchmark.case_name(param),
+        "benchmark": benchmark.name,
+        "param": param,
+        "rounds": rounds,
+        "setup": setup,
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.fmean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if rounds > 1 else 0.0,
+        "timings": timings,
+    }
+    if benchmark.unit and param:
+        result["unit"] = benchmark.unit
+        result["throughput"] = param / result["median"]
+
+    return result
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1e-3:  # noqa: PLR2004
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+
+    return f"{seconds:.2f} s"
+
+
+def compare(results: list[dict], baseline_file: Path, threshold: float) -> bool:
+    baseline = {result["name"]: result for result in json.loads(baseline_file.read_text(encoding="utf-8"))["results"]}
+
+    regressions = False
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None:
+            continue
+
+        ratio = result["median"] / previous["median"]
+        status = ""
+        if ratio > 1 + threshold:
+            status = "  REGRESSION"
+            regressions = True
+        elif ratio < 1 - threshold:
+            status = "  improvement"
+
+        print(f"{result['name']:<40} {ratio:>6.2f}x{status}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name matches this regex")
+    parser.add_argument("-t", "--tag", action="append", default=[], help="Only run benchmarks with this tag")
+    parser.add_argument("-r", "--rounds", type=int, default=5, help="The number of timed rounds per benchmark")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare the median timings with those of this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="The relative slowdown that is considered a regression"
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args()
+
+    pattern = re.compile(args.filter)
+    cases = [
+        (benchmark, param)
+        for benchmark in BENCHMARKS
+        for param in benchmark.params
+        if pattern.search(benchmark.case_name(param)) and all(tag in benchmark.tags for tag in args.tag)
+    ]
+    if args.list:
+        for benchmark, param in cases:
+            print(benchmark.case_name(param))
+        return
+
+    results = []
+    for benchmark, param in cases:
+        result = run_case(benchmark, param, args.rounds)
+        results.append(result)
+
+        line = f"{result['name']:<40} {format_duration(result['median']):>10} +- {format_duration(result['stdev'])}"
+        if "throughput" in result:
+            line += f"  ({result['throughput']:,.0f} {result['unit']}/s)"
+        print(line, flush=True)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "version": SCHEMA_VERSION,
+                    "commit": get_commit(),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import os
-import signal
 import sys
 from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
 from hatch.cli.terminal import Terminal
+from hatch.config.constants import AppEnvVars
 from hatch.config.user import ConfigFile, RootConfig
 from hatch.project.core import Project
 from hatch.utils.fs import Path
@@ -49,7 +49,19 @@ class Application(Terminal):
         return self.project.get_environment(env_name)
 
     def prepare_environment(self, environment: EnvironmentInterface, *, keep_env: bool = False):
-        self.project.prepare_environment(environment, keep_env=keep_env)
+        from hatch.env.watch import WatchStatus, sync_lock
+
+        # Environments that `env watch` synchronized for the current configuration need no checks
+        status = WatchStatus(self.project.env_metadata.watch_status_file)
+        if status.is_ready(environment):
+            return
+
+        # Wait for any synchronization by `env watch` or another command to finish rather than racing it
+        with sync_lock(self.project.env_metadata.sync_lock_file(environment)):
+            if status.is_ready(environment):
+                return
+
+            self.project.prepare_environment(environment, keep_env=keep_env)
 
     def run_shell_commands(self, context: ExecutionContext) -> None:
         with context.env.command_context():
@@ -58,6 +70,14 @@ class Application(Terminal):
             except Exception as e:  # noqa: BLE001
                 self.abort(str(e))
 
+            # A single command that is the last action may replace this process rather than run as a child
+            exec_command = (
+                context.allow_exec
+                and len(resolved_commands) == 1
+                and not resolved_commands[0].startswith("- ")
+                and not os.environ.get(AppEnvVars.NO_EXEC)
+            )
+
             first_error_code = None
             should_display_command = not context.hide_commands and (self.verbose or len(resolved_commands) > 1)
             for i, raw_command in enumerate(resolved_commands, 1):
@@ -70,24 +90,15 @@ class Application(Terminal):
                     continue_on_error = True
                     command = command[2:]
 
-                # Ignore SIGINT in the parent process while the child command runs so that
-                # only the child handles Ctrl-C.  The terminal sends SIGINT to the entire
-                # foreground process group; without this the parent raises KeyboardInterrupt
-                # and aborts even though the child (e.g. a Python REPL) may choose to stay
-                # alive.  The child's exit code is still used to determine success/failure.
-                # A handler that does nothing is used rather than `signal.SIG_IGN` because
-                # handled signals are reset to their default action when the child is
-                # executed whereas ignored signals stay ignored, which would otherwise make
-                # the child itself unable to be interrupted.
-                original_sigint = signal.getsignal(signal.SIGINT)
-                try:
-                    signal.signal(signal.SIGINT, lambda *_: None)
+                if exec_command:
+                    # This never returns, so it runs without changing how interrupts are handled: a replaced
+                    # process starts with default handling and environments that run the command as a child
+                    # ignore interrupts themselves
+                    context.env.exit_with_shell_command(command)
+
+                with self.platform.ignore_interrupts():
                     process = context.env.run_shell_command(command)
-                finally:
-                    # Restore the original handler in finally so the parent stays
-                    # responsive to Ctrl-C even if the child raises or is cancelled.
-                    # Don't hoist this out of the finally block.
-                    signal.signal(signal.SIGINT, original_sigint)
+
                 sys.stdout.flush()
                 sys.stderr.flush()
                 if process.returncode:
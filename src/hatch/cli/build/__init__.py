@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import click
@@ -58,16 +59,35 @@ if TYPE_CHECKING:
         "[env var: `HATCH_BUILD_CLEAN_HOOKS_AFTER`]"
     ),
 )
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help=(
+        "Whether or not to reuse artifacts stored in the cache directory when nothing they were built from has "
+        "changed, in which case build hooks do not run [env var: `HATCH_BUILD_CACHE`]"
+    ),
+)
 @click.option("--clean-only", is_flag=True, hidden=True)
 @click.pass_obj
 def build(
-    app: Application, location, targets, build_all, hooks_only, no_hooks, ext, clean, clean_hooks_after, clean_only
+    app: Application,
+    location,
+    targets,
+    build_all,
+    hooks_only,
+    no_hooks,
+    ext,
+    clean,
+    clean_hooks_after,
+    use_cache,
+    clean_only,
 ):
     """Build a project."""
     app.ensure_environment_plugin_dependencies()
 
     from hatch.config.constants import AppEnvVars
-    from hatch.project.constants import DEFAULT_BUILD_DIRECTORY
+    from hatch.project.constants import DEFAULT_BUILD_DIRECTORY, BuildEnvVars
     from hatch.utils.fs import Path
 
     if ext:
@@ -82,6 +102,9 @@ def build(
     elif app.quiet:
         env_vars[AppEnvVars.QUIET] = str(abs(app.verbosity))
 
+    if use_cache and not os.environ.get(BuildEnvVars.CACHE):
+        env_vars[BuildEnvVars.CACHE] = str(app.cache_dir / "builds")
+
     if not build_all:
         _build_project(
             app,
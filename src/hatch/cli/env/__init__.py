@@ -1,12 +1,15 @@
 import click
 
 from hatch.cli.env.create import create
+from hatch.cli.env.fetch import fetch
 from hatch.cli.env.find import find
 from hatch.cli.env.lock import lock
 from hatch.cli.env.prune import prune
 from hatch.cli.env.remove import remove
 from hatch.cli.env.run import run
+from hatch.cli.env.scripts import scripts
 from hatch.cli.env.show import show
+from hatch.cli.env.watch import watch
 
 
 @click.group(short_help="Manage project environments")
@@ -15,9 +18,12 @@ def env():
 
 
 env.add_command(create)
+env.add_command(fetch)
 env.add_command(find)
 env.add_command(lock)
 env.add_command(prune)
 env.add_command(remove)
 env.add_command(run)
+env.add_command(scripts)
 env.add_command(show)
+env.add_command(watch)
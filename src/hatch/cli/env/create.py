@@ -26,6 +26,11 @@ def create(app: Application, env_name: str):
     for env in environments:
         environment = app.project.get_environment(env)
         if environment.exists():
+            # Another project may have created the shared environment, in which case it must be referenced
+            if environment.store_key:
+                app.project.prepare_environment(environment, keep_env=bool(os.environ.get(AppEnvVars.KEEP_ENV)))
+                continue
+
             app.display_warning(f"Environment `{env}` already exists")
             continue
 
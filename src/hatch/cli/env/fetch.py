@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+
+
+@click.command(short_help="Download distributions for offline environment sync")
+@click.argument("env_name", default="default")
+@click.pass_obj
+def fetch(app: Application, env_name: str):
+    """
+    Download every distribution needed by environments into the wheelhouse of the project, from which
+    environments with the `offline` option are synchronized without network access.
+
+    Lockfiles are the source of truth when present, otherwise dependencies are resolved by the locker of
+    the environment.
+    """
+    import tempfile
+
+    from hatch.dep.pylock import Pylock
+    from hatch.env.lock import LockerNotFoundError, LockerUnsupportedError
+    from hatch.env.wheelhouse import Wheelhouse, WheelhouseError, get_wheelhouse_path, lock_environment_distributions
+    from hatch.utils.fs import Path
+
+    app.ensure_environment_plugin_dependencies()
+
+    environments = app.project.expand_environments(env_name)
+    if not environments:
+        app.abort(f"Environment `{env_name}` is not defined by project config")
+
+    wheelhouse = Wheelhouse(get_wheelhouse_path(app.project.location))
+
+    incompatible = {}
+    for env in environments:
+        environment = app.project.get_environment(env)
+
+        try:
+            environment.check_compatibility()
+        except Exception as e:  # noqa: BLE001
+            if env_name in app.project.config.matrices:
+                incompatible[env] = str(e)
+                continue
+
+            app.abort(f"Environment `{env}` is incompatible: {e}")
+
+        fetched = 0
+        unavailable: list[str] = []
+        with app.status(f"Fetching distributions: {env}"), tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                for lockfile_path in lock_environment_distributions(environment, Path(temp_dir)):
+                    fetched_files, unavailable_packages = wheelhouse.add_lock(Pylock.from_path(lockfile_path))
+                    fetched += fetched_files
+                    unavailable.extend(unavailable_packages)
+            except (LockerNotFoundError, LockerUnsupportedError, WheelhouseError, ValueError) as e:
+                app.abort(str(e))
+            finally:
+                wheelhouse.save()
+
+        app.display(f"Fetched {fetched} distribution{'s' if fetched != 1 else ''} for environment `{env}`")
+        if unavailable:
+            app.display_warning(f"Packages that require network access: {', '.join(unavailable)}")
+
+    if incompatible:
+        num_incompatible = len(incompatible)
+        app.display_warning(
+            f"Skipped {num_incompatible} incompatible environment{'s' if num_incompatible > 1 else ''}:"
+        )
+        for env, reason in incompatible.items():
+            app.display_warning(f"{env} -> {reason}")
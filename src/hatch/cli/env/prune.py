@@ -38,6 +38,23 @@ def prune(app: Application):
                 app.verbosity,
                 app,
             )
+            if environment.store_key:
+                # Shared environments are removed below once no project references them
+                app.project.env_metadata.reset(environment)
+                continue
+
             if environment.exists():
                 with app.status(f"Removing environment: {env_name}"):
                     environment.remove()
+
+    from hatch.utils.trash import TRASH_DIRECTORY_NAME, Trash
+
+    # Pruning is explicit so references of projects that no longer exist are dropped
+    for metadata_file in app.project.env_store.dead_references():
+        metadata_file.unlink(missing_ok=True)
+
+    # Garbage collect shared environments that are no longer referenced by any project
+    for entry in app.project.env_store.unreferenced_entries():
+        with app.status(f"Removing shared environment: {entry.name}"):
+            # Entries reside in the `.store` directory of the isolated data directory of their type
+            Trash(entry.parent.parent / TRASH_DIRECTORY_NAME).discard(entry)
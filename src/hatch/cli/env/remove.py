@@ -29,6 +29,12 @@ def remove(ctx: click.Context, env_name: str):
 
     for env_name in environments:
         environment = app.project.get_environment(env_name)
+        if environment.store_key:
+            # Only release this project's reference if other projects still use the shared environment
+            app.project.env_metadata.reset(environment)
+            if app.project.env_store.is_referenced(environment):
+                continue
+
         if environment.exists():
             with app.status(f"Removing environment: {env_name}"):
                 environment.remove()
@@ -144,4 +144,5 @@ def run(
             context.env.exists = lambda: True  # type: ignore[method-assign]
 
         context.force_continue = force_continue
+        context.allow_exec = len(environments) == 1
         context.add_shell_command(list(args))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+    from hatch.env.store import ScriptCache
+
+
+def get_script_cache(app: Application) -> ScriptCache:
+    from hatch.env.store import ScriptCache
+
+    return ScriptCache(app.data_dir / "env" / "virtual" / ".scripts")
+
+
+@click.group(short_help="Manage the environments of scripts with inline metadata")
+def scripts():
+    pass
+
+
+@scripts.command(short_help="Show the environments of scripts")
+@click.option("--ascii", "force_ascii", is_flag=True, help="Whether or not to only use ASCII characters")
+@click.pass_obj
+def show(app: Application, *, force_ascii: bool):
+    """Show the environments of scripts with inline metadata, most recently used first."""
+    from datetime import datetime, timezone
+
+    script_cache = get_script_cache(app)
+    entries = script_cache.entries()
+    if not entries:
+        app.display_info("No script environments")
+        return
+
+    columns: dict[str, dict[int, str]] = {
+        "Key": {},
+        "Size": {},
+        "Last used": {},
+        "Python": {},
+        "Dependencies": {},
+        "Script": {},
+    }
+    for i, entry in enumerate(entries):
+        columns["Key"][i] = entry.key
+        columns["Size"][i] = f"{script_cache.measure(entry) / (1024 * 1024):.1f} MB"
+        last_used = datetime.fromtimestamp(entry.last_used, tz=timezone.utc).astimezone()
+        columns["Last used"][i] = last_used.strftime("%Y-%m-%d %H:%M:%S")
+        columns["Python"][i] = entry.data.get("python", "")
+        columns["Dependencies"][i] = "\n".join(entry.data.get("dependencies", []))
+        columns["Script"][i] = entry.data.get("script", "")
+
+    app.display_table("Scripts", columns, show_lines=True, force_ascii=force_ascii)
+
+
+@scripts.command(short_help="Remove the environments of scripts")
+@click.pass_obj
+def purge(app: Application):
+    """Remove the environments of scripts with inline metadata."""
+    script_cache = get_script_cache(app)
+    for entry in script_cache.entries():
+        with app.status(f"Removing script environment: {entry.key}"):
+            script_cache.remove(entry)
@@ -70,8 +70,8 @@ def show(
         app.display(json.dumps(contextual_config, separators=(",", ":")))
         return
 
-    from hatch.dep.core import Dependency, InvalidDependencyError
-    from hatchling.metadata.utils import get_normalized_dependency, normalize_project_name
+    from hatch.dep.core import InvalidDependencyError, normalize_dependency
+    from hatchling.metadata.utils import normalize_project_name
 
     if internal:
         target_standalone_envs = app.project.config.internal_envs
@@ -125,11 +125,9 @@ def show(
             normalized_dependencies = set()
             for dependency in dependencies:
                 try:
-                    req = Dependency(dependency)
+                    normalized_dependencies.add(normalize_dependency(dependency))
                 except InvalidDependencyError:
                     normalized_dependencies.add(dependency)
-                else:
-                    normalized_dependencies.add(get_normalized_dependency(req))
 
             matrix_columns["Dependencies"][i] = "\n".join(sorted(normalized_dependencies))
 
@@ -174,7 +172,7 @@ def show(
 
         if environment.environment_dependencies_complex:
             standalone_columns["Dependencies"][i] = "\n".join(
-                sorted({get_normalized_dependency(d) for d in environment.environment_dependencies_complex})
+                sorted({normalize_dependency(str(d)) for d in environment.environment_dependencies_complex})
             )
 
         env_vars = dict(environment.env_vars)
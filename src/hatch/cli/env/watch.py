@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import click
+
+from hatch.config.constants import AppEnvVars
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.env.watch import InotifyWatcher, PollingWatcher
+
+# The number of seconds to wait for related changes, such as a lockfile updated along with its project, to settle
+WATCH_DEBOUNCE = 0.2
+
+
+@click.command(short_help="Synchronize environments whenever their configuration changes")
+@click.argument("env_names", nargs=-1)
+@click.option("--poll", is_flag=True, help="Poll for changes rather than relying on filesystem events")
+@click.option(
+    "--interval", type=float, default=1.0, show_default=True, help="The number of seconds between polls for changes"
+)
+@click.pass_obj
+def watch(app: Application, *, env_names: tuple[str, ...], poll: bool, interval: float):
+    """
+    Synchronize environments whenever their configuration changes.
+
+    This watches the project configuration, lockfiles and the manifests of workspace members, and
+    synchronizes the affected environments as soon as any of them change. The `run` and `env run`
+    commands skip their own checks for environments that are ready for the current configuration.
+    Defaults to the active environment.
+    """
+    from hatch.env.watch import ERROR, SYNCING, WatchStatus, get_file_digests, get_file_watcher, get_watched_files
+    from hatch.project.core import Project
+
+    app.ensure_environment_plugin_dependencies()
+
+    env_names = env_names or (app.env,)
+    try:
+        environments = get_environments(app, env_names)
+    except ValueError as e:
+        app.abort(str(e))
+
+    location = app.project.location
+    status = WatchStatus(app.project.env_metadata.watch_status_file)
+    states = dict.fromkeys((environment.name for environment in environments), SYNCING)
+    fingerprints: dict[str, str] = {}
+    watched = get_watched_files(app.project, environments)
+    watcher = None
+
+    try:
+        while True:
+            digests = get_file_digests(watched)
+            status.publish(digests, states, fingerprints)
+            for environment in environments:
+                if states[environment.name] == SYNCING:
+                    states[environment.name], fingerprint = sync_environment(app, environment)
+                    fingerprints[environment.name] = fingerprint
+                    status.publish(digests, states, fingerprints)
+
+            if watcher is None or set(watcher.paths) != set(watched):
+                if watcher is not None:
+                    watcher.close()
+
+                watcher = get_file_watcher(watched, interval=interval, poll=poll)
+
+            app.display_info(f"Watching for changes: {', '.join(states)}")
+            affected = wait_for_changes(watcher, watched, digests)
+
+            # Configuration is read again after every change
+            app.project = Project(location, locate=False)
+            app.project.set_app(app)
+            try:
+                environments = get_environments(app, env_names)
+                watched = get_watched_files(app.project, environments)
+            except Exception as e:  # noqa: BLE001
+                app.display_error(f"Unable to load the project configuration: {e}")
+                environments = []
+                states = dict.fromkeys(states, ERROR)
+                continue
+
+            # Environments that are not affected remain ready for the new configuration, while those that failed,
+            # possibly because the configuration could not be loaded, are synchronized again
+            previous_states = states
+            states = {}
+            for environment in environments:
+                state = previous_states.get(environment.name, SYNCING)
+                if affected is None or environment.name in affected or state == ERROR:
+                    state = SYNCING
+
+                states[environment.name] = state
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+def get_environments(app: Application, env_names: tuple[str, ...]) -> list[EnvironmentInterface]:
+    environments = []
+    for env_name in env_names:
+        expanded = app.project.expand_environments(env_name)
+        if not expanded:
+            message = f"Environment `{env_name}` is not defined by project config"
+            raise ValueError(message)
+
+        environments.extend(app.project.get_environment(env) for env in expanded)
+
+    return environments
+
+
+def wait_for_changes(
+    watcher: InotifyWatcher | PollingWatcher, watched: dict[str, set[str] | None], digests: dict[str, str]
+) -> set[str] | None:
+    """
+    Blocks until the contents of any watched file change, returning the names of the affected environments or
+    `None` if every environment is affected.
+    """
+    import time
+
+    from hatch.env.watch import get_file_digests
+
+    while True:
+        watcher.wait()
+        time.sleep(WATCH_DEBOUNCE)
+
+        affected: set[str] = set()
+        for path, digest in get_file_digests(watched).items():
+            if digest == digests[path]:
+                continue
+
+            environment_names = watched[path]
+            if environment_names is None:
+                return None
+
+            affected.update(environment_names)
+
+        if affected:
+            return affected
+
+
+def sync_environment(app: Application, environment: EnvironmentInterface) -> tuple[str, str]:
+    """
+    Returns the state of `environment` and, if it is ready, the fingerprint of the configuration for which it
+    was synchronized.
+    """
+    from hatch.env.watch import ERROR, READY, get_environment_fingerprint, sync_lock
+
+    try:
+        if not environment.exists():
+            environment.check_compatibility()
+
+        with (
+            app.status(f"Synchronizing environment: {environment.name}"),
+            sync_lock(app.project.env_metadata.sync_lock_file(environment)),
+        ):
+            app.project.prepare_environment(environment, keep_env=bool(os.environ.get(AppEnvVars.KEEP_ENV)))
+
+        fingerprint = get_environment_fingerprint(environment)
+    # Failed installations end the process
+    except SystemExit:
+        app.display_error(f"Environment `{environment.name}` could not be synchronized")
+        return ERROR, ""
+    except Exception as e:  # noqa: BLE001
+        app.display_error(f"Environment `{environment.name}` could not be synchronized: {e}")
+        return ERROR, ""
+
+    return READY, fingerprint
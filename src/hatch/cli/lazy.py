@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class LazyGroup(click.Group):
+    """
+    A command group that only imports the module of a registered command when it is dispatched to or help
+    is displayed. The mapping of lazy commands associates command names with the import path of the command,
+    in the form `module:attribute`.
+    """
+
+    def __init__(self, *args, lazy_commands: Mapping[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self.load_command(cmd_name), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        from importlib import import_module
+
+        import_path = self.lazy_commands[cmd_name]
+        module_name, _, attribute = import_path.partition(":")
+        command = getattr(import_module(module_name), attribute)
+        if not isinstance(command, click.Command):  # no cov
+            message = f"Lazy command `{cmd_name}` does not refer to a command: {import_path}"
+            raise TypeError(message)
+
+        return command
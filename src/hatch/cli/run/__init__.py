@@ -93,9 +93,8 @@ def run(ctx: click.Context, args: tuple[str, ...]):
                 import sys
                 import sysconfig
 
-                from packaging.specifiers import SpecifierSet
-
                 from hatch.python.distributions import DISTRIBUTIONS
+                from hatchling.utils.specifiers import VersionRanges
 
                 current_version = ".".join(map(str, sys.version_info[:2]))
                 if bool(sysconfig.get_config_var("Py_GIL_DISABLED")):
@@ -106,11 +105,11 @@ def run(ctx: click.Context, args: tuple[str, ...]):
                 distributions = [name for name in DISTRIBUTIONS if re.match(r"^\d+\.\d+$", name)]
                 distributions.sort(key=lambda name: name != current_version_base)
 
-                python_constraint = SpecifierSet(requires_python)
+                python_ranges = VersionRanges.from_specifier_set(requires_python)
                 for distribution in distributions:
-                    # Try an artificially high patch version to account for
+                    # Distributions provide the latest patch release, which accounts for
                     # common cases like `>=3.11.4` or `>=3.10,<3.11`
-                    if python_constraint.contains(f"{distribution}.100"):
+                    if python_ranges.supports_latest(distribution):
                         # Only set config["python"] if it doesn't match the current Python's base version
                         # This allows free-threaded builds (e.g. 3.14t) to match their base version (3.14)
                         if distribution != current_version_base:
@@ -123,6 +122,7 @@ def run(ctx: click.Context, args: tuple[str, ...]):
             app.project.config.envs[script.id] = config
             app.project.set_path(script)
             for context in app.runner_context([script.id]):
+                context.allow_exec = True
                 context.add_shell_command(["python", first_arg, *args[1:]])
 
             return
@@ -6,6 +6,10 @@ import click
 
 if TYPE_CHECKING:
     from hatch.cli.application import Application
+    from hatchling.metadata.core import ProjectMetadata
+
+# Version sources that never execute project code or require additional dependencies
+BUILTIN_VERSION_SOURCES = frozenset(("env", "regex"))
 
 
 @click.command(short_help="View or set a project's version")
@@ -51,6 +55,7 @@ def version(app: Application, *, desired_version: str | None, force: bool):
 
     from hatch.config.constants import VersionEnvVars
     from hatch.project.constants import BUILD_BACKEND
+    from hatch.utils.structures import EnvVars
 
     with app.project.location.as_cwd():
         if app.project.metadata.build.build_backend != BUILD_BACKEND:
@@ -64,6 +69,26 @@ def version(app: Application, *, desired_version: str | None, force: bool):
                 project_metadata = app.project.build_frontend.get_core_metadata()
 
             app.display(project_metadata["version"])
+        elif supports_in_process_version(app.project.metadata):
+            # Avoid preparing the build environment and spawning Hatchling when only built-in plugins are involved
+            app.ensure_environment_plugin_dependencies()
+            with app.project.build_env.get_env_vars():
+                version_config = app.project.metadata.hatch.version
+                source = version_config.source
+                version_data = source.get_version_data()
+                original_version = version_data["version"]
+
+                if not desired_version:
+                    app.display(original_version)
+                    return
+
+                with EnvVars({VersionEnvVars.VALIDATE_BUMP: "false"} if force else {}):
+                    updated_version = version_config.scheme.update(desired_version, original_version, version_data)
+
+                source.set_version(updated_version, version_data)
+
+            app.display_info(f"Old: {original_version}")
+            app.display_info(f"New: {updated_version}")
         else:
             from hatch.utils.runner import ExecutionContext
 
@@ -79,3 +104,32 @@ def version(app: Application, *, desired_version: str | None, force: bool):
 
             context.add_shell_command(command)
             app.execute_context(context)
+
+
+def supports_in_process_version(metadata: ProjectMetadata) -> bool:
+    """
+    Whether the version may be read and set by the Hatchling that is bundled with Hatch rather than the one
+    installed in the build environment, which is only equivalent when no third-party plugins may be loaded.
+    """
+    from packaging.requirements import Requirement
+
+    from hatch.utils.metadata import normalize_project_name
+    from hatchling.__about__ import __version__ as hatchling_version
+
+    for requirement in metadata.build.requires:
+        parsed_requirement = Requirement(requirement)
+        if (
+            normalize_project_name(parsed_requirement.name) != "hatchling"
+            or parsed_requirement.url
+            or not parsed_requirement.specifier.contains(hatchling_version, prereleases=True)
+        ):
+            return False
+
+    if metadata.hatch.metadata.hook_config or metadata.hatch.build_config.get("hooks"):
+        return False
+
+    if any(target_config.get("hooks") for target_config in metadata.hatch.build_targets.values()):
+        return False
+
+    version_config = metadata.hatch.version
+    return version_config.source_name in BUILTIN_VERSION_SOURCES and version_config.scheme_name == "standard"
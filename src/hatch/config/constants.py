@@ -11,6 +11,11 @@ class AppEnvVars:
     FORCE_COLOR = "FORCE_COLOR"
     KEEP_ENV = "HATCH_KEEP_ENV"
     NO_SOURCES = "HATCH_NO_SOURCES"
+    NO_EXEC = "HATCH_NO_EXEC"
+    NO_DETACH = "HATCH_NO_DETACH"
+    SCRIPT_CACHE_SIZE = "HATCH_SCRIPT_CACHE_SIZE"
+    VCS_REVISION_TTL = "HATCH_VCS_REVISION_TTL"
+    VCS_REVISION_TIMEOUT = "HATCH_VCS_REVISION_TIMEOUT"
 
 
 class ConfigEnvVars:
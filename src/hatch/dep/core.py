@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from functools import cached_property
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
 
 from packaging.requirements import InvalidRequirement, Requirement
 
 from hatch.utils.fs import Path
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from packaging.markers import Marker
+
 InvalidDependencyError = InvalidRequirement
 
 
@@ -55,3 +61,35 @@ class Dependency(Requirement):
 
         subdirectories = parse_qs(fragment).get("subdirectory")
         return subdirectories[0] if subdirectories else None
+
+
+@cache
+def get_dependency(s: str, *, editable: bool = False) -> Dependency:
+    """
+    Returns the dependency parsed from `s`, interned so that every caller in the process shares the same instance.
+    The instance must therefore never be modified.
+    """
+    return Dependency(s, editable=editable)
+
+
+def freeze_environment(environment: Mapping[str, str]) -> frozenset[tuple[str, str]]:
+    return frozenset(environment.items())
+
+
+@cache
+def evaluate_marker(marker: Marker, environment: frozenset[tuple[str, str]]) -> bool:
+    """
+    Returns whether `marker` applies to an `environment` frozen by `freeze_environment`, which is only evaluated
+    once per process for each combination.
+    """
+    return marker.evaluate(dict(environment))
+
+
+@cache
+def normalize_dependency(s: str) -> str:
+    """
+    Returns the normalized form of the dependency `s` without modifying any interned instance.
+    """
+    from hatchling.metadata.utils import get_normalized_dependency
+
+    return get_normalized_dependency(Requirement(s))
@@ -0,0 +1,347 @@
+"""
+Read PEP 751 ``pylock.toml`` files and compute the minimal set of changes that makes an environment
+match one, so that only the difference has to be handed to an installer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from importlib.metadata import Distribution
+
+    from hatch.dep.sync import InstalledDistributions
+    from hatch.utils.fs import Path
+
+SUPPORTED_LOCK_VERSION = 1
+
+# Installers and build tools that are seeded into environments and never appear in lockfiles
+PRESERVED_DISTRIBUTIONS = frozenset(("pip", "setuptools", "uv", "wheel"))
+
+
+def _normalize_name(name: str) -> str:
+    from hatchling.metadata.utils import normalize_project_name
+
+    return normalize_project_name(name)
+
+
+def evaluate_lock_marker(
+    marker: str, environment: dict[str, str], extras: Iterable[str], dependency_groups: Iterable[str]
+) -> bool:
+    from hatch.dep.core import freeze_environment
+
+    return _evaluate_lock_marker(
+        marker, freeze_environment(environment), frozenset(extras), frozenset(dependency_groups)
+    )
+
+
+@cache
+def _evaluate_lock_marker(
+    marker: str,
+    environment: frozenset[tuple[str, str]],
+    extras: frozenset[str],
+    dependency_groups: frozenset[str],
+) -> bool:
+    from packaging.markers import Marker
+
+    lock_marker = Marker(marker)
+    lock_environment: dict[str, Any] = dict(environment)
+    lock_environment["extras"] = extras
+    lock_environment["dependency_groups"] = dependency_groups
+    try:
+        return lock_marker.evaluate(lock_environment, context="lock_file")  # type: ignore[call-arg]
+    except TypeError:  # no cov
+        # Versions of `packaging` older than 25.0 only support markers without `extras` or `dependency_groups`
+        return lock_marker.evaluate(dict(environment))
+
+
+@dataclass(frozen=True)
+class LockedPackage:
+    name: str
+    version: str = ""
+    marker: str = ""
+    vcs: dict[str, Any] = field(default_factory=dict)
+    directory: dict[str, Any] = field(default_factory=dict)
+    archive: dict[str, Any] = field(default_factory=dict)
+    wheels: tuple[dict[str, Any], ...] = ()
+    sdist: dict[str, Any] = field(default_factory=dict)
+    # Every acceptable hash of the wheels and source distribution, as `algorithm:digest`
+    hashes: tuple[str, ...] = ()
+    # The directory that relative paths are resolved against, i.e. that of the lockfile
+    root: Path | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], root: Path) -> LockedPackage:
+        name = data.get("name")
+        if not isinstance(name, str) or not name:
+            message = "Every entry in `packages` must have a `name`"
+            raise ValueError(message)
+
+        for source, required_keys in (("vcs", ("type", "url", "commit-id")), ("directory", ("path",))):
+            missing = [key for key in required_keys if key not in data.get(source, {})]
+            if source in data and missing:
+                message = f"Field `{source}` of package `{name}` must define: {', '.join(missing)}"
+                raise ValueError(message)
+
+        if "archive" in data and not ({"url", "path"} & set(data["archive"])):
+            message = f"Field `archive` of package `{name}` must define: url or path"
+            raise ValueError(message)
+
+        hashes: list[str] = []
+        artifacts = [*data.get("wheels", []), data.get("sdist", {}), data.get("archive", {})]
+        for artifact in artifacts:
+            for algorithm, digest in sorted(artifact.get("hashes", {}).items()):
+                entry = f"{algorithm}:{digest}"
+                if entry not in hashes:
+                    hashes.append(entry)
+
+        return cls(
+            name=_normalize_name(name),
+            version=data.get("version", ""),
+            marker=data.get("marker", ""),
+            vcs=data.get("vcs", {}),
+            directory=data.get("directory", {}),
+            archive=data.get("archive", {}),
+            wheels=tuple(data.get("wheels", [])),
+            sdist=data.get("sdist", {}),
+            hashes=tuple(hashes),
+            root=root,
+        )
+
+    @property
+    def hashable(self) -> bool:
+        # Installers cannot verify hashes of VCS checkouts or local directories
+        return bool(self.hashes) and not (self.vcs or self.directory)
+
+    def resolve_path(self, path: str) -> Path:
+        from hatch.utils.fs import Path
+
+        resolved = Path(path)
+        if not resolved.is_absolute() and self.root is not None:
+            resolved = self.root / resolved
+
+        return resolved.resolve()
+
+    @property
+    def distribution_files(self) -> list[tuple[str, str, dict[str, str]]]:
+        """
+        The file name, location and hashes of every wheel and the source distribution of this package. Locations
+        are absolute paths when the files exist locally and URLs otherwise.
+        """
+        from urllib.parse import unquote, urlsplit
+
+        files = []
+        for artifact in (*self.wheels, self.sdist):
+            if "path" in artifact and (path := self.resolve_path(artifact["path"])).is_file():
+                location = str(path)
+                filename = path.name
+            elif "url" in artifact:
+                location = artifact["url"]
+                filename = unquote(urlsplit(location).path).rpartition("/")[2]
+            else:
+                continue
+
+            files.append((artifact.get("name") or filename, location, artifact.get("hashes", {})))
+
+        return files
+
+    @property
+    def install_args(self) -> list[str]:
+        """
+        The installer arguments that install exactly this package.
+        """
+        if self.vcs:
+            url = f"{self.vcs['type']}+{self.vcs['url']}@{self.vcs['commit-id']}"
+            return [self._direct_reference(url, self.vcs)]
+
+        if self.directory:
+            url = self.resolve_path(self.directory["path"]).as_uri()
+            if self.directory.get("editable", False):
+                return ["--editable", url]
+
+            return [self._direct_reference(url, self.directory)]
+
+        if self.archive:
+            url = self.archive.get("url") or self.resolve_path(self.archive["path"]).as_uri()
+            return [self._direct_reference(url, self.archive)]
+
+        return [f"{self.name}=={self.version}" if self.version else self.name]
+
+    def _direct_reference(self, url: str, source: dict[str, Any]) -> str:
+        subdirectory = source.get("subdirectory")
+        if subdirectory:
+            url = f"{url}#subdirectory={subdirectory}"
+
+        return f"{self.name} @ {url}"
+
+    def matches(self, distribution: Distribution) -> bool:
+        """
+        Whether the installed distribution is exactly this package, as far as can be determined from the
+        installation metadata.
+        """
+        import json
+
+        direct_url_file = distribution.read_text("direct_url.json")
+        # https://packaging.python.org/specifications/direct-url/
+        direct_url = json.loads(direct_url_file) if direct_url_file else {}
+
+        if self.vcs:
+            vcs_info = direct_url.get("vcs_info", {})
+            return (
+                vcs_info.get("commit_id") == self.vcs.get("commit-id")
+                and direct_url.get("url") == self.vcs.get("url")
+                and direct_url.get("subdirectory") == self.vcs.get("subdirectory")
+            )
+
+        if self.directory:
+            from hatch.utils.fs import Path
+
+            if "dir_info" not in direct_url:
+                return False
+
+            return (
+                Path.from_uri(direct_url["url"]) == self.resolve_path(self.directory["path"])
+                and direct_url["dir_info"].get("editable", False) == self.directory.get("editable", False)
+                and direct_url.get("subdirectory") == self.directory.get("subdirectory")
+            )
+
+        if self.archive:
+            archive_info = direct_url.get("archive_info")
+            if archive_info is None:
+                return False
+
+            if "url" in self.archive and direct_url.get("url") != self.archive["url"]:
+                return False
+
+            installed_hashes = dict(archive_info.get("hashes", {}))
+            if "hash" in archive_info:
+                algorithm, _, digest = archive_info["hash"].partition("=")
+                installed_hashes.setdefault(algorithm, digest)
+
+            locked_hashes = self.archive.get("hashes", {})
+            return all(
+                installed_hashes[algorithm] == digest
+                for algorithm, digest in locked_hashes.items()
+                if algorithm in installed_hashes
+            )
+
+        if "dir_info" in direct_url or "vcs_info" in direct_url:
+            return False
+
+        if not self.version:
+            return True
+
+        from packaging.version import InvalidVersion, Version
+
+        try:
+            return Version(distribution.version) == Version(self.version)
+        except InvalidVersion:
+            return distribution.version == self.version
+
+
+@dataclass
+class LockDelta:
+    """
+    The changes that make an environment match a lockfile.
+    """
+
+    # Locked packages that are not installed
+    add: list[LockedPackage] = field(default_factory=list)
+    # Locked packages that are installed with a different version or from a different source
+    upgrade: list[LockedPackage] = field(default_factory=list)
+    # Names of installed distributions that are not locked
+    remove: list[str] = field(default_factory=list)
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.add or self.upgrade or self.remove)
+
+
+class Pylock:
+    def __init__(self, data: dict[str, Any], root: Path) -> None:
+        self.data = data
+        self.root = root
+
+        lock_version = str(data.get("lock-version", ""))
+        major_version, _, _ = lock_version.partition(".")
+        if not major_version.isdigit():
+            message = "Field `lock-version` must be a version string"
+            raise ValueError(message)
+        if int(major_version) != SUPPORTED_LOCK_VERSION:
+            message = f"Unsupported lock version: {lock_version}"
+            raise ValueError(message)
+
+        self.packages = [LockedPackage.from_dict(package, root) for package in data.get("packages", [])]
+
+    @classmethod
+    def from_path(cls, path: Path) -> Pylock:
+        from hatch.utils.toml import load_toml_file
+
+        return cls(load_toml_file(str(path)), path.parent)
+
+    def select(
+        self, environment: dict[str, str], *, extras: Iterable[str] = (), dependency_groups: Iterable[str] = ()
+    ) -> list[LockedPackage]:
+        """
+        Returns the packages that apply to the given marker environment, extras and dependency groups.
+        """
+        extras = tuple(extras)
+        dependency_groups = tuple(dependency_groups) or tuple(self.data.get("default-groups", ()))
+
+        supported_environments = self.data.get("environments", [])
+        if supported_environments and not any(
+            evaluate_lock_marker(marker, environment, extras, dependency_groups) for marker in supported_environments
+        ):
+            message = "The lockfile does not support the environment"
+            raise ValueError(message)
+
+        requires_python = self.data.get("requires-python", "")
+        if requires_python and "python_full_version" in environment:
+            from packaging.specifiers import SpecifierSet
+
+            if not SpecifierSet(requires_python).contains(environment["python_full_version"], prereleases=True):
+                message = f"The lockfile requires Python {requires_python}"
+                raise ValueError(message)
+
+        selected: dict[str, LockedPackage] = {}
+        for package in self.packages:
+            if package.marker and not evaluate_lock_marker(package.marker, environment, extras, dependency_groups):
+                continue
+
+            if package.name in selected:
+                message = f"The lockfile selects more than one entry for package: {package.name}"
+                raise ValueError(message)
+
+            selected[package.name] = package
+
+        return list(selected.values())
+
+    def compute_delta(
+        self,
+        distributions: InstalledDistributions,
+        *,
+        extras: Iterable[str] = (),
+        dependency_groups: Iterable[str] = (),
+        preserve: Iterable[str] = (),
+        remove_extraneous: bool = True,
+    ) -> LockDelta:
+        packages = self.select(distributions.environment, extras=extras, dependency_groups=dependency_groups)
+        installed = distributions.installed()
+
+        delta = LockDelta()
+        for package in packages:
+            distribution = installed.get(package.name)
+            if distribution is None:
+                delta.add.append(package)
+            elif not package.matches(distribution):
+                delta.upgrade.append(package)
+
+        if remove_extraneous:
+            locked = {package.name for package in packages}
+            preserved = PRESERVED_DISTRIBUTIONS.union(_normalize_name(name) for name in preserve)
+            delta.remove.extend(sorted(name for name in installed if name not in locked and name not in preserved))
+
+        return delta
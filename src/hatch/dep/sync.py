@@ -7,35 +7,111 @@ from typing import TYPE_CHECKING
 
 from packaging.markers import default_environment
 
-from hatch.dep.core import Dependency
+from hatch.dep.core import Dependency, evaluate_marker, freeze_environment, get_dependency
 from hatch.utils.fs import Path
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+    from hatch.dep.vcs import RevisionResolver
 
 
 class InstalledDistributions:
-    def __init__(self, *, sys_path: list[str] | None = None, environment: dict[str, str] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        sys_path: list[str] | None = None,
+        environment: dict[str, str] | None = None,
+        revision_resolver: RevisionResolver | None = None,
+    ) -> None:
         self.__sys_path: list[str] = sys.path if sys_path is None else sys_path
         self.__environment: dict[str, str] = (
             default_environment() if environment is None else environment  # type: ignore[assignment]
         )
+        self.__frozen_environment = freeze_environment(self.__environment)
         self.__resolver = Distribution.discover(context=DistributionFinder.Context(path=self.__sys_path))
         self.__distributions: dict[str, Distribution] = {}
         self.__search_exhausted = False
         self.__canonical_regex = re.compile(r"[-_.]+")
+        self.__revision_resolver = revision_resolver
+
+    @property
+    def environment(self) -> dict[str, str]:
+        return self.__environment
+
+    @property
+    def revision_resolver(self) -> RevisionResolver:
+        if self.__revision_resolver is None:
+            from hatch.dep.vcs import RevisionResolver
+
+            self.__revision_resolver = RevisionResolver()
+
+        return self.__revision_resolver
 
     def dependencies_in_sync(self, dependencies: list[Dependency]) -> bool:
+        self.resolve_remote_revisions(dependencies)
         return all(self.dependency_in_sync(dependency) for dependency in dependencies)
 
     def missing_dependencies(self, dependencies: Sequence[Dependency]) -> list[Dependency]:
+        self.resolve_remote_revisions(dependencies)
         return [dependency for dependency in dependencies if not self.dependency_in_sync(dependency)]
 
+    def resolve_remote_revisions(self, dependencies: Iterable[Dependency]) -> None:
+        """
+        Query the remotes of all installed VCS dependencies that are not pinned to a commit at once, rather than
+        one after the other while checking each dependency.
+        """
+        remotes = []
+        for dependency in dependencies:
+            if not dependency.url or (
+                dependency.marker and not evaluate_marker(dependency.marker, self.__frozen_environment)
+            ):
+                continue
+
+            distribution = self[dependency.name]
+            if distribution is None:
+                continue
+
+            remote = self.get_unpinned_remote(dependency, distribution)
+            if remote is not None:
+                remotes.append(remote)
+
+        if remotes:
+            self.revision_resolver.resolve(remotes)
+
+    @staticmethod
+    def get_unpinned_remote(dependency: Dependency, distribution: Distribution) -> tuple[str, str, str] | None:
+        """
+        Returns the `(vcs, url, revision)` remote of an installed VCS dependency if the dependency refers to a
+        branch, tag or the default branch of the same repository rather than the installed commit.
+        """
+        direct_url_file = distribution.read_text("direct_url.json")
+        if direct_url_file is None:
+            return None
+
+        import json
+
+        direct_url_data = json.loads(direct_url_file)
+        if "vcs_info" not in direct_url_data:
+            return None
+
+        url = direct_url_data["url"]
+        vcs_info = direct_url_data["vcs_info"]
+        vcs = vcs_info["vcs"]
+        requested_revision = vcs_info.get("requested_revision")
+        if dependency.url not in {f"{vcs}+{url}", f"{vcs}+{url}@{requested_revision}"}:
+            return None
+
+        return vcs, url, requested_revision or ""
+
     def dependency_in_sync(self, dependency: Dependency, *, environment: dict[str, str] | None = None) -> bool:
         if environment is None:
             environment = self.__environment
+            frozen_environment = self.__frozen_environment
+        else:
+            frozen_environment = freeze_environment(environment)
 
-        if dependency.marker and not dependency.marker.evaluate(environment):
+        if dependency.marker and not evaluate_marker(dependency.marker, frozen_environment):
             return True
 
         distribution = self[dependency.name]
@@ -51,7 +127,7 @@ class InstalledDistributions:
             available_extras: list[str] = distribution.metadata.get_all("Provides-Extra", [])
 
             for dependency_string in transitive_dependencies:
-                transitive_dependency = Dependency(dependency_string)
+                transitive_dependency = get_dependency(dependency_string)
                 if not transitive_dependency.marker:
                     continue
 
@@ -104,21 +180,9 @@ class InstalledDistributions:
                 ) or dependency.url == f"{vcs}+{url}@{commit_id}":
                     return True
 
-                if dependency.url in {f"{vcs}+{url}", f"{vcs}+{url}@{requested_revision}"}:
-                    import subprocess
-
-                    if vcs == "git":
-                        vcs_cmd = [vcs, "ls-remote", url]
-                        if requested_revision:
-                            vcs_cmd.append(requested_revision)
-                    # TODO: add elifs for hg, svn, and bzr https://github.com/pypa/hatch/issues/760
-                    else:
-                        return False
-                    result = subprocess.run(vcs_cmd, capture_output=True, text=True)  # noqa: PLW1510
-                    if result.returncode or not result.stdout.strip():
-                        return False
-                    latest_commit_id, *_ = result.stdout.split()
-                    return commit_id == latest_commit_id
+                remote = self.get_unpinned_remote(dependency, distribution)
+                if remote is not None:
+                    return commit_id == self.revision_resolver.get(*remote)
 
                 return False
 
@@ -147,6 +211,22 @@ class InstalledDistributions:
 
         return None
 
+    def installed(self) -> dict[str, Distribution]:
+        """
+        Returns every installed distribution keyed by its normalized name.
+        """
+        if not self.__search_exhausted:
+            for distribution in self.__resolver:
+                name = distribution.metadata["Name"]
+                if name is None:
+                    continue
+
+                self.__distributions.setdefault(self.__canonical_regex.sub("-", name).lower(), distribution)
+
+            self.__search_exhausted = True
+
+        return dict(self.__distributions)
+
 
 def dependencies_in_sync(
     dependencies: list[Dependency], sys_path: list[str] | None = None, environment: dict[str, str] | None = None
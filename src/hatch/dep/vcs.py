@@ -0,0 +1,201 @@
+"""
+Resolve the commits that VCS remotes currently point to, which determines whether dependencies on a
+VCS branch or tag, rather than a commit, are in sync.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from hatch.cli.application import Application
+    from hatch.utils.fs import Path
+
+# Remote revisions rarely change between consecutive commands, so checks are skipped for this many seconds
+DEFAULT_TTL = 300
+# Remotes that do not respond within this many seconds, such as unreachable hosts, are treated as unresolved
+DEFAULT_TIMEOUT = 30
+MAX_WORKERS = 8
+
+RemoteRevision = tuple[str, str, str]
+
+
+def get_remote_command(vcs: str, url: str, revision: str) -> list[str] | None:
+    if vcs == "git":
+        command = ["git", "ls-remote", url]
+        if revision:
+            command.append(revision)
+    elif vcs == "hg":
+        command = ["hg", "--noninteractive", "identify", "--debug", "--id", url]
+        if revision:
+            command.extend(["--rev", revision])
+    elif vcs == "svn":
+        command = [
+            "svn",
+            "info",
+            "--non-interactive",
+            "--show-item",
+            "revision",
+            f"{url}@{revision}" if revision else url,
+        ]
+    elif vcs == "bzr":
+        command = ["bzr", "revision-info", "--directory", url]
+        if revision:
+            command.extend(["--revision", revision])
+    else:
+        return None
+
+    return command
+
+
+def parse_remote_output(vcs: str, output: str) -> str | None:
+    fields = output.split()
+    if not fields:
+        return None
+
+    # Mercurial marks working directories with uncommitted changes but that never applies to remotes
+    return fields[0].rstrip("+") if vcs == "hg" else fields[0]
+
+
+class RevisionResolver:
+    """
+    Resolves `(vcs, url, revision)` remotes to the commit they point to. Remotes are queried concurrently,
+    without prompting for credentials and for at most `timeout` seconds each, and results are kept in memory
+    and, if a cache directory is given, on disk for `ttl` seconds.
+    """
+
+    def __init__(
+        self, *, cache_dir: Path | None = None, ttl: float = DEFAULT_TTL, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.timeout = timeout
+        self.__resolved: dict[RemoteRevision, str | None] = {}
+
+    def get(self, vcs: str, url: str, revision: str = "") -> str | None:
+        remote = (vcs, url, revision or "")
+        if remote not in self.__resolved:
+            self.resolve([remote])
+
+        return self.__resolved[remote]
+
+    def resolve(self, remotes: Iterable[RemoteRevision]) -> dict[RemoteRevision, str | None]:
+        pending = []
+        for vcs, url, revision in dict.fromkeys(remotes):
+            remote = (vcs, url, revision or "")
+            if remote in self.__resolved:
+                continue
+
+            commit_id = self._read_cache(remote)
+            if commit_id is None:
+                pending.append(remote)
+            else:
+                self.__resolved[remote] = commit_id
+
+        if len(pending) == 1:
+            self.__resolved[pending[0]] = self._query(pending[0])
+        elif pending:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(len(pending), MAX_WORKERS)) as executor:
+                for remote, commit_id in zip(pending, executor.map(self._query, pending), strict=True):
+                    self.__resolved[remote] = commit_id
+
+        for remote in pending:
+            commit_id = self.__resolved[remote]
+            # Failures are not persisted as they are usually caused by transient network issues
+            if commit_id is not None:
+                self._write_cache(remote, commit_id)
+
+        return dict(self.__resolved)
+
+    def _query(self, remote: RemoteRevision) -> str | None:
+        import os
+        import subprocess
+
+        vcs, url, revision = remote
+        command = get_remote_command(vcs, url, revision)
+        if command is None:
+            return None
+
+        try:
+            result = subprocess.run(  # noqa: PLW1510
+                command,
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                timeout=self.timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+        if result.returncode:
+            return None
+
+        return parse_remote_output(vcs, result.stdout)
+
+    def _cache_file(self, remote: RemoteRevision) -> Path | None:
+        if self.cache_dir is None or self.ttl <= 0:
+            return None
+
+        from hashlib import sha256
+
+        return self.cache_dir / f"{sha256(json.dumps(remote).encode('utf-8')).hexdigest()[:32]}.json"
+
+    def _read_cache(self, remote: RemoteRevision) -> str | None:
+        cache_file = self._cache_file(remote)
+        if cache_file is None:
+            return None
+
+        try:
+            data = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if tuple(data.get("remote", ())) != remote or time.time() - data.get("time", 0) > self.ttl:
+            return None
+
+        return data.get("commit_id")
+
+    def _write_cache(self, remote: RemoteRevision, commit_id: str) -> None:
+        cache_file = self._cache_file(remote)
+        if cache_file is None:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"remote": remote, "commit_id": commit_id, "time": time.time()}))
+        except OSError:
+            pass
+
+
+def get_seconds(env_var: str, default: float) -> float:
+    import os
+
+    value = os.environ.get(env_var, "")
+    try:
+        return float(value) if value else default
+    except ValueError:
+        message = f"Environment variable `{env_var}` must be a number of seconds: {value}"
+        raise ValueError(message) from None
+
+
+def get_revision_resolver(app: Application) -> RevisionResolver:
+    """
+    Returns a resolver that persists results in the cache directory of the application for the number of
+    seconds set by the `HATCH_VCS_REVISION_TTL` environment variable, where `0` disables persistence, and
+    waits for remotes for the number of seconds set by the `HATCH_VCS_REVISION_TIMEOUT` environment variable.
+    """
+    from hatch.config.constants import AppEnvVars
+
+    ttl = get_seconds(AppEnvVars.VCS_REVISION_TTL, DEFAULT_TTL)
+    timeout = get_seconds(AppEnvVars.VCS_REVISION_TIMEOUT, DEFAULT_TIMEOUT)
+
+    # Applications that are not fully initialized, like those of plugins, have no cache directory
+    cache_dir = getattr(app, "cache_dir", None)
+    return RevisionResolver(cache_dir=None if cache_dir is None else cache_dir / "vcs", ttl=ttl, timeout=timeout)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from hatch.dep.core import Dependency
+
+
+class InstallationPlan:
+    """
+    Accumulates everything an environment installs into the arguments of a single installer transaction. Each
+    distribution is only planned once, by the first entry that refers to it.
+    """
+
+    def __init__(self) -> None:
+        self.__options: list[str] = []
+        self.__local: list[str] = []
+        self.__requirements: list[str] = []
+        self.__editables: list[str] = []
+        self.__names: set[str] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.__local or self.__requirements or self.__editables)
+
+    def add_options(self, options: Iterable[str]) -> None:
+        self.__options.extend(options)
+
+    def add_local(self, name: str, path: str, *, editable: bool) -> None:
+        """
+        Plans the installation of the local project `name` at `path`, which may refer to features.
+        """
+        if not self.__claim(name):
+            return
+
+        if editable:
+            self.__local.extend(["--editable", path])
+        else:
+            self.__local.append(path)
+
+    def add_dependency(self, dependency: Dependency) -> None:
+        if not self.__claim(dependency.name):
+            return
+
+        if dependency.editable and dependency.path is not None:
+            self.__editables.extend(["--editable", str(dependency.path)])
+        else:
+            self.__requirements.append(str(dependency))
+
+    def get_install_args(self) -> list[str]:
+        return [*self.__options, *self.__local, *self.__requirements, *self.__editables]
+
+    def __claim(self, name: str) -> bool:
+        from hatchling.metadata.utils import normalize_project_name
+
+        normalized_name = normalize_project_name(name)
+        if normalized_name in self.__names:
+            return False
+
+        self.__names.add(normalized_name)
+        return True
@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from hatch.dep.pylock import LockDelta
+    from hatch.dep.sync import InstalledDistributions
     from hatch.env.lockers.interface import LockerInterface
     from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.project.core import Project
@@ -214,6 +216,96 @@ def apply_lockfile_to_environment(environment: EnvironmentInterface, lock_path:
     apply_lock_with_locker(environment, path)
 
 
+def get_installed_distributions(environment: EnvironmentInterface) -> InstalledDistributions | None:
+    """Index of the distributions installed in ``environment``, or ``None`` if it cannot be inspected."""
+    from hatch.dep.sync import InstalledDistributions
+    from hatch.env.system import SystemEnvironment
+    from hatch.env.virtual import VirtualEnvironment
+
+    if isinstance(environment, VirtualEnvironment):
+        python_info = environment.virtual_env.python_info
+    elif isinstance(environment, SystemEnvironment):
+        python_info = environment.python_info
+    else:
+        return None
+
+    return InstalledDistributions(sys_path=python_info.sys_path, environment=python_info.environment)
+
+
+def get_lock_delta(environment: EnvironmentInterface, lock_path: Path) -> LockDelta:
+    """
+    Read the lockfile natively and compute what must be added, upgraded and removed so that ``environment``
+    matches it. Raises ``ValueError`` for lockfiles that cannot be interpreted.
+    """
+    from hatch.dep.pylock import Pylock
+
+    distributions = get_installed_distributions(environment)
+    if distributions is None:
+        message = "Unable to inspect the installed distributions of the environment"
+        raise ValueError(message)
+
+    return Pylock.from_path(lock_path).compute_delta(
+        distributions,
+        extras=environment.features,
+        dependency_groups=environment.dependency_groups,
+        # The project and workspace members are installed separately from the lockfile
+        preserve=[dependency.name for dependency in environment.local_dependencies_complex],
+        # Distributions that are inherited from the base interpreter cannot be uninstalled
+        remove_extraneous=not environment.config.get("system-packages", False),
+    )
+
+
+def apply_lock_delta(environment: EnvironmentInterface, delta: LockDelta) -> None:
+    """Hand only the changes in ``delta`` to the installer of ``environment``."""
+    if delta.in_sync:
+        return
+
+    with environment.command_context():
+        changed = [package.name for package in delta.upgrade]
+        # Upgraded packages are uninstalled first so that changes of source at the same version take effect
+        if delta.remove or changed:
+            environment.platform.check_command(environment.construct_pip_uninstall_command([*delta.remove, *changed]))
+
+        packages = [*delta.add, *delta.upgrade]
+        if not packages:
+            return
+
+        # Installers verify hashes of all requirements in a file once any has one
+        hashed = [package for package in packages if package.hashable]
+        unhashed = [package for package in packages if not package.hashable]
+        source_args = environment.get_source_install_args(environment.dependencies_complex)
+
+        if hashed:
+            import tempfile
+
+            from hatch.utils.fs import Path
+
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, encoding="utf-8") as f:
+                for package in hashed:
+                    f.write(" ".join([*package.install_args, *(f"--hash={entry}" for entry in package.hashes)]))
+                    f.write("\n")
+                requirements_file = Path(f.name)
+
+            try:
+                environment.platform.check_command(
+                    environment.construct_pip_install_command([
+                        *source_args,
+                        "--no-deps",
+                        "-r",
+                        str(requirements_file),
+                    ])
+                )
+            finally:
+                requirements_file.unlink(missing_ok=True)
+
+        if unhashed:
+            install_args = [*source_args, "--no-deps"]
+            for package in unhashed:
+                install_args.extend(package.install_args)
+
+            environment.platform.check_command(environment.construct_pip_install_command(install_args))
+
+
 def merge_environment_lock_inputs(
     project: Project,
     env_names: list[str],
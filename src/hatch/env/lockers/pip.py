@@ -99,16 +99,21 @@ class PipLocker(LockerInterface):
         return existing == fresh
 
     @classmethod
-    def apply_lock(cls, _environment: EnvironmentInterface, _lock_path: Path) -> None:
-        from hatch.env.lock import LockerUnsupportedError
+    def apply_lock(cls, environment: EnvironmentInterface, lock_path: Path) -> None:
+        from hatch.env.lock import LockerUnsupportedError, apply_lock_delta, get_lock_delta
 
-        message = (
-            "Applying lockfiles with the pip locker is not yet supported. "
-            'Use `installer = "uv"` (or `locker = "uv"`) for locked sync.'
-        )
-        raise LockerUnsupportedError(cls.PLUGIN_NAME, detail=message)
+        try:
+            delta = get_lock_delta(environment, lock_path)
+        except ValueError as e:
+            raise LockerUnsupportedError(cls.PLUGIN_NAME, detail=str(e)) from None
+
+        apply_lock_delta(environment, delta)
 
     @classmethod
-    def install_matches_lock(cls, _environment: EnvironmentInterface, _lock_path: Path) -> bool:
-        # We cannot verify lock conformance for pip because apply_lock is unsupported.
-        return False
+    def install_matches_lock(cls, environment: EnvironmentInterface, lock_path: Path) -> bool:
+        from hatch.env.lock import get_lock_delta
+
+        try:
+            return get_lock_delta(environment, lock_path).in_sync
+        except ValueError:
+            return False
@@ -149,22 +149,35 @@ class UvLocker(LockerInterface):
 
     @classmethod
     def apply_lock(cls, environment: EnvironmentInterface, lock_path: Path) -> None:
+        from hatch.env.lock import apply_lock_delta, get_lock_delta
         from hatch.env.virtual import VirtualEnvironment
 
         if not isinstance(environment, VirtualEnvironment):
             message = "UvLocker.apply_lock requires a virtual environment"
             raise TypeError(message)
 
-        with environment.command_context():
-            environment.platform.check_command(environment.uv_pip_sync_command(lock_path))
+        try:
+            delta = get_lock_delta(environment, lock_path)
+        except ValueError:
+            # Let UV interpret lockfiles that cannot be read natively
+            with environment.command_context():
+                environment.platform.check_command(environment.uv_pip_sync_command(lock_path))
+        else:
+            apply_lock_delta(environment, delta)
 
     @classmethod
     def install_matches_lock(cls, environment: EnvironmentInterface, lock_path: Path) -> bool:
+        from hatch.env.lock import get_lock_delta
         from hatch.env.virtual import VirtualEnvironment
 
         if not isinstance(environment, VirtualEnvironment):
             return True
 
+        try:
+            return get_lock_delta(environment, lock_path).in_sync
+        except ValueError:
+            pass
+
         completed = environment.platform.run_command(
             environment.uv_pip_sync_command(lock_path, dry_run=True),
             capture_output=True,
@@ -299,7 +299,7 @@ class EnvironmentInterface(ABC):
     @cached_property
     def environment_dependencies_complex(self) -> tuple[Dependency, ...]:
         """Dependencies declared in the environment's own ``dependencies`` and ``extra-dependencies`` config fields."""
-        from hatch.dep.core import Dependency, InvalidDependencyError
+        from hatch.dep.core import InvalidDependencyError, get_dependency
         from hatch.project.sources import decorate_dependencies
 
         dependencies_complex: list[Dependency] = []
@@ -316,7 +316,7 @@ class EnvironmentInterface(ABC):
                         raise TypeError(message)
 
                     try:
-                        dependencies_complex.append(Dependency(self.metadata.context.format(entry)))
+                        dependencies_complex.append(get_dependency(self.metadata.context.format(entry)))
                     except InvalidDependencyError as e:
                         message = f"Dependency #{i} of field `tool.hatch.envs.{self.name}.{option}` is invalid: {e}"
                         raise ValueError(message) from None
@@ -339,12 +339,12 @@ class EnvironmentInterface(ABC):
         if self.skip_install and not self.features and not self.dependency_groups and not workspace_dependencies:
             return ()
 
-        from hatch.dep.core import Dependency
+        from hatch.dep.core import get_dependency
         from hatch.project.sources import decorate_dependencies
         from hatch.utils.dep import get_complex_dependency_group, resolve_extras
         from hatchling.metadata.utils import normalize_project_name
 
-        all_dependencies_complex = list(map(Dependency, workspace_dependencies))
+        all_dependencies_complex = list(map(get_dependency, workspace_dependencies))
         dependencies, optional_dependencies = self.app.project.get_dependencies()
 
         with self.apply_context():
@@ -368,7 +368,7 @@ class EnvironmentInterface(ABC):
         local_projects = {self.metadata.name: formatted_optional_dependencies}
         all_dep_strings = formatted_dependencies + feature_refs if not self.skip_install else feature_refs
         resolved = resolve_extras(all_dep_strings, local_projects, warn=self.app.display_warning)
-        all_dependencies_complex.extend(Dependency(d) for d in resolved)
+        all_dependencies_complex.extend(map(get_dependency, resolved))
 
         for dependency_group in self.dependency_groups:
             all_dependencies_complex.extend(
@@ -392,16 +392,16 @@ class EnvironmentInterface(ABC):
     @cached_property
     def local_dependencies_complex(self) -> tuple[Dependency, ...]:
         """Editable install entries for the root project and workspace members (file:// URLs)."""
-        from hatch.dep.core import Dependency
+        from hatch.dep.core import get_dependency
 
         local_dependencies_complex = []
         if not self.skip_install:
             local_dependencies_complex.append(
-                Dependency(f"{self.metadata.name} @ {self.root.as_uri()}", editable=self.dev_mode)
+                get_dependency(f"{self.metadata.name} @ {self.root.as_uri()}", editable=self.dev_mode)
             )
         if self.workspace.members:
             local_dependencies_complex.extend(
-                Dependency(f"{member.project.metadata.name} @ {member.project.location.as_uri()}", editable=True)
+                get_dependency(f"{member.project.metadata.name} @ {member.project.location.as_uri()}", editable=True)
                 for member in self.workspace.members
             )
 
@@ -410,7 +410,7 @@ class EnvironmentInterface(ABC):
     @cached_property
     def dependencies_complex(self) -> tuple[Dependency, ...]:
         """Union of environment, project, and build dependencies before extras expansion on local projects."""
-        from hatch.dep.core import Dependency
+        from hatch.dep.core import Dependency, get_dependency
         from hatch.project.sources import decorate_dependencies
 
         all_dependencies_complex = list(self.environment_dependencies_complex)
@@ -421,7 +421,7 @@ class EnvironmentInterface(ABC):
             if isinstance(dep, Dependency):
                 additional_deps.append(dep)
             else:
-                additional_deps.append(Dependency(str(dep)))
+                additional_deps.append(get_dependency(str(dep)))
         all_dependencies_complex.extend(
             decorate_dependencies(additional_deps, self.sources, str(self.root), self.source_workspace_members)
         )
@@ -444,11 +444,11 @@ class EnvironmentInterface(ABC):
                 if isinstance(req, Dependency):
                     all_dependencies_complex.append(req)
                 else:
-                    all_dependencies_complex.append(Dependency(str(req)))
+                    all_dependencies_complex.append(get_dependency(str(req)))
 
             for target in os.environ.get(BuildEnvVars.REQUESTED_TARGETS, "").split():
                 target_config = self.app.project.config.build.target(target)
-                all_dependencies_complex.extend(map(Dependency, target_config.dependencies))
+                all_dependencies_complex.extend(map(get_dependency, target_config.dependencies))
 
             return tuple(all_dependencies_complex)
 
@@ -472,7 +472,7 @@ class EnvironmentInterface(ABC):
     @cached_property
     def all_dependencies_complex(self) -> tuple[Dependency, ...]:
         """Final resolved set: local installs + all non-local deps after expanding extras on local project references."""
-        from hatch.dep.core import Dependency
+        from hatch.dep.core import get_dependency
         from hatch.utils.dep import resolve_extras
         from hatchling.metadata.utils import normalize_project_name
 
@@ -487,10 +487,8 @@ class EnvironmentInterface(ABC):
 
         dep_strs = [str(d) for d in self.dependencies_complex]
         if self.metadata.name in local_projects:
-            from packaging.requirements import Requirement
-
             needs_root = any(
-                normalize_project_name(Requirement(d).name) == self.metadata.name and Requirement(d).extras
+                normalize_project_name(get_dependency(d).name) == self.metadata.name and get_dependency(d).extras
                 for d in dep_strs
             )
             if needs_root:
@@ -503,7 +501,7 @@ class EnvironmentInterface(ABC):
 
         external_deps = resolve_extras(dep_strs, local_projects, warn=self.app.display_warning)
 
-        return tuple(local_deps + [Dependency(d) for d in external_deps])
+        return tuple(local_deps + [get_dependency(d) for d in external_deps])
 
     @cached_property
     def all_dependencies(self) -> list[str]:
@@ -592,6 +590,67 @@ class EnvironmentInterface(ABC):
 
         return builder
 
+    @cached_property
+    def shared(self) -> bool:
+        """
+        ```toml config-example
+        [tool.hatch.envs.<ENV_NAME>]
+        shared = ...
+        ```
+        """
+        shared = self.config.get("shared", False)
+        if not isinstance(shared, bool):
+            message = f"Field `tool.hatch.envs.{self.name}.shared` must be a boolean"
+            raise TypeError(message)
+
+        return shared
+
+    @property
+    def offline(self) -> bool:
+        """
+        Whether the environment installs distributions without network access, such as only from the
+        wheelhouse populated by the [`env fetch`](../../cli/reference.md#hatch-env-fetch) command, in which
+        case existing lockfiles are used as is rather than resolved again. The default implementation
+        returns `False`.
+        """
+        return False
+
+    @cached_property
+    def store_key(self) -> str:
+        """
+        The key of the content-addressed store entry that this environment occupies, or an empty string
+        if the environment is not [shared](../../config/environment/overview.md#shared). Only environments
+        that [skip installation](../../config/environment/overview.md#skip-install) of the project and are not
+        used as builders are eligible.
+
+        The key is derived from the
+        [store identity](reference.md#hatch.env.plugin.interface.EnvironmentInterface.get_store_identity)
+        and either the digest of the lockfile, if the environment is locked, or the
+        [dependency hash](reference.md#hatch.env.plugin.interface.EnvironmentInterface.dependency_hash).
+        """
+        if not self.shared or not self.skip_install or self.builder:
+            return ""
+
+        identity = self.get_store_identity()
+        if identity is None:
+            return ""
+
+        import json
+        from hashlib import sha256
+
+        from hatch.env.lock import resolve_lockfile_path
+
+        lockfile_path = resolve_lockfile_path(self)
+        if self.locked and lockfile_path.is_file():
+            dependencies = f"lock:{sha256(lockfile_path.read_bytes()).hexdigest()}"
+        else:
+            dependencies = f"dependencies:{self.dependency_hash()}"
+
+        data = json.dumps(
+            {"type": self.PLUGIN_NAME, "identity": identity, "dependencies": dependencies}, sort_keys=True
+        )
+        return sha256(data.encode("utf-8")).hexdigest()[:32]
+
     @cached_property
     def features(self) -> tuple[str, ...]:
         from hatch.utils.metadata import normalize_project_name
@@ -854,6 +913,23 @@ class EnvironmentInterface(ABC):
         in the environment.
         """
 
+    def install_project_with_dependencies(self) -> bool:  # noqa: PLR6301
+        """
+        This may install the project, in [dev mode](../../config/environment/overview.md#dev-mode) if enabled,
+        together with the missing
+        [dependencies](reference.md#hatch.env.plugin.interface.EnvironmentInterface.dependencies)
+        in a single transaction of the installer and return `True`, such that the environment is only resolved and
+        inspected once when it is created.
+
+        By default, this returns `False` and the project is installed with
+        [install_project](reference.md#hatch.env.plugin.interface.EnvironmentInterface.install_project) or
+        [install_project_dev_mode](reference.md#hatch.env.plugin.interface.EnvironmentInterface.install_project_dev_mode)
+        before dependencies are
+        [synchronized](reference.md#hatch.env.plugin.interface.EnvironmentInterface.sync_dependencies)
+        separately.
+        """
+        return False
+
     def dependency_hash(self):
         """
         This should return a hash of the environment's
@@ -971,6 +1047,25 @@ class EnvironmentInterface(ABC):
         kwargs.setdefault("shell", True)
         return self.platform.run_command(command, **kwargs)
 
+    def exit_with_shell_command(self, command: str):
+        """
+        Run a shell command as the last action of the process and exit with its exit code. This will always be
+        called when the
+        [command_context](reference.md#hatch.env.plugin.interface.EnvironmentInterface.command_context)
+        is active, with the expectation of providing the same guarantee.
+
+        The default implementation uses
+        [run_shell_command](reference.md#hatch.env.plugin.interface.EnvironmentInterface.run_shell_command).
+        Environments that run commands on the host may instead replace the current process so that Hatch does not
+        remain resident for the lifetime of the command. In that case no context manager that is active, including
+        the [command_context](reference.md#hatch.env.plugin.interface.EnvironmentInterface.command_context), is
+        exited, so any cleanup that they perform is skipped.
+        """
+        with self.platform.ignore_interrupts():
+            process = self.run_shell_command(command)
+
+        self.platform.exit_with_code(process.returncode)
+
     @contextmanager
     def command_context(self):
         """
@@ -1022,6 +1117,20 @@ class EnvironmentInterface(ABC):
         command.extend(args)
         return command
 
+    def construct_pip_uninstall_command(self, names: list[str]):
+        """
+        A convenience method for constructing a [`pip uninstall`](https://pip.pypa.io/en/stable/cli/pip_uninstall/)
+        command for the given distributions with the given verbosity. The default verbosity is set to one less
+        than Hatch's verbosity.
+        """
+        command = ["python", "-u", "-m", "pip", "uninstall", "--yes", "--disable-pip-version-check"]
+
+        # Default to -1 verbosity
+        add_verbosity_flag(command, self.verbosity, adjustment=-1)
+
+        command.extend(names)
+        return command
+
     def get_source_install_args(self, dependencies: Sequence[Dependency]) -> list[str]:
         """
         Returns global installer flags derived from the
@@ -1089,6 +1198,16 @@ class EnvironmentInterface(ABC):
 
         return EnvironmentContextFormatter(self)
 
+    def get_store_identity(self) -> dict[str, Any] | None:  # noqa: PLR6301
+        """
+        Returns a JSON-serializable mapping of everything other than dependencies that determines the contents
+        of the environment, such as the interpreter and the installer, for use in the
+        [store key](reference.md#hatch.env.plugin.interface.EnvironmentInterface.store_key). Returning `None`,
+        the default, indicates that the environment type does not support
+        [sharing](../../config/environment/overview.md#shared).
+        """
+        return None
+
     @staticmethod
     def get_option_types() -> dict:
         """
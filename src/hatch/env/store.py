@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.utils.fs import Path
+
+STORE_DIRECTORY_NAME = ".store"
+# The default combined size of cached script environments, in megabytes
+DEFAULT_SCRIPT_CACHE_SIZE = 5120
+
+
+class EnvironmentStore:
+    """
+    Content-addressed storage of shared environments.
+
+    Every environment type keeps its entries in a `.store` directory inside of its isolated data
+    directory. Entries are reference counted by the metadata that each project records for the
+    environments it uses, see `EnvironmentMetadata`.
+    """
+
+    def __init__(self, env_data_dir: Path):
+        self.__env_data_dir = env_data_dir
+
+    @property
+    def metadata_dir(self) -> Path:
+        return self.__env_data_dir / ".metadata"
+
+    def references(self) -> dict[str, list[Path]]:
+        """
+        Returns a mapping of store keys to the metadata files of live references, which are those of projects
+        that exist on disk.
+        """
+        return self.__scan_references()[0]
+
+    def dead_references(self) -> list[Path]:
+        """
+        Returns the metadata files of references of projects that do not exist on disk, which may only be
+        unavailable for now, such as those on drives that are not mounted.
+        """
+        return self.__scan_references()[1]
+
+    def __scan_references(self) -> tuple[dict[str, list[Path]], list[Path]]:
+        import json
+
+        from hatch.utils.fs import Path
+
+        references: dict[str, list[Path]] = {}
+        dead_references: list[Path] = []
+        if not self.metadata_dir.is_dir():
+            return references, dead_references
+
+        for metadata_file in sorted(self.metadata_dir.rglob("*.json")):
+            try:
+                metadata = json.loads(metadata_file.read_text())
+            except (OSError, ValueError):
+                continue
+
+            store_key = metadata.get("store_key")
+            if not store_key:
+                continue
+
+            project = metadata.get("project", "")
+            if not project or not Path(project).exists():
+                dead_references.append(metadata_file)
+                continue
+
+            references.setdefault(store_key, []).append(metadata_file)
+
+        return references, dead_references
+
+    def is_referenced(self, environment: EnvironmentInterface) -> bool:
+        return bool(environment.store_key) and environment.store_key in self.references()
+
+    def entries(self) -> list[Path]:
+        if not self.__env_data_dir.is_dir():
+            return []
+
+        # Internal environments that are isolated by default have one more level of nesting
+        patterns = (f"*/{STORE_DIRECTORY_NAME}/*", f".internal/*/{STORE_DIRECTORY_NAME}/*")
+        return sorted(
+            entry
+            for pattern in patterns
+            for entry in self.__env_data_dir.glob(pattern)
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+
+    def unreferenced_entries(self) -> list[Path]:
+        """
+        Returns every store entry that is no longer referenced by any project and may therefore be removed.
+        """
+        references = self.references()
+        return [entry for entry in self.entries() if entry.name not in references]
+
+
+@dataclass(frozen=True)
+class ScriptCacheEntry:
+    key: str
+    path: Path
+    # Size in bytes, measured the first time the cache is pruned after the environment is created
+    size: int | None
+    # Seconds since the epoch of the last time the environment was used
+    last_used: float
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class ScriptCache:
+    """
+    Environments of scripts with inline metadata, keyed by everything that determines their contents such that
+    scripts with the same dependencies, interpreter and installer share one. Every entry has a record beside
+    it whose modification time is the last time the entry was used, which determines the order of eviction
+    once the combined size of all entries exceeds the limit.
+    """
+
+    def __init__(self, directory: Path, *, max_size: int | None = None):
+        self.directory = directory
+        self.__max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum combined size of all entries in bytes, where `0` means there is no limit.
+        """
+        if self.__max_size is None:
+            self.__max_size = get_script_cache_size()
+
+        return self.__max_size
+
+    def add(self, key: str, data: dict[str, Any]) -> None:
+        import json
+
+        self.directory.ensure_dir_exists()
+        self._record_file(key).write_text(json.dumps({"data": data}))
+
+    def touch(self, key: str) -> None:
+        import os
+        from contextlib import suppress
+
+        with suppress(OSError):
+            os.utime(self._record_file(key))
+
+    def forget(self, key: str) -> None:
+        self._record_file(key).unlink(missing_ok=True)
+
+    def entries(self) -> list[ScriptCacheEntry]:
+        """
+        Returns every entry, most recently used first.
+        """
+        import json
+
+        if not self.directory.is_dir():
+            return []
+
+        entries = []
+        for path in self.directory.iterdir():
+            if not path.is_dir() or path.name.startswith("."):
+                continue
+
+            record_file = self._record_file(path.name)
+            try:
+                record = json.loads(record_file.read_text())
+                last_used = record_file.stat().st_mtime
+            except (OSError, ValueError):
+                # Entries created before records were kept
+                record = {}
+                last_used = path.stat().st_mtime
+
+            entries.append(
+                ScriptCacheEntry(
+                    key=path.name, path=path, size=record.get("size"), last_used=last_used, data=record.get("data", {})
+                )
+            )
+
+        entries.sort(key=lambda entry: entry.last_used, reverse=True)
+        return entries
+
+    def measure(self, entry: ScriptCacheEntry, *, record: bool = True) -> int:
+        """
+        Returns the size of the entry, computing and, unless `record` is false, recording it if necessary.
+        """
+        if entry.size is not None:
+            return entry.size
+
+        import json
+        import os
+
+        size = 0
+        for root, _, files in os.walk(entry.path):
+            for f in files:
+                try:
+                    size += os.lstat(os.path.join(root, f)).st_size
+                except OSError:
+                    continue
+
+        record_file = self._record_file(entry.key)
+        if record and record_file.is_file():
+            # Retain the time of last use
+            last_used = entry.last_used
+            record_file.write_text(json.dumps({"data": entry.data, "size": size}))
+            os.utime(record_file, (last_used, last_used))
+
+        return size
+
+    def prune(self, *, keep: str = "") -> list[ScriptCacheEntry]:
+        """
+        Removes the least recently used entries, other than `keep`, until the combined size of all entries
+        is within the limit. Returns the removed entries.
+        """
+        if not self.max_size:
+            return []
+
+        entries = self.entries()
+        # The kept entry is usually still being populated
+        sizes = {entry.key: self.measure(entry, record=entry.key != keep) for entry in entries}
+        total_size = sum(sizes.values())
+
+        removed = []
+        for entry in reversed(entries):
+            if total_size <= self.max_size:
+                break
+
+            if entry.key == keep:
+                continue
+
+            self.remove(entry)
+            total_size -= sizes[entry.key]
+            removed.append(entry)
+
+        return removed
+
+    def remove(self, entry: ScriptCacheEntry) -> None:
+        from hatch.utils.trash import TRASH_DIRECTORY_NAME, Trash
+
+        Trash(self.directory / TRASH_DIRECTORY_NAME).discard(entry.path)
+        self.forget(entry.key)
+
+    def _record_file(self, key: str) -> Path:
+        return self.directory / f".{key}.json"
+
+
+def get_script_cache_size() -> int:
+    """
+    Returns the maximum combined size in bytes of cached script environments, as set in megabytes by the
+    `HATCH_SCRIPT_CACHE_SIZE` environment variable where `0` disables eviction.
+    """
+    import os
+
+    from hatch.config.constants import AppEnvVars
+
+    size = os.environ.get(AppEnvVars.SCRIPT_CACHE_SIZE, "")
+    try:
+        megabytes = float(size) if size else DEFAULT_SCRIPT_CACHE_SIZE
+    except ValueError:
+        message = f"Environment variable `{AppEnvVars.SCRIPT_CACHE_SIZE}` must be a number of megabytes: {size}"
+        raise ValueError(message) from None
+
+    return int(megabytes * 1024 * 1024)
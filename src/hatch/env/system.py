@@ -38,12 +38,18 @@ class SystemEnvironment(EnvironmentInterface):
             return True
 
         from hatch.dep.sync import InstalledDistributions
+        from hatch.dep.vcs import get_revision_resolver
 
         distributions = InstalledDistributions(
-            sys_path=self.python_info.sys_path, environment=self.python_info.environment
+            sys_path=self.python_info.sys_path,
+            environment=self.python_info.environment,
+            revision_resolver=get_revision_resolver(self.app),
         )
         return distributions.dependencies_in_sync(self.dependencies_complex)
 
+    def exit_with_shell_command(self, command: str):
+        self.platform.exit_with_shell_command(command)
+
     def sync_dependencies(self):
         install_args = list(self.get_source_install_args(self.dependencies_complex))
         install_args.extend(self.dependencies)
@@ -6,7 +6,7 @@ import sysconfig
 from contextlib import contextmanager, nullcontext, suppress
 from functools import cached_property
 from os.path import isabs
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from hatch.config.constants import AppEnvVars
 from hatch.env.plugin.interface import EnvironmentInterface
@@ -14,6 +14,7 @@ from hatch.env.utils import add_verbosity_flag
 from hatch.utils.fs import Path
 from hatch.utils.shells import ShellManager
 from hatch.utils.structures import EnvVars
+from hatch.utils.trash import TRASH_DIRECTORY_NAME, Trash
 from hatch.venv.core import UVVirtualEnv, VirtualEnv
 
 FREETHREADED_BUILD = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
@@ -26,7 +27,10 @@ if TYPE_CHECKING:
 
     from hatch.dep.core import Dependency
     from hatch.dep.sync import InstalledDistributions
+    from hatch.env.install import InstallationPlan
+    from hatch.env.store import ScriptCache
     from hatch.python.core import PythonManager
+    from hatchling.utils.specifiers import VersionRanges
 
 
 class VirtualEnvironment(EnvironmentInterface):
@@ -55,6 +59,8 @@ class VirtualEnvironment(EnvironmentInterface):
         else:
             app_virtual_env_path = self.isolated_data_directory / project_name / project_id / venv_name
 
+        self.script_cache: ScriptCache | None = None
+
         # Explicit path
         chosen_directory = self.get_env_var_option("path") or self.config.get("path", "")
         if chosen_directory:
@@ -63,7 +69,16 @@ class VirtualEnvironment(EnvironmentInterface):
                 Path(chosen_directory) if isabs(chosen_directory) else (self.root / chosen_directory).resolve()
             )
         elif project_is_script:
-            self.storage_path = self.virtual_env_path = self.isolated_data_directory / venv_name
+            from hatch.env.store import ScriptCache
+
+            # Scripts with the same dependencies, interpreter and installer share an environment
+            self.script_cache = ScriptCache(self.isolated_data_directory)
+            self.storage_path = self.isolated_data_directory
+            self.virtual_env_path = self.storage_path / self.script_cache_key
+        # Content-addressed storage shared by every project
+        elif self.store_key:
+            self.storage_path = self.isolated_data_directory / ".store"
+            self.virtual_env_path = self.storage_path / self.store_key
         # Conditions requiring a flat structure
         elif (
             self.data_directory == self.platform.home / ".virtualenvs"
@@ -80,6 +95,8 @@ class VirtualEnvironment(EnvironmentInterface):
         self.build_virtual_env = self.virtual_env_cls(
             app_virtual_env_path.parent / f"{app_virtual_env_path.name}-build", self.platform, self.verbosity
         )
+        # Removed environments are renamed into the trash and deleted in the background
+        self.trash = Trash(self.isolated_data_directory / TRASH_DIRECTORY_NAME)
         self.shells = ShellManager(self)
 
         self._parent_python = None
@@ -96,6 +113,28 @@ class VirtualEnvironment(EnvironmentInterface):
     def explicit_uv_path(self) -> str:
         return self.get_env_var_option("uv_path") or self.config.get("uv-path", "")
 
+    @cached_property
+    def offline(self) -> bool:
+        env_var = self.get_env_var_option("offline")
+        if env_var:
+            return env_var in {"1", "true"}
+
+        offline = self.config.get("offline", False)
+        if not isinstance(offline, bool):
+            message = f"Field `tool.hatch.envs.{self.name}.offline` must be a boolean"
+            raise TypeError(message)
+
+        return offline
+
+    @cached_property
+    def offline_install_args(self) -> list[str]:
+        if not self.offline:
+            return []
+
+        from hatch.env.wheelhouse import Wheelhouse, get_wheelhouse_path
+
+        return Wheelhouse(get_wheelhouse_path(self.root)).install_args
+
     @cached_property
     def virtual_env_cls(self) -> type[VirtualEnv]:
         return UVVirtualEnv if self.use_uv else VirtualEnv
@@ -135,8 +174,13 @@ class VirtualEnvironment(EnvironmentInterface):
     @cached_property
     def distributions(self) -> InstalledDistributions:
         from hatch.dep.sync import InstalledDistributions
+        from hatch.dep.vcs import get_revision_resolver
 
-        return InstalledDistributions(sys_path=self.virtual_env.sys_path, environment=self.virtual_env.environment)
+        return InstalledDistributions(
+            sys_path=self.virtual_env.sys_path,
+            environment=self.virtual_env.environment,
+            revision_resolver=get_revision_resolver(self.app),
+        )
 
     @cached_property
     def missing_dependencies(self) -> list[Dependency]:
@@ -151,9 +195,44 @@ class VirtualEnvironment(EnvironmentInterface):
             "installer": str,
             "uv-path": str,
             "locker": str,
+            "offline": bool,
+        }
+
+    def get_store_identity(self) -> dict[str, Any] | None:
+        # Explicit paths and scripts are owned by a single location
+        if self.root.is_file() or self.get_env_var_option("path") or self.config.get("path", ""):
+            return None
+
+        return self._interpreter_identity
+
+    @cached_property
+    def script_cache_key(self) -> str:
+        import json
+        from hashlib import sha256
+
+        data = json.dumps(
+            {"identity": self._interpreter_identity, "dependencies": self.dependency_hash()}, sort_keys=True
+        )
+        return sha256(data.encode("utf-8")).hexdigest()[:32]
+
+    @cached_property
+    def _interpreter_identity(self) -> dict[str, Any]:
+        python = self.config.get("python", "")
+        if not python:
+            explicit_default = os.environ.get(AppEnvVars.PYTHON, "")
+            python = sys.executable if explicit_default == "self" else explicit_default
+
+        return {
+            "python": python or self._preferred_python_version,
+            "python-sources": self._python_sources,
+            "installer": "uv" if self.use_uv else "pip",
+            "system-packages": self.config.get("system-packages", False),
         }
 
     def activate(self):
+        if self.script_cache is not None:
+            self.script_cache.touch(self.script_cache_key)
+
         self.virtual_env.activate()
 
     def deactivate(self):
@@ -179,9 +258,23 @@ class VirtualEnvironment(EnvironmentInterface):
         with self.expose_uv():
             self.virtual_env.create(self.parent_python, allow_system_packages=self.config.get("system-packages", False))
 
+        if self.script_cache is not None:
+            self.script_cache.add(
+                self.script_cache_key,
+                {
+                    "script": str(self.root),
+                    "python": self._interpreter_identity["python"],
+                    "installer": self._interpreter_identity["installer"],
+                    "dependencies": self.dependencies,
+                },
+            )
+            self.script_cache.prune(keep=self.script_cache_key)
+
     def remove(self):
-        self.virtual_env.remove()
-        self.build_virtual_env.remove()
+        self.trash.discard(self.virtual_env.directory)
+        self.trash.discard(self.build_virtual_env.directory)
+        if self.script_cache is not None:
+            self.script_cache.forget(self.script_cache_key)
 
         # Clean up root directory of all virtual environments belonging to the project
         if self.storage_path != self.platform.home / ".virtualenvs" and self.storage_path.is_dir():
@@ -203,7 +296,7 @@ class VirtualEnvironment(EnvironmentInterface):
             )
 
     def uv_pip_sync_command(self, lockfile_path: Path, *, dry_run: bool = False) -> list[str]:
-        command = [self.uv_path, "pip", "sync", str(lockfile_path)]
+        command = [self.uv_path, "pip", "sync", str(lockfile_path), *self.offline_install_args]
         for extra in self.features:
             command.extend(["--extra", extra])
         for group in self.dependency_groups:
@@ -243,14 +336,12 @@ class VirtualEnvironment(EnvironmentInterface):
 
     def sync_dependencies(self):
         with self.safe_activation():
-            workspace_deps = [dep for dep in self.local_dependencies_complex if dep.path]
-            workspace_names = {dep.name.lower() for dep in self.local_dependencies_complex if dep.path}
-
             if self.locked:
                 from hatch.env.lock import apply_lock_with_locker, resolve_lockfile_path
 
                 lockfile_path = resolve_lockfile_path(self)
                 if lockfile_path.is_file():
+                    workspace_deps = [dep for dep in self.local_dependencies_complex if dep.path]
                     workspace_install_args = []
                     for dep in workspace_deps:
                         if dep.editable:
@@ -269,39 +360,47 @@ class VirtualEnvironment(EnvironmentInterface):
             if not self.missing_dependencies:
                 return
 
-            workspace_install_args = []
+            from hatch.env.install import InstallationPlan
 
-            for dep in workspace_deps:
-                if dep.editable:
-                    workspace_install_args.extend(["--editable", dep.path])
-                else:
-                    workspace_install_args.append(dep.path)
+            plan = InstallationPlan()
+            self.plan_dependency_installation(plan)
+            if not plan:
+                return
 
-            standard_dependencies = []
+            self.platform.check_command(self.construct_pip_install_command(plan.get_install_args()))
 
-            user_editable_dependencies = []
+    def install_project_with_dependencies(self):
+        # Lockfiles are applied separately by lockers and dynamic dependencies are polled once the project is
+        # installed, both of which are done when synchronizing dependencies
+        if self.locked or {"dependencies", "optional-dependencies"}.intersection(self.metadata.dynamic):
+            return False
 
-            for dependency in self.missing_dependencies:
-                # Skip if already handled as workspace dependency
-                if dependency.name.lower() in workspace_names:
-                    continue
+        from hatch.env.install import InstallationPlan
 
-                if dependency.editable and dependency.path is not None:
-                    user_editable_dependencies.append(str(dependency.path))
-                else:
-                    standard_dependencies.append(str(dependency))
+        with self.safe_activation():
+            plan = InstallationPlan()
+            plan.add_local(self.metadata.name, self.apply_features(str(self.root)), editable=self.dev_mode)
+            self.plan_dependency_installation(plan)
+            self.platform.check_command(self.construct_pip_install_command(plan.get_install_args()))
 
-            if not (workspace_install_args or standard_dependencies or user_editable_dependencies):
-                return
+        # Inspect the installed distributions again when checking whether dependencies are in sync
+        for attribute in ("distributions", "missing_dependencies"):
+            self.__dict__.pop(attribute, None)
 
-            all_install_args = list(self.get_source_install_args(self.all_dependencies_complex))
-            all_install_args.extend(workspace_install_args)
-            all_install_args.extend(standard_dependencies)
+        return True
 
-            for dep_path in user_editable_dependencies:
-                all_install_args.extend(["--editable", dep_path])
+    def plan_dependency_installation(self, plan: InstallationPlan) -> None:
+        """
+        Adds the local projects, such as workspace members, and the missing dependencies to `plan`.
+        """
+        plan.add_options(self.get_source_install_args(self.all_dependencies_complex))
 
-            self.platform.check_command(self.construct_pip_install_command(all_install_args))
+        for dependency in self.local_dependencies_complex:
+            if dependency.path is not None:
+                plan.add_local(dependency.name, str(dependency.path), editable=dependency.editable)
+
+        for dependency in self.missing_dependencies:
+            plan.add_dependency(dependency)
 
     @contextmanager
     def command_context(self):
@@ -309,6 +408,8 @@ class VirtualEnvironment(EnvironmentInterface):
             yield
 
     def construct_pip_install_command(self, args: list[str]):
+        # Offline environments only install from the wheelhouse
+        args = [*self.offline_install_args, *args]
         if not self.use_uv:
             return super().construct_pip_install_command(args)
 
@@ -320,6 +421,21 @@ class VirtualEnvironment(EnvironmentInterface):
         command.extend(args)
         return command
 
+    def construct_pip_uninstall_command(self, names: list[str]):
+        if not self.use_uv:
+            return super().construct_pip_uninstall_command(names)
+
+        command = [self.uv_path, "pip", "uninstall"]
+
+        # Default to -1 verbosity
+        add_verbosity_flag(command, self.verbosity, adjustment=-1)
+
+        command.extend(names)
+        return command
+
+    def exit_with_shell_command(self, command: str):
+        self.platform.exit_with_shell_command(command)
+
     def enter_shell(self, name: str, path: str, args: Iterable[str]):
         shell_executor = getattr(self.shells, f"enter_{name}", None)
         if shell_executor is None:
@@ -492,7 +608,7 @@ class VirtualEnvironment(EnvironmentInterface):
                 if available_distribution.startswith("pypy")
                 else normalize_distribution_name(available_distribution)
             )
-            if not self._python_constraint.contains(minor_version):
+            if not self._python_ranges.supports_latest(minor_version):
                 continue
 
             return available_distribution
@@ -539,6 +655,12 @@ class VirtualEnvironment(EnvironmentInterface):
         # a satisfactory version to set up the environment
         return SpecifierSet(self.metadata.config.get("project", {}).get("requires-python", ""))
 
+    @cached_property
+    def _python_ranges(self) -> VersionRanges:
+        from hatchling.utils.specifiers import VersionRanges
+
+        return VersionRanges.from_specifier_set(self._python_constraint)
+
     @contextmanager
     def safe_activation(self):
         # In order of precedence:
@@ -0,0 +1,317 @@
+"""
+Watch the files that determine the dependencies of environments, synchronizing environments as soon as the files
+change and publishing the state of environments so that commands may skip their own readiness checks.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.project.core import Project
+    from hatch.utils.fs import Path
+
+# The state of environments that are synchronized for the current configuration
+READY = "ready"
+SYNCING = "syncing"
+ERROR = "error"
+
+# https://man7.org/linux/man-pages/man7/inotify.7.html
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+INOTIFY_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+def get_watched_files(project: Project, environments: Iterable[EnvironmentInterface]) -> dict[str, set[str] | None]:
+    """
+    Returns a mapping of the paths of the files that determine the dependencies of `environments` to the names
+    of the environments that they affect, or `None` when they affect every environment.
+    """
+    from hatch.env.lock import resolve_lockfile_path
+
+    watched: dict[str, set[str] | None] = {}
+    if project.location.is_file():
+        watched[str(project.location)] = None
+    else:
+        for filename in ("pyproject.toml", "hatch.toml"):
+            watched[str(project.location / filename)] = None
+
+    for environment in environments:
+        for member in environment.workspace.members:
+            watched[str(member.project.location / "pyproject.toml")] = None
+
+        lockfile_path = str(resolve_lockfile_path(environment))
+        affected = watched.setdefault(lockfile_path, set())
+        if affected is not None:
+            affected.add(environment.name)
+
+    return watched
+
+
+def get_file_digests(paths: Iterable[str]) -> dict[str, str]:
+    """
+    Returns the SHA-256 digest of every file, or an empty string for files that do not exist.
+    """
+    from hashlib import sha256
+
+    digests = {}
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digests[path] = sha256(f.read()).hexdigest()
+        except OSError:
+            digests[path] = ""
+
+    return digests
+
+
+def get_config_hash(digests: dict[str, str]) -> str:
+    import json
+    from hashlib import sha256
+
+    return sha256(json.dumps(sorted(digests.items())).encode("utf-8")).hexdigest()
+
+
+def get_environment_fingerprint(environment: EnvironmentInterface) -> str:
+    """
+    Returns a hash of the effective configuration of `environment` that the watched files do not capture:
+    the resolved configuration including overrides, the dependency hash which accounts for dynamic
+    dependencies, options of the environment type set by environment variables and the user config file.
+    """
+    import json
+    from hashlib import sha256
+
+    from hatch.env.utils import get_env_var
+
+    option_prefix = get_env_var(plugin_name=environment.PLUGIN_NAME, option="")
+    data = {
+        "config": environment.config,
+        "dependency_hash": environment.dependency_hash(),
+        "options": sorted((name, value) for name, value in os.environ.items() if name.startswith(option_prefix)),
+        "user_config": get_file_digests([str(environment.app.config_file.path)]),
+    }
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def process_exists(pid: int) -> bool:
+    if sys.platform == "win32":
+        import ctypes
+
+        process_query_limited_information = 0x1000
+        still_active = 259
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+        if not handle:
+            return False
+
+        try:
+            exit_code = ctypes.c_ulong()
+            return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))) and (
+                exit_code.value == still_active
+            )
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+    return True
+
+
+@contextmanager
+def sync_lock(path: Path) -> Generator[None, None, None]:
+    """
+    Holds an exclusive lock on `path` so that only one process at a time synchronizes an environment, blocking
+    until any other process releases it.
+    """
+    path.ensure_parent_dir_exists()
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                f.seek(0)
+                try:
+                    # Retries for 10 seconds before raising
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                except OSError:
+                    continue
+
+                break
+
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class WatchStatus:
+    """
+    The state of every watched environment for the configuration identified by the digests of the watched files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def read(self) -> dict[str, Any]:
+        import json
+
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def publish(self, digests: dict[str, str], states: dict[str, str], fingerprints: dict[str, str]) -> None:
+        import json
+
+        data = {
+            "pid": os.getpid(),
+            "config_hash": get_config_hash(digests),
+            "paths": sorted(digests),
+            "states": states,
+            "fingerprints": {name: fingerprints[name] for name, state in states.items() if state == READY},
+        }
+        self.path.ensure_parent_dir_exists()
+        self.path.write_atomic(json.dumps(data), "w", encoding="utf-8")
+
+    def is_ready(self, environment: EnvironmentInterface) -> bool:
+        """
+        Whether a running watcher synchronized `environment` for the current contents of the watched files and
+        the current effective configuration of the environment.
+        """
+        if not self.path.is_file():
+            return False
+
+        data = self.read()
+        if data.get("states", {}).get(environment.name) != READY:
+            return False
+
+        pid = data.get("pid")
+        if not isinstance(pid, int) or not process_exists(pid):
+            return False
+
+        if get_config_hash(get_file_digests(data.get("paths", []))) != data.get("config_hash"):
+            return False
+
+        if get_environment_fingerprint(environment) != data.get("fingerprints", {}).get(environment.name):
+            return False
+
+        return environment.exists()
+
+
+class PollingWatcher:
+    def __init__(self, paths: Iterable[str], *, interval: float) -> None:
+        self.paths = sorted(paths)
+        self.interval = interval
+        self.__snapshot = self.__take_snapshot()
+
+    def wait(self) -> None:
+        """
+        Blocks until any of the files may have changed.
+        """
+        import time
+
+        while True:
+            time.sleep(self.interval)
+            snapshot = self.__take_snapshot()
+            if snapshot != self.__snapshot:
+                self.__snapshot = snapshot
+                return
+
+    def close(self) -> None:
+        pass
+
+    def __take_snapshot(self) -> list[tuple[int, int] | None]:
+        snapshot: list[tuple[int, int] | None] = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                snapshot.append(None)
+            else:
+                snapshot.append((stat.st_mtime_ns, stat.st_size))
+
+        return snapshot
+
+
+class InotifyWatcher:
+    """
+    Watches the directories of the files rather than the files themselves, since editors often replace files
+    rather than modify them.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        import ctypes
+        import ctypes.util
+
+        self.paths = sorted(paths)
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.__fd = self.__libc.inotify_init1(os.O_CLOEXEC)
+        if self.__fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        try:
+            for directory in sorted({os.path.dirname(path) for path in self.paths}):
+                if os.path.isdir(directory):
+                    self.__add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self) -> None:
+        """
+        Blocks until any file in the watched directories changes.
+        """
+        import select
+
+        select.select([self.__fd], [], [])
+        os.read(self.__fd, 65536)
+
+    def __add_watch(self, directory: str) -> None:
+        import ctypes
+
+        if self.__libc.inotify_add_watch(self.__fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+
+    def close(self) -> None:
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+
+def get_file_watcher(paths: Iterable[str], *, interval: float, poll: bool = False) -> InotifyWatcher | PollingWatcher:
+    paths = list(paths)
+    if not poll and sys.platform == "linux":
+        try:
+            return InotifyWatcher(paths)
+        except (AttributeError, OSError):
+            pass
+
+    return PollingWatcher(paths, interval=interval)
@@ -0,0 +1,208 @@
+"""
+A project-local directory of distributions from which environments may be synchronized without network access,
+by passing `--no-index --find-links <wheelhouse>` to the installer. It is populated by `hatch env fetch`.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatch.dep.pylock import Pylock
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.utils.fs import Path
+
+WHEELHOUSE_MANIFEST = "manifest.json"
+
+
+class WheelhouseError(Exception):
+    pass
+
+
+def get_wheelhouse_path(root: Path) -> Path:
+    # Scripts keep a wheelhouse next to them
+    directory = root.parent if root.is_file() else root
+    return directory / ".hatch" / "wheelhouse"
+
+
+class Wheelhouse:
+    """
+    Installers only look for distributions at the top level of `--find-links` directories, so files are stored
+    flat under their own names. The contents are addressed by a manifest of the SHA-256 digest of every file,
+    which ensures that each file is fetched once and never silently replaced by different contents.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @cached_property
+    def manifest(self) -> dict[str, str]:
+        import json
+
+        manifest_path = self.path / WHEELHOUSE_MANIFEST
+        if not manifest_path.is_file():
+            return {}
+
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    @property
+    def install_args(self) -> list[str]:
+        return ["--no-index", "--find-links", str(self.path)]
+
+    def contains(self, filename: str, hashes: dict[str, str]) -> bool:
+        digest = self.manifest.get(filename)
+        if digest is None or not (self.path / filename).is_file():
+            return False
+
+        return hashes.get("sha256", digest) == digest
+
+    def add(self, filename: str, location: str, hashes: dict[str, str]) -> bool:
+        """
+        Fetches the file at `location`, which may be a URL or a path, unless it is already stored. Returns whether
+        the file was fetched.
+        """
+        if self.contains(filename, hashes):
+            return False
+
+        digest = self.manifest.get(filename)
+        if digest is not None and (self.path / filename).is_file():
+            message = f"Distribution `{filename}` is already stored with a different hash: sha256:{digest}"
+            raise WheelhouseError(message)
+
+        self.path.ensure_dir_exists()
+        temp_path = self.path / f".{filename}.part"
+        try:
+            self.__fetch(location, temp_path)
+            digests = self.__get_digests(temp_path, hashes)
+            for algorithm, expected in hashes.items():
+                if algorithm in digests and digests[algorithm] != expected:
+                    message = (
+                        f"Hash mismatch for `{filename}`, expected {algorithm}:{expected} "
+                        f"but got {algorithm}:{digests[algorithm]}"
+                    )
+                    raise WheelhouseError(message)
+
+            temp_path.replace(self.path / filename)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        self.manifest[filename] = digests["sha256"]
+        return True
+
+    def add_lock(self, lock: Pylock) -> tuple[int, list[str]]:
+        """
+        Fetches every wheel and source distribution that `lock` refers to, regardless of markers so that the
+        wheelhouse may serve any platform the lock supports. Returns the number of fetched files and the names
+        of the packages that have no distributions and require network access, such as VCS checkouts.
+        """
+        fetched = 0
+        unavailable = []
+        for package in lock.packages:
+            files = package.distribution_files
+            if not files:
+                # Local directories and archives are available offline as is
+                if not (package.directory or "path" in package.archive):
+                    unavailable.append(package.name)
+
+                continue
+
+            for filename, location, hashes in files:
+                fetched += self.add(filename, location, hashes)
+
+        return fetched, unavailable
+
+    def save(self) -> None:
+        import json
+
+        self.path.ensure_dir_exists()
+        (self.path / WHEELHOUSE_MANIFEST).write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+
+    @staticmethod
+    def __fetch(location: str, path: Path) -> None:
+        import shutil
+
+        from hatch.utils.fs import Path
+
+        if location.startswith(("http://", "https://")):
+            from hatch.utils.network import download_file
+
+            download_file(path, location, follow_redirects=True)
+            return
+
+        source = Path.from_uri(location) if location.startswith("file:") else Path(location)
+        shutil.copyfile(source, path)
+
+    @staticmethod
+    def __get_digests(path: Path, hashes: dict[str, str]) -> dict[str, str]:
+        import hashlib
+
+        algorithms = {"sha256", *(algorithm for algorithm in hashes if algorithm in hashlib.algorithms_guaranteed)}
+        hash_objects = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+        with path.open("rb") as f:
+            while chunk := f.read(65536):
+                for hash_object in hash_objects.values():
+                    hash_object.update(chunk)
+
+        return {algorithm: hash_object.hexdigest() for algorithm, hash_object in hash_objects.items()}
+
+
+def lock_environment_distributions(environment: EnvironmentInterface, directory: Path) -> list[Path]:
+    """
+    Returns lockfiles that pin every distribution `environment` installs. The lockfile of the environment is
+    the source of truth when present, otherwise one is resolved in `directory`, as are the build requirements
+    of the project when it is installed, which include those the build backend reports for the installation.
+    """
+    import os
+
+    from hatch.config.constants import AppEnvVars
+    from hatch.env.lock import (
+        environment_has_lock_inputs,
+        generate_lockfile,
+        get_locker_plugin_class,
+        resolve_lockfile_path,
+    )
+
+    project = environment.app.project
+    prepared = False
+
+    def prepare() -> None:
+        nonlocal prepared
+        if not prepared:
+            project.prepare_environment(environment, keep_env=bool(os.environ.get(AppEnvVars.KEEP_ENV)))
+            prepared = True
+
+    lockfiles = []
+    lockfile_path = resolve_lockfile_path(environment)
+    if lockfile_path.is_file():
+        lockfiles.append(lockfile_path)
+    elif environment_has_lock_inputs(environment):
+        prepare()
+        lockfile_path = directory / "pylock.toml"
+        generate_lockfile(environment, lockfile_path)
+        if lockfile_path.is_file():
+            lockfiles.append(lockfile_path)
+
+    if not environment.skip_install and (environment.root / "pyproject.toml").is_file():
+        build_requirements = [*environment.metadata.build.requires, *get_backend_requirements(environment)]
+        if build_requirements:
+            prepare()
+            lockfile_path = directory / "pylock.build.toml"
+            get_locker_plugin_class(project, environment).generate(environment, build_requirements, lockfile_path)
+            if lockfile_path.is_file():
+                lockfiles.append(lockfile_path)
+
+    return lockfiles
+
+
+def get_backend_requirements(environment: EnvironmentInterface) -> list[str]:
+    """
+    Returns the requirements the build backend reports for installing the project in `environment`, such as
+    those of build hooks, which are only known by calling the backend in the build environment.
+    """
+    project = environment.app.project
+    build = "editable" if environment.dev_mode else "wheel"
+
+    project.prepare_build_environment()
+    with project.location.as_cwd(), project.build_env.get_env_vars():
+        return project.build_frontend.get_requires(build)
@@ -84,7 +84,7 @@ class ProjectConfig:
     @property
     def env_requires_complex(self) -> list[Dependency]:
         if self._env_requires_complex is None:
-            from hatch.dep.core import Dependency, InvalidDependencyError
+            from hatch.dep.core import InvalidDependencyError, get_dependency
 
             requires = self.env.get("requires", [])
             if not isinstance(requires, list):
@@ -99,7 +99,7 @@ class ProjectConfig:
                     raise TypeError(message)
 
                 try:
-                    requires_complex.append(Dependency(entry))
+                    requires_complex.append(get_dependency(entry))
                 except InvalidDependencyError as e:
                     message = f"Requirement #{i} in `tool.hatch.env.requires` is invalid: {e}"
                     raise ValueError(message) from None
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from hatch.cli.application import Application
     from hatch.config.model import RootConfig
     from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.env.store import EnvironmentStore
     from hatch.project.frontend.core import BuildFrontend
 
 
@@ -107,6 +108,12 @@ class Project:
     def env_metadata(self) -> EnvironmentMetadata:
         return EnvironmentMetadata(self.app.data_dir / "env" / ".metadata", self.location)
 
+    @cached_property
+    def env_store(self) -> EnvironmentStore:
+        from hatch.env.store import EnvironmentStore
+
+        return EnvironmentStore(self.app.data_dir / "env")
+
     @cached_property
     def dependency_groups(self) -> dict[str, Any]:
         """
@@ -215,10 +222,12 @@ class Project:
                             )
 
                     with environment.app_status_project_installation():
-                        if environment.dev_mode:
-                            environment.install_project_dev_mode()
-                        else:
-                            environment.install_project()
+                        # Environments may install missing dependencies in the same transaction
+                        if not environment.install_project_with_dependencies():
+                            if environment.dev_mode:
+                                environment.install_project_dev_mode()
+                            else:
+                                environment.install_project()
 
                     if environment.post_install_commands:
                         with environment.app_status_post_installation():
@@ -239,8 +248,9 @@ class Project:
         from hatch.env.lock import environment_has_lock_inputs, generate_lockfile, resolve_lockfile_path
 
         if environment.locked and environment_has_lock_inputs(environment):
+            # Dependencies cannot be resolved offline so existing lockfiles are used as is
             lockfile_path = resolve_lockfile_path(environment)
-            if not lockfile_path.is_file() or new_dep_hash != current_dep_hash:
+            if not lockfile_path.is_file() or (new_dep_hash != current_dep_hash and not environment.offline):
                 with self.app.status(f"Locking environment: {environment.name}"):
                     generate_lockfile(environment, lockfile_path)
 
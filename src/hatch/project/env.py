@@ -29,6 +29,7 @@ RESERVED_OPTIONS = {
     "pre-install-commands": list,
     "python": str,
     "scripts": dict,
+    "shared": bool,
     "skip-install": bool,
     "sources": dict,
     "type": str,
@@ -421,11 +422,27 @@ class EnvironmentMetadata:
     def update_dependency_hash(self, environment: EnvironmentInterface, dependency_hash: str) -> None:
         metadata = self._read(environment)
         metadata["dependency_hash"] = dependency_hash
+
+        # Reference the shared store entry so that it survives garbage collection
+        if environment.store_key:
+            metadata["store_key"] = environment.store_key
+            metadata["project"] = str(self.__project_path)
+        else:
+            metadata.pop("store_key", None)
+            metadata.pop("project", None)
+
         self._write(environment, metadata)
 
     def reset(self, environment: EnvironmentInterface) -> None:
         self._metadata_file(environment).unlink(missing_ok=True)
 
+    @property
+    def watch_status_file(self) -> Path:
+        return self._storage_dir / "watch.json"
+
+    def sync_lock_file(self, environment: EnvironmentInterface) -> Path:
+        return self._metadata_file(environment).with_name(f"{environment.name}.lock")
+
     def _read(self, environment: EnvironmentInterface) -> dict[str, Any]:
         import json
 
@@ -400,7 +400,7 @@ def decorate_dependency(
     project names to the local path of the matching workspace member, used to resolve
     [`WorkspaceSource`](#WorkspaceSource) entries.
     """
-    from hatch.dep.core import Dependency
+    from hatch.dep.core import get_dependency
 
     if dependency.url is not None:
         return dependency
@@ -428,7 +428,7 @@ def decorate_dependency(
     if dependency.marker is not None:
         spec = f"{spec} ; {dependency.marker}"
 
-    return Dependency(spec, editable=editable)
+    return get_dependency(spec, editable=editable)
 
 
 def decorate_dependencies(
@@ -458,10 +458,10 @@ def source_applied(
         # Sources that do not rewrite the requirement apply unless it points elsewhere already
         return dependency.url is None
 
-    from hatch.dep.core import Dependency
+    from hatch.dep.core import get_dependency
 
     spec, _ = rewritten
-    return Dependency(spec).url == dependency.url
+    return get_dependency(spec).url == dependency.url
 
 
 def describe_source(source: Source) -> tuple[str, str]:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from hatchling.metadata.utils import get_normalized_dependency, normalize_project_name
+from hatchling.metadata.utils import normalize_project_name
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -18,18 +18,22 @@ def normalize_marker_quoting(text: str) -> str:
 
 
 def get_normalized_dependencies(requirements: list[Requirement]) -> list[str]:
-    normalized_dependencies = {get_normalized_dependency(requirement) for requirement in requirements}
+    from hatch.dep.core import normalize_dependency
+
+    normalized_dependencies = {normalize_dependency(str(requirement)) for requirement in requirements}
     return sorted(normalized_dependencies)
 
 
 def hash_dependencies(requirements: list[Dependency]) -> str:
     from hashlib import sha256
 
+    from hatch.dep.core import normalize_dependency
+
     data = "".join(
         sorted(
             # Internal spacing is ignored by PEP 440
             normalized_dependency.replace(" ", "")
-            for normalized_dependency in {get_normalized_dependency(req) for req in requirements}
+            for normalized_dependency in {normalize_dependency(str(req)) for req in requirements}
         )
     ).encode("utf-8")
 
@@ -37,22 +41,22 @@ def hash_dependencies(requirements: list[Dependency]) -> str:
 
 
 def get_complex_dependencies(dependencies: list[str]) -> dict[str, Dependency]:
-    from hatch.dep.core import Dependency
+    from hatch.dep.core import get_dependency
 
     dependencies_complex = {}
     for dependency in dependencies:
-        dependencies_complex[dependency] = Dependency(dependency)
+        dependencies_complex[dependency] = get_dependency(dependency)
 
     return dependencies_complex
 
 
 def get_complex_features(features: dict[str, list[str]]) -> dict[str, dict[str, Dependency]]:
-    from hatch.dep.core import Dependency
+    from hatch.dep.core import get_dependency
 
     optional_dependencies_complex = {}
     for feature, optional_dependencies in features.items():
         optional_dependencies_complex[feature] = {
-            optional_dependency: Dependency(optional_dependency) for optional_dependency in optional_dependencies
+            optional_dependency: get_dependency(optional_dependency) for optional_dependency in optional_dependencies
         }
 
     return optional_dependencies_complex
@@ -61,7 +65,7 @@ def get_complex_features(features: dict[str, list[str]]) -> dict[str, dict[str,
 def get_complex_dependency_group(
     dependency_groups: dict[str, Any], group: str, past_groups: tuple[str, ...] = ()
 ) -> list[Dependency]:
-    from hatch.dep.core import Dependency
+    from hatch.dep.core import get_dependency
 
     if group in past_groups:
         msg = f"Cyclic dependency group include: {group} -> {past_groups}"
@@ -79,7 +83,7 @@ def get_complex_dependency_group(
     realized_group = []
     for item in raw_group:
         if isinstance(item, str):
-            realized_group.append(Dependency(item))
+            realized_group.append(get_dependency(item))
         elif isinstance(item, dict):
             if tuple(item.keys()) != ("include-group",):
                 msg = f"Invalid dependency group item: {item}"
@@ -117,8 +121,7 @@ def resolve_extras(
     """
     from collections import deque
 
-    from packaging.requirements import Requirement
-
+    from hatch.dep.core import get_dependency
     from hatchling.metadata.utils import normalize_project_name
 
     external: list[str] = []
@@ -142,7 +145,7 @@ def resolve_extras(
             continue
         seen.add(dep_str)
 
-        req = Requirement(dep_str)
+        req = get_dependency(dep_str)
         name = normalize_project_name(req.name)
 
         if name not in local_projects:
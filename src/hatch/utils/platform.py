@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import os
 import sys
+from contextlib import contextmanager
 from functools import cache
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Generator, Iterable, Sequence
     from subprocess import CompletedProcess, Popen
     from types import ModuleType
 
@@ -26,6 +27,41 @@ def normalize_platform_name(platform_name: str) -> str:
     return "macos" if platform_name == "darwin" else platform_name
 
 
+# Characters that, outside of quotes, require a POSIX shell e.g. for expansion, redirection or chaining
+UNQUOTED_SHELL_SYNTAX = frozenset("\n!#$&()*;<>?[\\`{|}~")
+# Characters that require a POSIX shell within double quotes
+DOUBLE_QUOTED_SHELL_SYNTAX = frozenset("$\\`")
+
+
+def split_simple_command(command: str) -> list[str] | None:
+    """
+    Returns the arguments of a POSIX shell command or `None` if running it requires a shell.
+    """
+    quote = ""
+    for char in command:
+        if quote:
+            if char == quote:
+                quote = ""
+            elif quote == '"' and char in DOUBLE_QUOTED_SHELL_SYNTAX:
+                return None
+        elif char in {"'", '"'}:
+            quote = char
+        elif char in UNQUOTED_SHELL_SYNTAX:
+            return None
+
+    if quote:
+        return None
+
+    import shlex
+
+    args = shlex.split(command)
+    # Variable assignments that only apply to the command
+    if not args or "=" in command.split(maxsplit=1)[0]:
+        return None
+
+    return args
+
+
 class Platform:
     def __init__(self, display_func: Callable = print) -> None:
         self.__display_func = display_func
@@ -74,6 +110,29 @@ class Platform:
 
         return command
 
+    @staticmethod
+    @contextmanager
+    def ignore_interrupts() -> Generator[None, None, None]:
+        """
+        Ignore SIGINT in the current process while a child process runs so that only the child handles Ctrl-C.
+        """
+        import signal
+
+        # The terminal sends SIGINT to the entire foreground process group; without this the parent raises
+        # KeyboardInterrupt and aborts even though the child (e.g. a Python REPL) may choose to stay alive.
+        # The child's exit code is still used to determine success/failure. A handler that does nothing is
+        # used rather than `signal.SIG_IGN` because handled signals are reset to their default action when
+        # the child is executed whereas ignored signals stay ignored, which would otherwise make the child
+        # itself unable to be interrupted.
+        original_sigint = signal.getsignal(signal.SIGINT)
+        try:
+            signal.signal(signal.SIGINT, lambda *_: None)
+            yield
+        finally:
+            # Restore the original handler in finally so the parent stays responsive to Ctrl-C even if the
+            # child raises or is cancelled. Don't hoist this out of the finally block.
+            signal.signal(signal.SIGINT, original_sigint)
+
     @staticmethod
     def exit_with_code(code: str | int | None) -> None:
         sys.exit(code)
@@ -256,8 +315,41 @@ class Platform:
             process = self.run_command(command)
             self.exit_with_code(process.returncode)
         else:
+            from hatch.utils.trash import start_reaper
+
+            start_reaper()
             os.execvp(command[0], command)  # noqa: S606
 
+    def exit_with_shell_command(self, command: str) -> None:
+        """
+        Run the given shell command and exit with its exit code. On non-Windows systems, the current process
+        is replaced using the standard library's [os.execv](https://docs.python.org/3/library/os.html#os.execv)
+        and commands that do not rely on shell features are executed directly rather than by a shell.
+        """
+        if self.windows:
+            with self.ignore_interrupts():
+                process = self.run_command(command, shell=True)  # noqa: S604
+
+            self.exit_with_code(process.returncode)
+            return
+
+        args = split_simple_command(command)
+        executable = self.modules.shutil.which(args[0]) if args else None
+        if executable is None:
+            kwargs: dict[str, Any] = {}
+            self.populate_default_popen_kwargs(kwargs, shell=True)  # noqa: S604
+            executable = kwargs.get("executable", "/bin/sh")
+            args = [executable, "-c", command]
+
+        # Nothing written or scheduled so far may be lost once the process is replaced
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        from hatch.utils.trash import start_reaper
+
+        start_reaper()
+        os.execv(executable, args)  # noqa: S606
+
     @property
     def name(self) -> str:
         """
@@ -19,6 +19,7 @@ class ExecutionContext:
         show_code_on_error: bool = False,
         hide_commands: bool = False,
         source: str = "cmd",
+        allow_exec: bool = False,
     ) -> None:
         self.env = environment
         self.shell_commands: list[str] = list(shell_commands) if shell_commands else []
@@ -27,6 +28,8 @@ class ExecutionContext:
         self.show_code_on_error = show_code_on_error
         self.hide_commands = hide_commands
         self.source = source
+        # Whether nothing runs after the commands, such that a single command may replace the current process
+        self.allow_exec = allow_exec
 
     def add_shell_command(self, command: str | list[str]) -> None:
         self.shell_commands.append(command if isinstance(command, str) else self.env.join_command_args(command))
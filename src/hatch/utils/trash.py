@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatch.utils.fs import Path
+
+TRASH_DIRECTORY_NAME = ".trash"
+
+# Trash directories and the directories containing them that the reaper of this process will reap
+_pending_directories: set[str] = set()
+_pending_roots: set[str] = set()
+
+
+class Trash:
+    """
+    Directories are removed by atomically renaming them into the trash, which must reside on the same filesystem,
+    so that large environments disappear immediately and are deleted afterward by a reaper running in a detached
+    process. Everything in the trash is garbage by construction, so entries left behind by interrupted reapers
+    are simply deleted by the next one.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def discard(self, path: Path) -> None:
+        if path.is_symlink():
+            path.unlink()
+            return
+
+        if not path.is_dir():
+            path.remove()
+            return
+
+        from uuid import uuid4
+
+        self.directory.ensure_dir_exists()
+        try:
+            os.rename(path, self.directory / f"{path.name}-{uuid4().hex}")
+        except OSError:
+            # Different filesystems or files in use
+            path.remove()
+            return
+
+        self.reap_later()
+
+    def reap_later(self) -> None:
+        """
+        Reaps the trash in the single detached process that is started when the command exits, unless the
+        `HATCH_NO_DETACH` environment variable is set, in which case the trash is reaped before returning.
+        """
+        from hatch.config.constants import AppEnvVars
+
+        if os.environ.get(AppEnvVars.NO_DETACH):
+            self.reap()
+            return
+
+        _schedule_reaper()
+        _pending_directories.add(str(self.directory))
+
+    def reap(self, *, workers: int | None = None) -> None:
+        """
+        Deletes everything in the trash, unlinking files concurrently. Symbolic links are never followed, and
+        files that cannot be deleted are left for the next reaper.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        files: list[str] = []
+        directories: list[str] = []
+        pending = [str(self.directory)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+                            pending.append(entry.path)
+                        else:
+                            files.append(entry.path)
+            except OSError:
+                continue
+
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+
+        # Unlinking releases the GIL so threads delete files in parallel
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            executor.map(_unlink, files)
+
+        # Children always come after their parents and the trash itself is only removed when empty
+        for directory in (*reversed(directories), str(self.directory)):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                continue
+
+
+def reap_leftovers(root: Path) -> None:
+    """
+    Reaps the trash directories that reside in `root` or its subdirectories, such as those that interrupted
+    reapers left behind, in the same way as `Trash.reap_later`. The search happens when the reaper starts.
+    """
+    from hatch.config.constants import AppEnvVars
+
+    if os.environ.get(AppEnvVars.NO_DETACH):
+        for directory in _find_trash(str(root)):
+            Trash(type(root)(directory)).reap()
+        return
+
+    _schedule_reaper()
+    _pending_roots.add(str(root))
+
+
+def start_reaper() -> None:
+    """
+    Starts the detached process that reaps everything scheduled so far, if anything. This happens when the
+    command exits and must happen explicitly before the process is replaced.
+    """
+    directories = set(_pending_directories)
+    for root in _pending_roots:
+        directories.update(_find_trash(root))
+
+    _pending_directories.clear()
+    _pending_roots.clear()
+    if not directories:
+        return
+
+    import subprocess
+
+    kwargs: dict = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    subprocess.Popen(
+        [sys.executable, "-m", "hatch.utils.trash", *sorted(directories)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **kwargs,
+    )
+
+
+def _schedule_reaper() -> None:
+    if not (_pending_directories or _pending_roots):
+        import atexit
+
+        atexit.register(start_reaper)
+
+
+def _find_trash(root: str) -> list[str]:
+    # Trash resides in the isolated data directory of environment types, such as `virtual/.trash`,
+    # or one level below, such as `virtual/.scripts/.trash`
+    directories = []
+    try:
+        with os.scandir(root) as entries:
+            children = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return directories
+
+    for child in children:
+        try:
+            with os.scandir(child) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    if entry.name == TRASH_DIRECTORY_NAME:
+                        directories.append(entry.path)
+                    elif os.path.isdir(os.path.join(entry.path, TRASH_DIRECTORY_NAME)):
+                        directories.append(os.path.join(entry.path, TRASH_DIRECTORY_NAME))
+        except OSError:
+            continue
+
+    return directories
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        # Read-only files cannot be deleted on Windows
+        try:
+            os.chmod(path, 0o700)
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    from hatch.utils.fs import Path
+
+    for directory in sys.argv[1:]:
+        Trash(Path(directory)).reap()
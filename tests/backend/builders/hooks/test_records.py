@@ -0,0 +1,190 @@
+import zipfile
+
+import pytest
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+from hatchling.builders.hooks.records import apply_build_data_changes, get_build_data_changes
+from hatchling.builders.wheel import WheelBuilder
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+
+class TestInputs:
+    def test_default(self, isolation):
+        hook = BuildHookInterface(str(isolation), {}, None, None, "", "")
+
+        assert hook.inputs() == []
+        assert hook.outputs() == []
+
+    def test_correct(self, isolation):
+        config = {"inputs": ["src/**/*.pyx"], "outputs": ["src/foo.c"]}
+        hook = BuildHookInterface(str(isolation), config, None, None, "", "")
+
+        assert hook.inputs() == ["src/**/*.pyx"]
+        assert hook.outputs() == ["src/foo.c"]
+
+    def test_not_array(self, isolation):
+        config = {"inputs": "src/**/*.pyx"}
+        hook = BuildHookInterface(str(isolation), config, None, None, "", "")
+        hook.PLUGIN_NAME = "foo"
+
+        with pytest.raises(TypeError, match="Option `inputs` for build hook `foo` must be an array"):
+            hook.inputs()
+
+    def test_entry_not_string(self, isolation):
+        config = {"outputs": [9000]}
+        hook = BuildHookInterface(str(isolation), config, None, None, "", "")
+        hook.PLUGIN_NAME = "foo"
+
+        with pytest.raises(TypeError, match="Entry #1 of option `outputs` for build hook `foo` must be a string"):
+            hook.outputs()
+
+
+class TestBuildDataChanges:
+    def test_replay(self):
+        before = {"artifacts": ["foo"], "force_include": {"a": "a"}, "pure_python": True, "build_hooks": ("x",)}
+        after = {
+            "artifacts": ["foo", "bar"],
+            "force_include": {"a": "a", "b": "b"},
+            "pure_python": False,
+            "tag": "py3-none-any",
+            "build_hooks": ("x",),
+        }
+        changes = get_build_data_changes(before, after)
+
+        assert changes == {
+            "artifacts": {"extend": ["bar"]},
+            "force_include": {"update": {"b": "b"}},
+            "pure_python": {"set": False},
+            "tag": {"set": "py3-none-any"},
+        }
+
+        # Modifications by other hooks are preserved
+        build_data = {"artifacts": ["foo", "baz"], "force_include": {"a": "a", "c": "c"}, "pure_python": True}
+        apply_build_data_changes(build_data, changes)
+
+        assert build_data == {
+            "artifacts": ["foo", "baz", "bar"],
+            "force_include": {"a": "a", "c": "c", "b": "b"},
+            "pure_python": False,
+            "tag": "py3-none-any",
+        }
+
+    def test_replaced_list(self):
+        assert get_build_data_changes({"artifacts": ["foo"]}, {"artifacts": ["bar"]}) == {"artifacts": {"set": ["bar"]}}
+
+    def test_removed_key(self):
+        assert get_build_data_changes({"tag": "foo"}, {}) is None
+
+    def test_not_serializable(self):
+        assert get_build_data_changes({"artifacts": []}, {"artifacts": [object()]}) is None
+        assert get_build_data_changes({}, {"artifacts": ("foo",)}) is None
+
+
+class TestBuild:
+    @pytest.fixture
+    def project_path(self, temp_dir, helpers):
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").touch()
+        (package_path / "data.in").write_text("foo\n")
+        (project_path / DEFAULT_BUILD_SCRIPT).write_text(
+            helpers.dedent(
+                """
+                import pathlib
+
+                from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+                class CustomHook(BuildHookInterface):
+                    def initialize(self, version, build_data):
+                        root = pathlib.Path(self.root)
+                        with open(root / 'runs.txt', 'a') as f:
+                            f.write('run\\n')
+
+                        data = (root / 'my_app' / 'data.in').read_text()
+                        (root / 'generated').mkdir(exist_ok=True)
+                        (root / 'generated' / 'data.out').write_text(data.upper())
+                        build_data['force_include']['generated/data.out'] = 'my_app/data.out'
+                """
+            )
+        )
+
+        return project_path
+
+    @staticmethod
+    def build(project_path, **hook_config):
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {
+                "hatch": {
+                    "build": {
+                        "targets": {"wheel": {"versions": ["standard"], "hooks": {"custom": hook_config}}},
+                    },
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+        with project_path.as_cwd():
+            (artifact,) = builder.build(directory=str(project_path / "dist"))
+
+        with zipfile.ZipFile(artifact) as zip_archive:
+            return zip_archive.read("my_app/data.out")
+
+    @staticmethod
+    def get_runs(project_path):
+        return len((project_path / "runs.txt").read_text().splitlines())
+
+    def test_no_inputs(self, project_path):
+        self.build(project_path)
+        self.build(project_path)
+
+        assert self.get_runs(project_path) == 2
+        assert not (project_path / ".hatch").exists()
+
+    def test_skipped(self, project_path):
+        hook_config = {"inputs": ["my_app/*.in"], "outputs": ["generated"]}
+
+        assert self.build(project_path, **hook_config) == b"FOO\n"
+        assert self.build(project_path, **hook_config) == b"FOO\n"
+        assert self.get_runs(project_path) == 1
+
+        (project_path / "my_app" / "data.in").write_text("bar\n")
+        assert self.build(project_path, **hook_config) == b"BAR\n"
+        assert self.get_runs(project_path) == 2
+
+    def test_output_modified(self, project_path):
+        hook_config = {"inputs": ["my_app/*.in"], "outputs": ["generated/data.out"]}
+        self.build(project_path, **hook_config)
+
+        (project_path / "generated" / "data.out").write_text("baz\n")
+        assert self.build(project_path, **hook_config) == b"FOO\n"
+
+        (project_path / "generated" / "data.out").unlink()
+        assert self.build(project_path, **hook_config) == b"FOO\n"
+        assert self.get_runs(project_path) == 3
+
+    def test_config_changed(self, project_path):
+        self.build(project_path, inputs=["my_app/*.in"])
+        self.build(project_path, inputs=["my_app/*.in"], foo="bar")
+
+        assert self.get_runs(project_path) == 2
+
+    def test_clean(self, project_path):
+        hook_config = {"inputs": ["my_app/*.in"]}
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {"hatch": {"build": {"targets": {"wheel": {"hooks": {"custom": hook_config}}}}}},
+        }
+        self.build(project_path, **hook_config)
+
+        record_path = project_path / ".hatch" / "build-hooks" / "wheel" / "standard" / "custom.json"
+        assert record_path.is_file()
+
+        builder = WheelBuilder(str(project_path), config=config)
+        with project_path.as_cwd():
+            list(builder.build(directory=str(project_path / "dist"), versions=["standard"], clean_only=True))
+
+        assert not record_path.exists()
+
+        self.build(project_path, **hook_config)
+        assert self.get_runs(project_path) == 2
@@ -1,3 +1,5 @@
+import shutil
+import subprocess
 from os.path import sep as path_sep
 
 import pytest
@@ -387,3 +389,127 @@ class TestDirectoryRecursion:
                 (str(temp_dir / "external2.txt"), f"nested{path_sep}target1.txt"),
                 (str(temp_dir / "external1.txt"), f"nested{path_sep}target2.txt"),
             ]
+
+
+def git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "user.name=foo", "-c", "user.email=foo@bar.baz", *args],
+        cwd=str(cwd),
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(not shutil.which("git"), reason="Git is not available")
+class TestGitFileEnumeration:
+    @pytest.fixture
+    def project_dir(self, temp_dir):
+        project_dir = temp_dir / "project"
+        project_dir.ensure_dir_exists()
+        git("init", cwd=project_dir)
+
+        (project_dir / ".gitignore").write_text("*.log\n/build/\nnode_modules/\n")
+        (project_dir / "README.md").touch()
+        (project_dir / "debug.log").touch()
+        for relative_path in (
+            "pkg/__init__.py",
+            "pkg/core.py",
+            "pkg/sub/__init__.py",
+            "pkg/sub/deleted.py",
+            "pkg/data/data.json",
+            "build/lib/pkg/core.py",
+            "node_modules/foo/index.js",
+            "pkg/__pycache__/core.cpython-312.pyc",
+        ):
+            path = project_dir / relative_path
+            path.parent.ensure_dir_exists()
+            path.touch()
+
+        git("add", "-A", cwd=project_dir)
+        git("commit", "-m", "initial", cwd=project_dir)
+
+        (project_dir / "pkg" / "sub" / "deleted.py").unlink()
+        (project_dir / "pkg" / "untracked.py").touch()
+
+        return project_dir
+
+    @staticmethod
+    def get_files(project_dir, config):
+        builder = MockBuilder(str(project_dir), config={"tool": {"hatch": {"build": config}}})
+        return [(f.path, f.distribution_path) for f in builder.recurse_included_files()]
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {},
+            {"include": ["pkg"]},
+            {"exclude": ["*.json"], "skip-excluded-dirs": True},
+            {"artifacts": ["*.log", "/build"]},
+        ],
+    )
+    def test_matches_walk(self, project_dir, config):
+        files = self.get_files(project_dir, config)
+
+        assert self.get_files(project_dir, {**config, "file-enumeration": "git"}) == files
+        assert str(project_dir / "pkg" / "untracked.py") in [path for path, _ in files]
+
+    def test_nested_gitignore(self, project_dir):
+        (project_dir / "pkg" / ".gitignore").write_text("core.py\n")
+
+        files = [path for path, _ in self.get_files(project_dir, {"file-enumeration": "git"})]
+
+        # Tracked files are not ignored
+        assert str(project_dir / "pkg" / "core.py") in files
+        assert str(project_dir / "pkg" / ".gitignore") in files
+
+        (project_dir / "pkg" / "new.py").touch()
+        (project_dir / "pkg" / ".gitignore").write_text("new.py\n")
+
+        files = [path for path, _ in self.get_files(project_dir, {"file-enumeration": "git"})]
+
+        assert str(project_dir / "pkg" / "new.py") not in files
+
+    def test_ignored_directories_not_walked(self, project_dir, mocker):
+        safe_walk = mocker.patch("hatchling.builders.git.safe_walk")
+
+        self.get_files(project_dir, {"file-enumeration": "git"})
+
+        safe_walk.assert_not_called()
+
+    @pytest.mark.requires_unix
+    def test_symlinked_directory(self, project_dir, temp_dir):
+        external = temp_dir / "external"
+        external.ensure_dir_exists()
+        (external / "module.py").touch()
+        (project_dir / "pkg" / "linked").symlink_to(external)
+        git("add", "-A", cwd=project_dir)
+
+        files = self.get_files(project_dir, {})
+
+        assert self.get_files(project_dir, {"file-enumeration": "git"}) == files
+        assert str(project_dir / "pkg" / "linked" / "module.py") in [path for path, _ in files]
+
+    def test_not_repository(self, temp_dir):
+        project_dir = temp_dir / "project"
+        (project_dir / "pkg").ensure_dir_exists()
+        (project_dir / "pkg" / "__init__.py").touch()
+
+        assert self.get_files(project_dir, {"file-enumeration": "git"}) == self.get_files(project_dir, {})
+
+    def test_ignored_by_parent_repository(self, project_dir):
+        nested_dir = project_dir / "build" / "nested"
+        (nested_dir / "pkg").ensure_dir_exists()
+        (nested_dir / "pkg" / "__init__.py").touch()
+
+        files = self.get_files(nested_dir, {})
+
+        assert self.get_files(nested_dir, {"file-enumeration": "git"}) == files
+        assert str(nested_dir / "pkg" / "__init__.py") in [path for path, _ in files]
+
+    def test_ignore_vcs(self, project_dir, mocker):
+        get_git_file_index = mocker.patch("hatchling.builders.git.get_git_file_index")
+
+        files = self.get_files(project_dir, {"file-enumeration": "git", "ignore-vcs": True})
+
+        get_git_file_index.assert_not_called()
+        assert str(project_dir / "debug.log") in [path for path, _ in files]
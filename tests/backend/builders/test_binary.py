@@ -13,7 +13,7 @@ from hatchling.builders.app import AppBuilder
 from hatchling.builders.binary import BinaryBuilder
 from hatchling.builders.plugin.interface import BuilderInterface
 
-pytestmark = [pytest.mark.requires_cargo, pytest.mark.requires_internet]
+pytestmark = [pytest.mark.requires_cargo]
 
 
 class ExpectedEnvVars:
@@ -243,6 +243,54 @@ class TestPyAppVersion:
             _ = builder.config.pyapp_version
 
 
+class TestBuildWorkers:
+    def test_default(self, isolation):
+        config = {"project": {"name": "My.App", "version": "0.1.0"}}
+        builder = BinaryBuilder(str(isolation), config=config)
+
+        assert builder.config.build_workers == builder.config.build_workers == 1
+
+    def test_set(self, isolation):
+        config = {
+            "project": {"name": "My.App", "version": "0.1.0"},
+            "tool": {"hatch": {"build": {"targets": {"binary": {"build-workers": 4}}}}},
+        }
+        builder = BinaryBuilder(str(isolation), config=config)
+
+        assert builder.config.build_workers == 4
+
+    def test_cpu_count(self, isolation):
+        config = {
+            "project": {"name": "My.App", "version": "0.1.0"},
+            "tool": {"hatch": {"build": {"targets": {"binary": {"build-workers": 0}}}}},
+        }
+        builder = BinaryBuilder(str(isolation), config=config)
+
+        assert builder.config.build_workers == (os.cpu_count() or 1)
+
+    def test_not_integer(self, isolation):
+        config = {
+            "project": {"name": "My.App", "version": "0.1.0"},
+            "tool": {"hatch": {"build": {"targets": {"binary": {"build-workers": "4"}}}}},
+        }
+        builder = BinaryBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match="Field `tool.hatch.build.targets.binary.build-workers` must be an integer"):
+            _ = builder.config.build_workers
+
+    def test_negative(self, isolation):
+        config = {
+            "project": {"name": "My.App", "version": "0.1.0"},
+            "tool": {"hatch": {"build": {"targets": {"binary": {"build-workers": -1}}}}},
+        }
+        builder = BinaryBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match="Field `tool.hatch.build.targets.binary.build-workers` must not be negative"
+        ):
+            _ = builder.config.build_workers
+
+
 class TestBuildBootstrap:
     def test_default(self, hatch, temp_dir, mocker):
         subprocess_run = mocker.patch("subprocess.run", side_effect=cargo_install)
@@ -271,7 +319,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
         )
@@ -311,7 +359,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
         )
@@ -353,7 +401,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({
                 "PYAPP_PROJECT_NAME": "my-app",
@@ -397,7 +445,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({
                 "PYAPP_PROJECT_NAME": "my-app",
@@ -443,7 +491,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cross", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cross", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
         )
@@ -507,7 +555,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({
                 "PYAPP_PROJECT_NAME": "my-app",
@@ -551,7 +599,18 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--version", "9000"],
+            [
+                "cargo",
+                "install",
+                "pyapp",
+                "--force",
+                "--root",
+                mocker.ANY,
+                "--target-dir",
+                mocker.ANY,
+                "--version",
+                "9000",
+            ],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
         )
@@ -591,7 +650,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
             stdout=subprocess.PIPE,
@@ -715,7 +774,7 @@ class TestBuildBootstrap:
             artifacts = list(builder.build())
 
         subprocess_run.assert_called_once_with(
-            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY],
+            ["cargo", "install", "pyapp", "--force", "--root", mocker.ANY, "--target-dir", mocker.ANY],
             cwd=mocker.ANY,
             env=ExpectedEnvVars({"PYAPP_PROJECT_NAME": "my-app", "PYAPP_PROJECT_VERSION": "0.1.0"}),
         )
@@ -727,3 +786,178 @@ class TestBuildBootstrap:
         assert len(build_artifacts) == 1
         assert expected_artifact == str(build_artifacts[0])
         assert (build_path / "app" / ("my-app-0.1.0.exe" if sys.platform == "win32" else "my-app-0.1.0")).is_file()
+
+    def test_scripts_shared_target_directory(self, hatch, temp_dir, mocker):
+        subprocess_run = mocker.patch("subprocess.run", side_effect=cargo_install)
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        scripts = {f"foo{i}": f"bar.baz:cli{i}" for i in range(5)}
+        config = {
+            "project": {"name": project_name, "version": "0.1.0", "scripts": scripts},
+            "tool": {
+                "hatch": {
+                    "build": {"targets": {"binary": {"versions": ["bootstrap"], "build-workers": 2}}},
+                },
+            },
+        }
+        builder = BinaryBuilder(str(project_path), config=config)
+
+        build_path = project_path / "dist"
+        cache_path = temp_dir / "cache"
+
+        with project_path.as_cwd({"HATCH_BUILD_CACHE": str(cache_path)}):
+            list(builder.build())
+
+        assert subprocess_run.call_count == 5
+
+        install_roots = set()
+        target_dirs = set()
+        for call in subprocess_run.call_args_list:
+            command = call.args[0]
+            install_roots.add(command[command.index("--root") + 1])
+            target_dirs.add(command[command.index("--target-dir") + 1])
+
+        assert len(install_roots) == 5
+        key_path = Path(next(iter(target_dirs))).parent
+        assert key_path.parent == cache_path / "pyapp"
+        assert target_dirs == {str(key_path / "target-0"), str(key_path / "target-1")}
+
+        exe_suffix = ".exe" if sys.platform == "win32" else ""
+        assert sorted(path.name for path in (build_path / "binary").iterdir()) == [
+            f"foo{i}-0.1.0{exe_suffix}" for i in range(5)
+        ]
+
+        # The cache is shared by builds of any project version
+        subprocess_run.reset_mock()
+        builder = BinaryBuilder(str(project_path), config={**config, "project": {**config["project"], "version": "1"}})
+        with project_path.as_cwd({"HATCH_BUILD_CACHE": str(cache_path)}):
+            list(builder.build())
+
+        for call in subprocess_run.call_args_list:
+            command = call.args[0]
+            assert Path(command[command.index("--target-dir") + 1]).parent == key_path
+
+    def test_concurrent_builds_shared_target_directory(self, hatch, temp_dir, mocker):
+        import threading
+        import time
+
+        def cargo_build(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess:
+            install_command: list[str] = args[0]
+            target_dir = install_command[install_command.index("--target-dir") + 1]
+            executable = Path(target_dir, "release", "pyapp.exe" if sys.platform == "win32" else "pyapp")
+            executable.parent.ensure_dir_exists()
+            executable.write_text(kwargs["env"]["PYAPP_EXEC_SPEC"])
+
+            # Give a concurrent build the chance to replace the executable
+            time.sleep(0.2)
+            return subprocess.CompletedProcess(install_command, returncode=0, stdout=None, stderr=None)
+
+        mocker.patch("subprocess.run", side_effect=cargo_build)
+
+        builders = []
+        for project_name in ("foo", "bar"):
+            with temp_dir.as_cwd():
+                result = hatch("new", project_name)
+
+            assert result.exit_code == 0, result.output
+
+            config = {
+                "project": {"name": project_name, "version": "0.1.0", "scripts": {project_name: f"{project_name}:cli"}},
+                "tool": {"hatch": {"build": {"targets": {"binary": {"versions": ["bootstrap"]}}}}},
+            }
+            builders.append(BinaryBuilder(str(temp_dir / project_name), config=config))
+
+        errors = []
+
+        def build(builder):
+            try:
+                list(builder.build())
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        with EnvVars({"PYAPP_REPO": str(temp_dir / "pyapp"), "HATCH_BUILD_CACHE": str(temp_dir / "cache")}):
+            threads = [threading.Thread(target=build, args=(builder,)) for builder in builders]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert not errors
+        exe_suffix = ".exe" if sys.platform == "win32" else ""
+        for project_name in ("foo", "bar"):
+            exe_path = temp_dir / project_name / "dist" / "binary" / f"{project_name}-0.1.0{exe_suffix}"
+            assert exe_path.read_text() == f"{project_name}:cli"
+
+    def test_local_build_offline(self, hatch, helpers, temp_dir):
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        # A stand-in for the PyApp repository that embeds the configuration like the real one
+        repo_path = temp_dir / "pyapp"
+        (repo_path / "src").mkdir(parents=True)
+        (repo_path / "Cargo.toml").write_text(
+            helpers.dedent(
+                """
+                [package]
+                name = "pyapp"
+                version = "0.1.0"
+                edition = "2021"
+                """
+            )
+        )
+        (repo_path / "build.rs").write_text(
+            helpers.dedent(
+                """
+                fn main() {
+                    println!("cargo:rerun-if-env-changed=PYAPP_EXEC_SPEC");
+                    let spec = std::env::var("PYAPP_EXEC_SPEC").unwrap_or_default();
+                    println!("cargo:rustc-env=EMBEDDED_EXEC_SPEC={spec}");
+                }
+                """
+            )
+        )
+        (repo_path / "src" / "main.rs").write_text(
+            helpers.dedent(
+                """
+                fn main() {
+                    print!("{}", env!("EMBEDDED_EXEC_SPEC"));
+                }
+                """
+            )
+        )
+
+        project_path = temp_dir / "my-app"
+        scripts = {f"foo{i}": f"bar.baz:cli{i}" for i in range(3)}
+        config = {
+            "project": {"name": project_name, "version": "0.1.0", "scripts": scripts},
+            "tool": {
+                "hatch": {
+                    "build": {"targets": {"binary": {"versions": ["bootstrap"], "build-workers": 2}}},
+                },
+            },
+        }
+        builder = BinaryBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd({
+            "PYAPP_REPO": str(repo_path),
+            "HATCH_BUILD_CACHE": str(temp_dir / "cache"),
+            "CARGO_NET_OFFLINE": "true",
+        }):
+            list(builder.build())
+
+        exe_suffix = ".exe" if sys.platform == "win32" else ""
+        for i in range(3):
+            exe_path = project_path / "dist" / "binary" / f"foo{i}-0.1.0{exe_suffix}"
+            output = subprocess.run([str(exe_path)], capture_output=True, text=True, check=True).stdout
+            assert output == f"bar.baz:cli{i}"
@@ -0,0 +1,135 @@
+import shutil
+
+import pytest
+
+from hatchling.builders.cache import ArtifactCache, get_build_input_digest
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+from hatchling.builders.wheel import WheelBuilder
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+
+class TestArtifactCache:
+    def test_missing(self, temp_dir):
+        cache = ArtifactCache(str(temp_dir / "cache"), "foo", "wheel")
+
+        assert cache.get("standard", "abc", str(temp_dir)) is None
+
+    def test_add_get(self, temp_dir):
+        cache = ArtifactCache(str(temp_dir / "cache"), "foo", "wheel")
+        artifact = temp_dir / "foo-1.0-py3-none-any.whl"
+        artifact.write_bytes(b"foo")
+        cache.add("standard", "abc", str(artifact))
+
+        output_directory = temp_dir / "dist"
+        output_directory.mkdir()
+
+        path = cache.get("standard", "abc", str(output_directory))
+
+        assert path == str(output_directory / artifact.name)
+        assert (output_directory / artifact.name).read_bytes() == b"foo"
+        assert cache.get("editable", "abc", str(output_directory)) is None
+
+    def test_keep_latest(self, temp_dir):
+        cache = ArtifactCache(str(temp_dir / "cache"), "foo", "wheel")
+        artifact = temp_dir / "foo-1.0-py3-none-any.whl"
+        artifact.write_bytes(b"foo")
+        cache.add("standard", "abc", str(artifact))
+        cache.add("editable", "abc", str(artifact))
+        artifact.write_bytes(b"bar")
+        cache.add("standard", "def", str(artifact))
+
+        assert cache.get("standard", "abc", str(temp_dir)) is None
+        assert cache.get("editable", "abc", str(temp_dir)) is not None
+        assert cache.get("standard", "def", str(temp_dir)) is not None
+        assert sorted(path.name for path in (temp_dir / "cache" / "foo" / "wheel" / "standard").iterdir()) == ["def"]
+
+    def test_add_directory(self, temp_dir):
+        cache = ArtifactCache(str(temp_dir / "cache"), "foo", "binary")
+        artifact = temp_dir / "app"
+        artifact.mkdir()
+
+        cache.add("standard", "abc", str(artifact))
+
+        assert cache.get("standard", "abc", str(temp_dir)) is None
+        assert not any((temp_dir / "cache" / "foo" / "binary" / "standard").iterdir())
+
+
+class TestBuildInputDigest:
+    @pytest.fixture
+    def project_path(self, temp_dir):
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").write_text("foo = 1\n")
+        (project_path / DEFAULT_BUILD_SCRIPT).write_text("")
+
+        return project_path
+
+    @staticmethod
+    def get_digest(project_path, version="standard", **target_config):
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {"hatch": {"build": {"targets": {"wheel": target_config}}}},
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+        with project_path.as_cwd(exclude=[BuildEnvVars.CACHE, "SOURCE_DATE_EPOCH", "MACOSX_DEPLOYMENT_TARGET"]):
+            return get_build_input_digest(builder, version)
+
+    def test_stable(self, project_path):
+        assert self.get_digest(project_path) == self.get_digest(project_path)
+
+    def test_version(self, project_path):
+        assert self.get_digest(project_path) != self.get_digest(project_path, "editable")
+
+    def test_config(self, project_path):
+        assert self.get_digest(project_path) != self.get_digest(project_path, reproducible=False)
+
+    def test_file_contents(self, project_path):
+        digest = self.get_digest(project_path)
+        (project_path / "my_app" / "__init__.py").write_text("foo = 2\n")
+
+        assert self.get_digest(project_path) != digest
+
+    def test_file_added(self, project_path):
+        digest = self.get_digest(project_path)
+        (project_path / "my_app" / "lib.py").touch()
+
+        assert self.get_digest(project_path) != digest
+
+    def test_hook_script(self, project_path):
+        hooks = {"custom": {}}
+        digest = self.get_digest(project_path, hooks=hooks)
+        (project_path / DEFAULT_BUILD_SCRIPT).write_text("# foo\n")
+
+        assert self.get_digest(project_path, hooks=hooks) != digest
+
+    def test_hook_version(self, project_path, mocker):
+        class CustomHook(BuildHookInterface):
+            PLUGIN_NAME = "foo"
+
+        CustomHook.__module__ = "hatch_foo.hooks"
+        mocker.patch("hatchling.plugin.manager.ClassRegister.get", return_value=CustomHook)
+        mocker.patch("importlib.metadata.packages_distributions", return_value={"hatch_foo": ["hatch-foo"]})
+        version = mocker.patch("importlib.metadata.version", return_value="1.0")
+
+        hooks = {"foo": {}}
+        digest = self.get_digest(project_path, hooks=hooks)
+        assert self.get_digest(project_path, hooks=hooks) == digest
+        version.assert_called_with("hatch-foo")
+
+        version.return_value = "2.0"
+        assert self.get_digest(project_path, hooks=hooks) != digest
+
+    def test_interpreter(self, project_path, mocker):
+        digest = self.get_digest(project_path)
+        mocker.patch("sysconfig.get_platform", return_value="foo")
+
+        assert self.get_digest(project_path) != digest
+
+    def test_editable_location(self, project_path, temp_dir):
+        other_path = temp_dir / "other"
+        shutil.copytree(project_path, other_path)
+
+        assert self.get_digest(project_path) == self.get_digest(other_path)
+        assert self.get_digest(project_path, "editable") != self.get_digest(other_path, "editable")
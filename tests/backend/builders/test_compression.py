@@ -0,0 +1,151 @@
+import gzip
+import io
+import os
+import zipfile
+import zlib
+
+import pathspec
+import pytest
+
+from hatchling.builders.compression import (
+    INCOMPRESSIBLE_MIN_SIZE,
+    INCOMPRESSIBLE_SAMPLE_SIZE,
+    PARALLEL_BLOCK_SIZE,
+    CompressionPolicy,
+    ParallelGzipFile,
+    is_incompressible,
+    set_zip_info_compression,
+)
+
+
+def compress(data, *, max_workers, chunk_size=7777, **kwargs):
+    buffer = io.BytesIO()
+    with ParallelGzipFile(buffer, max_workers=max_workers, **kwargs) as f:
+        for i in range(0, len(data), chunk_size):
+            f.write(data[i : i + chunk_size])
+
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def data():
+    return os.urandom(PARALLEL_BLOCK_SIZE) + b"foo bar baz " * 100000
+
+
+class TestParallelGzipFile:
+    def test_round_trip(self, data):
+        assert gzip.decompress(compress(data, max_workers=4)) == data
+
+    def test_empty(self):
+        assert gzip.decompress(compress(b"", max_workers=2)) == b""
+
+    @pytest.mark.parametrize("chunk_size", [1000, PARALLEL_BLOCK_SIZE, 10 * PARALLEL_BLOCK_SIZE])
+    def test_independent_of_workers_and_writes(self, data, chunk_size):
+        expected = compress(data, max_workers=1, chunk_size=chunk_size, mtime=0)
+
+        assert compress(data, max_workers=8, mtime=0) == expected
+
+    def test_single_member(self, data):
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        assert decompressor.decompress(compress(data, max_workers=4)) == data
+        assert decompressor.eof
+        assert not decompressor.unused_data
+
+    def test_header(self):
+        output = compress(b"foo", max_workers=2, mtime=1580601600)
+
+        expected = io.BytesIO()
+        with gzip.GzipFile(fileobj=expected, mode="wb", mtime=1580601600) as f:
+            f.write(b"foo")
+
+        assert output[:10] == expected.getvalue()[:10]
+        assert output[-8:] == expected.getvalue()[-8:]
+
+    def test_tell(self):
+        with ParallelGzipFile(io.BytesIO(), max_workers=2) as f:
+            f.write(b"foo")
+            f.write(b"bar")
+
+            assert f.tell() == 6
+
+    def test_write_after_close(self):
+        f = ParallelGzipFile(io.BytesIO(), max_workers=2)
+        f.close()
+
+        with pytest.raises(ValueError, match="write to closed file"):
+            f.write(b"foo")
+
+
+class TestIsIncompressible:
+    def test_random(self):
+        assert is_incompressible(os.urandom(INCOMPRESSIBLE_SAMPLE_SIZE))
+
+    def test_text(self):
+        assert not is_incompressible(b"foo bar baz " * 10000)
+
+    def test_small(self):
+        assert not is_incompressible(os.urandom(INCOMPRESSIBLE_MIN_SIZE - 1))
+
+
+class TestCompressionPolicy:
+    def test_default(self):
+        policy = CompressionPolicy()
+
+        assert policy.get_compression("foo.py", b"foo = 1\n") == (zipfile.ZIP_DEFLATED, None)
+
+    def test_level(self):
+        policy = CompressionPolicy(level=1)
+
+        assert policy.get_compression("foo.py", b"foo = 1\n") == (zipfile.ZIP_DEFLATED, 1)
+
+    def test_incompressible(self):
+        policy = CompressionPolicy(level=1)
+
+        assert policy.get_compression("foo.bin", os.urandom(INCOMPRESSIBLE_SAMPLE_SIZE)) == (zipfile.ZIP_STORED, None)
+
+    def test_incompressible_disabled(self):
+        policy = CompressionPolicy(detect_incompressible=False)
+
+        assert policy.get_compression("foo.bin", os.urandom(INCOMPRESSIBLE_SAMPLE_SIZE)) == (
+            zipfile.ZIP_DEFLATED,
+            None,
+        )
+
+    def test_stored(self):
+        policy = CompressionPolicy(method=zipfile.ZIP_STORED, level=9)
+
+        assert policy.get_compression("foo.py", b"foo = 1\n") == (zipfile.ZIP_STORED, None)
+
+    def test_rules_first_match(self):
+        rules = [
+            (pathspec.GitIgnoreSpec.from_lines(["/pkg/data/"]), zipfile.ZIP_STORED, None),
+            (pathspec.GitIgnoreSpec.from_lines(["*.py"]), zipfile.ZIP_DEFLATED, 9),
+        ]
+        policy = CompressionPolicy(rules, method=zipfile.ZIP_STORED)
+
+        assert policy.get_compression("pkg/data/foo.py") == (zipfile.ZIP_STORED, None)
+        assert policy.get_compression("pkg/foo.py") == (zipfile.ZIP_DEFLATED, 9)
+        assert policy.get_compression("pkg/foo.txt") == (zipfile.ZIP_STORED, None)
+
+    def test_rules_override_detection(self):
+        rules = [(pathspec.GitIgnoreSpec.from_lines(["*.bin"]), zipfile.ZIP_DEFLATED, None)]
+        policy = CompressionPolicy(rules)
+
+        assert policy.get_compression("foo.bin", os.urandom(INCOMPRESSIBLE_SAMPLE_SIZE)) == (
+            zipfile.ZIP_DEFLATED,
+            None,
+        )
+
+
+def test_set_zip_info_compression():
+    zip_info = zipfile.ZipInfo("foo.py")
+    set_zip_info_compression(zip_info, zipfile.ZIP_DEFLATED, 1)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file, zip_file.open(zip_info, "w") as f:
+        f.write(b"foo = 1\n" * 1000)
+
+    with zipfile.ZipFile(buffer) as zip_file:
+        assert zip_file.getinfo("foo.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zip_file.read("foo.py") == b"foo = 1\n" * 1000
@@ -157,6 +157,52 @@ class TestIgnoreVCS:
         assert builder.config.ignore_vcs is False
 
 
+class TestFileEnumeration:
+    def test_default(self, isolation):
+        builder = MockBuilder(str(isolation))
+
+        assert builder.config.file_enumeration == builder.config.file_enumeration == "walk"
+
+    def test_target(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"foo": {"file-enumeration": "git"}}}}}}
+        builder = MockBuilder(str(isolation), config=config)
+        builder.PLUGIN_NAME = "foo"
+
+        assert builder.config.file_enumeration == "git"
+
+    def test_target_not_string(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"foo": {"file-enumeration": 9000}}}}}}
+        builder = MockBuilder(str(isolation), config=config)
+        builder.PLUGIN_NAME = "foo"
+
+        with pytest.raises(TypeError, match="Field `tool.hatch.build.targets.foo.file-enumeration` must be a string"):
+            _ = builder.config.file_enumeration
+
+    def test_global(self, isolation):
+        config = {"tool": {"hatch": {"build": {"file-enumeration": "git"}}}}
+        builder = MockBuilder(str(isolation), config=config)
+        builder.PLUGIN_NAME = "foo"
+
+        assert builder.config.file_enumeration == "git"
+
+    def test_global_unknown(self, isolation):
+        config = {"tool": {"hatch": {"build": {"file-enumeration": "foo"}}}}
+        builder = MockBuilder(str(isolation), config=config)
+        builder.PLUGIN_NAME = "foo"
+
+        with pytest.raises(ValueError, match="Field `tool.hatch.build.file-enumeration` must be one of: walk, git"):
+            _ = builder.config.file_enumeration
+
+    def test_target_overrides_global(self, isolation):
+        config = {
+            "tool": {"hatch": {"build": {"file-enumeration": "git", "targets": {"foo": {"file-enumeration": "walk"}}}}}
+        }
+        builder = MockBuilder(str(isolation), config=config)
+        builder.PLUGIN_NAME = "foo"
+
+        assert builder.config.file_enumeration == "walk"
+
+
 class TestRequireRuntimeDependencies:
     def test_default(self, isolation):
         builder = MockBuilder(str(isolation))
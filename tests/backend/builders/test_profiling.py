@@ -0,0 +1,250 @@
+import json
+import time
+
+import pytest
+
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.builders.profiling import PROFILE_FILE_COUNT, BuildProfiler, get_profiler, get_trace_path
+from hatchling.builders.sdist import SdistBuilder
+from hatchling.builders.wheel import WheelBuilder
+from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+
+class TestGetProfiler:
+    def test_disabled(self, isolation):
+        with isolation.as_cwd(exclude=[BuildEnvVars.PROFILE]):
+            assert get_profiler() is None
+
+    def test_per_path(self, temp_dir):
+        with temp_dir.as_cwd(env_vars={BuildEnvVars.PROFILE: "profile.json"}):
+            profiler = get_profiler()
+
+            assert profiler is not None
+            assert profiler.path == str(temp_dir / "profile.json")
+            assert get_profiler() is profiler
+
+        with temp_dir.as_cwd(env_vars={BuildEnvVars.PROFILE: "other.json"}):
+            assert get_profiler() is not profiler
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("profile.json", "profile.trace.json"),
+        ("profile", "profile.trace.json"),
+        ("profile.out", "profile.trace.out"),
+    ],
+)
+def test_trace_path(path, expected):
+    assert get_trace_path(path) == expected
+
+
+class TestBuildProfiler:
+    def test_iterate(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+
+        assert list(profiler.iterate("walk", range(3))) == [0, 1, 2]
+        assert profiler.phases["walk"][2] == 3
+
+    def test_wrap_file_writer(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+        calls = []
+        wrapper = profiler.wrap_file_writer(calls.append, lambda name: (name, len(name)))
+
+        wrapper("foo")
+        wrapper("quux")
+
+        assert calls == ["foo", "quux"]
+        assert profiler.phases["archive"][2] == 2
+
+        summary = profiler.get_summary()
+        assert [entry["path"] for entry in summary["largest_files"]] == ["quux", "foo"]
+        assert sorted(summary["largest_files"][0]) == ["cpu_time", "path", "size", "wall_time"]
+
+    def test_nested_phases(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+
+        with profiler.phase("compress"):
+            with profiler.phase("hash"):
+                time.sleep(0.05)
+
+            with profiler.phase("hash"):
+                pass
+
+        assert profiler.phases["hash"][0] >= 0.05
+        assert profiler.phases["hash"][2] == 2
+        assert profiler.phases["compress"][0] < 0.05
+        assert profiler.phases["compress"][2] == 1
+        assert profiler.nested_wall_time >= 0.05
+
+    def test_iterate_excludes_nested(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+        match = profiler.wrap_phase("match", time.sleep)
+
+        def walk():
+            for _ in range(2):
+                match(0.025)
+                yield
+
+        assert len(list(profiler.iterate("walk", walk()))) == 2
+        assert profiler.phases["match"][0] >= 0.05
+        assert profiler.phases["match"][2] == 2
+        assert profiler.phases["walk"][0] < 0.05
+        assert profiler.phases["walk"][2] == 2
+
+    def test_file_writer_excludes_nested(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+
+        def write(_):
+            with profiler.phase("hash"):
+                time.sleep(0.05)
+
+        profiler.wrap_file_writer(write, lambda name: (name, 1))("foo")
+
+        assert profiler.phases["hash"][0] >= 0.05
+        assert profiler.phases["archive"][0] < 0.05
+        (entry,) = profiler.get_summary()["slowest_files"]
+        assert entry["wall_time"] >= 0.05
+
+    def test_file_count(self, temp_dir):
+        profiler = BuildProfiler(str(temp_dir / "profile.json"))
+        wrapper = profiler.wrap_file_writer(lambda _: None, lambda name: (name, 1))
+        for i in range(PROFILE_FILE_COUNT + 5):
+            wrapper(str(i))
+
+        summary = profiler.get_summary()
+        assert len(summary["largest_files"]) == PROFILE_FILE_COUNT
+        assert len(summary["slowest_files"]) == PROFILE_FILE_COUNT
+        assert len(profiler.get_trace()["traceEvents"]) == PROFILE_FILE_COUNT + 5
+
+
+class TestBuild:
+    @pytest.fixture
+    def project_path(self, temp_dir, helpers):
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").touch()
+        (package_path / "data.bin").write_bytes(b"0" * 4096)
+        (project_path / DEFAULT_BUILD_SCRIPT).write_text(
+            helpers.dedent(
+                """
+                from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+                class CustomHook(BuildHookInterface):
+                    pass
+                """
+            )
+        )
+
+        return project_path
+
+    @staticmethod
+    def build(project_path, builder_class, profile_path, **target_config):
+        config = {
+            "project": {"name": "my-app", "version": "0.0.1"},
+            "tool": {
+                "hatch": {
+                    "build": {"hooks": {"custom": {}}, "targets": {builder_class.PLUGIN_NAME: target_config}},
+                },
+            },
+        }
+        builder = builder_class(str(project_path), config=config)
+        with project_path.as_cwd(env_vars={BuildEnvVars.PROFILE: str(profile_path)}):
+            return list(builder.build(directory=str(project_path / "dist"), versions=["standard"]))
+
+    def test_summary(self, project_path, temp_dir):
+        profile_path = temp_dir / "profile" / "build.json"
+        self.build(project_path, WheelBuilder, profile_path)
+
+        summary = json.loads(profile_path.read_text())
+
+        assert summary["trace"] == str(temp_dir / "profile" / "build.trace.json")
+        assert summary["wall_time"] > 0
+        assert set(summary["phases"]) == {"archive", "build", "compress", "hash", "hooks", "match", "metadata", "walk"}
+        assert summary["phases"]["hooks"]["count"] == 2
+        assert summary["phases"]["walk"]["count"] == 2
+        assert summary["phases"]["match"]["count"] > 0
+        # Every file and metadata file is hashed and compressed once
+        assert summary["phases"]["archive"]["count"] == 5
+        assert summary["phases"]["hash"]["count"] == 5
+        assert summary["phases"]["compress"]["count"] == 5
+        for totals in summary["phases"].values():
+            assert sorted(totals) == ["count", "cpu_time", "wall_time"]
+
+        (build,) = summary["builds"]
+        assert build["target"] == "wheel"
+        assert build["version"] == "standard"
+        assert sorted(build) == ["cpu_time", "target", "version", "wall_time"]
+
+        assert [(hook["hook"], hook["stage"]) for hook in summary["hooks"]] == [
+            ("custom", "initialize"),
+            ("custom", "finalize"),
+        ]
+
+        assert summary["largest_files"][0]["path"] == "my_app/data.bin"
+        assert summary["largest_files"][0]["size"] == 4096
+        assert sorted(entry["path"] for entry in summary["slowest_files"]) == [
+            "my_app-0.0.1.dist-info/METADATA",
+            "my_app-0.0.1.dist-info/RECORD",
+            "my_app-0.0.1.dist-info/WHEEL",
+            "my_app/__init__.py",
+            "my_app/data.bin",
+        ]
+
+    def test_trace(self, project_path, temp_dir):
+        self.build(project_path, WheelBuilder, temp_dir / "profile.json")
+
+        trace = json.loads((temp_dir / "profile.trace.json").read_text())
+        events = trace["traceEvents"]
+
+        assert trace["displayTimeUnit"] == "ms"
+        assert [event["ts"] for event in events] == sorted(event["ts"] for event in events)
+        for event in events:
+            assert event["ph"] == "X"
+            assert sorted(event) == ["args", "cat", "dur", "name", "ph", "pid", "tid", "ts"]
+            assert "cpu_time" in event["args"]
+
+        assert [event["name"] for event in events if event["cat"] != "archive"] == [
+            "validate metadata",
+            "custom.initialize",
+            "wheel:standard",
+            "custom.finalize",
+        ]
+
+        # Files are added while the artifact is built
+        (build_event,) = (event for event in events if event["cat"] == "build")
+        file_events = [event for event in events if event["cat"] == "archive"]
+        assert {event["name"] for event in file_events} == {
+            "my_app-0.0.1.dist-info/METADATA",
+            "my_app-0.0.1.dist-info/RECORD",
+            "my_app-0.0.1.dist-info/WHEEL",
+            "my_app/__init__.py",
+            "my_app/data.bin",
+        }
+        for event in file_events:
+            assert build_event["ts"] <= event["ts"] <= build_event["ts"] + build_event["dur"]
+
+    def test_accumulate_targets(self, project_path, temp_dir):
+        profile_path = temp_dir / "profile.json"
+        self.build(project_path, SdistBuilder, profile_path)
+        self.build(project_path, WheelBuilder, profile_path)
+
+        summary = json.loads(profile_path.read_text())
+
+        assert [build["target"] for build in summary["builds"]] == ["sdist", "wheel"]
+        assert "my_app-0.0.1/my_app/data.bin" in {entry["path"] for entry in summary["largest_files"]}
+        assert "my_app/data.bin" in {entry["path"] for entry in summary["largest_files"]}
+
+    def test_reused_files(self, project_path, temp_dir):
+        self.build(project_path, WheelBuilder, temp_dir / "first.json", incremental=True)
+        self.build(project_path, WheelBuilder, temp_dir / "second.json", incremental=True)
+
+        first = json.loads((temp_dir / "first.json").read_text())
+        second = json.loads((temp_dir / "second.json").read_text())
+
+        assert "copy" not in first["phases"]
+        assert second["phases"]["copy"]["count"] == 2
+        # Unchanged files are hashed to be compared with the previous wheel, and only metadata is compressed
+        assert second["phases"]["hash"]["count"] == 5
+        assert second["phases"]["compress"]["count"] == 3
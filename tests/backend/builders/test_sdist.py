@@ -1,3 +1,5 @@
+import gzip
+import io
 import os
 import tarfile
 
@@ -33,6 +35,44 @@ class TestSupportLegacy:
         assert builder.config.support_legacy is builder.config.support_legacy is True
 
 
+class TestCompressionWorkers:
+    def test_default(self, isolation):
+        builder = SdistBuilder(str(isolation))
+
+        assert builder.config.compression_workers == 1
+
+    def test_correct(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"compression-workers": 4}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.compression_workers == 4
+
+    def test_cpu_count(self, isolation, mocker):
+        mocker.patch("os.cpu_count", return_value=9000)
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"compression-workers": 0}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.compression_workers == 9000
+
+    def test_not_integer(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"compression-workers": True}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.sdist.compression-workers` must be an integer"
+        ):
+            _ = builder.config.compression_workers
+
+    def test_negative(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"sdist": {"compression-workers": -1}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match="Field `tool.hatch.build.targets.sdist.compression-workers` must not be negative"
+        ):
+            _ = builder.config.compression_workers
+
+
 class TestCoreMetadataConstructor:
     def test_default(self, isolation):
         builder = SdistBuilder(str(isolation))
@@ -685,6 +725,58 @@ class TestBuildStandard:
         stat = os.stat(str(extraction_directory / builder.project_id / "PKG-INFO"))
         assert stat.st_mtime == get_reproducible_timestamp()
 
+    def test_compression_workers(self, hatch, helpers, temp_dir, config_file):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        (project_path / "my_app" / "data.bin").write_bytes(os.urandom(500000))
+
+        def build(compression_workers):
+            config = {
+                "project": {"name": project_name, "dynamic": ["version"]},
+                "tool": {
+                    "hatch": {
+                        "version": {"path": "my_app/__about__.py"},
+                        "build": {
+                            "targets": {
+                                "sdist": {"versions": ["standard"], "compression-workers": compression_workers},
+                            },
+                        },
+                    },
+                },
+            }
+            builder = SdistBuilder(str(project_path), config=config)
+            with project_path.as_cwd():
+                (artifact,) = builder.build(directory=str(temp_dir / f"dist{compression_workers}"))
+
+            with open(artifact, "rb") as f:
+                return f.read()
+
+        serial = build(1)
+        parallel = build(2)
+
+        # The output does not depend on the number of workers
+        assert build(4) == parallel
+        assert gzip.decompress(parallel) == gzip.decompress(serial)
+
+        extraction_directory = temp_dir / "_archive"
+        extraction_directory.mkdir()
+
+        with tarfile.open(fileobj=io.BytesIO(parallel), mode="r:gz") as tar_archive:
+            tar_archive.extractall(str(extraction_directory), **helpers.tarfile_extraction_compat_options())
+
+        assert (extraction_directory / "my_app-0.0.1" / "my_app" / "data.bin").read_bytes() == (
+            project_path / "my_app" / "data.bin"
+        ).read_bytes()
+
     def test_default_no_reproducible(self, hatch, helpers, temp_dir, config_file):
         config_file.model.template.plugins["default"]["src-layout"] = False
         config_file.save()
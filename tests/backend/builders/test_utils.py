@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from hatchling.builders.utils import safe_walk, scan_directory
+
+
+def walk(path, **kwargs):
+    return [(os.path.relpath(root, path), dirs, files) for root, dirs, files in safe_walk(str(path), **kwargs)]
+
+
+@pytest.fixture
+def tree(temp_dir):
+    for relative_path in ("b/2.txt", "b/1.txt", "a/z/3.txt", "a/y/4.txt", "c/5.txt", "0.txt"):
+        path = temp_dir / "tree" / relative_path
+        path.parent.ensure_dir_exists()
+        path.touch()
+
+    return temp_dir / "tree"
+
+
+class TestScanDirectory:
+    def test_sorted(self, tree):
+        assert scan_directory(str(tree)) == (["a", "b", "c"], ["0.txt"], {})
+
+    def test_missing(self, temp_dir):
+        assert scan_directory(str(temp_dir / "missing")) is None
+
+    @pytest.mark.requires_unix
+    def test_links(self, tree, temp_dir):
+        (tree / "link").symlink_to(tree / "a")
+        (tree / "broken").symlink_to(temp_dir / "missing")
+
+        assert scan_directory(str(tree)) == (
+            ["a", "b", "c", "link"],
+            ["0.txt", "broken"],
+            {"link": os.path.realpath(tree / "a")},
+        )
+
+
+class TestSafeWalk:
+    @pytest.mark.parametrize("max_workers", [1, 8])
+    def test_order(self, tree, max_workers):
+        assert walk(tree, max_workers=max_workers) == [
+            (".", ["a", "b", "c"], ["0.txt"]),
+            ("a", ["y", "z"], []),
+            (os.path.join("a", "y"), [], ["4.txt"]),
+            (os.path.join("a", "z"), [], ["3.txt"]),
+            ("b", [], ["1.txt", "2.txt"]),
+            ("c", [], ["5.txt"]),
+        ]
+
+    def test_same_as_os_walk(self, tree):
+        expected = []
+        for root, dirs, files in os.walk(tree):
+            dirs.sort()
+            expected.append((os.path.relpath(root, tree), dirs, sorted(files)))
+
+        assert walk(tree) == expected
+
+    def test_prune(self, tree, mocker):
+        scan = mocker.patch("hatchling.builders.utils.scan_directory", wraps=scan_directory)
+
+        roots = []
+        for root, dirs, _ in safe_walk(str(tree)):
+            roots.append(os.path.relpath(root, tree))
+            dirs[:] = [d for d in dirs if d != "a"]
+
+        assert roots == [".", "b", "c"]
+        assert str(tree / "a") not in [call.args[0] for call in scan.call_args_list]
+
+    def test_missing(self, temp_dir):
+        assert walk(temp_dir / "missing") == []
+
+    def test_stop_early(self, tree):
+        walker = safe_walk(str(tree))
+
+        assert next(iter(walker))[0] == str(tree)
+        walker.close()
+
+    @pytest.mark.requires_unix
+    def test_loop(self, tree):
+        (tree / "a" / "loop").symlink_to(tree)
+
+        assert [root for root, _, _ in walk(tree)] == [
+            ".",
+            "a",
+            os.path.join("a", "y"),
+            os.path.join("a", "z"),
+            "b",
+            "c",
+        ]
+
+    @pytest.mark.requires_unix
+    def test_visited_once(self, tree):
+        (tree / "0-link").symlink_to(tree / "c")
+
+        assert [root for root, _, _ in walk(tree)] == [
+            ".",
+            "0-link",
+            "a",
+            os.path.join("a", "y"),
+            os.path.join("a", "z"),
+            "b",
+        ]
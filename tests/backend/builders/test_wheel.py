@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import os
 import platform
 import sys
@@ -11,7 +12,7 @@ import pytest
 
 from hatchling.builders.plugin.interface import BuilderInterface
 from hatchling.builders.utils import get_known_python_major_versions
-from hatchling.builders.wheel import WheelBuilder
+from hatchling.builders.wheel import WheelArchive, WheelBuilder
 from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
 
@@ -680,6 +681,141 @@ class TestBypassSelection:
             _ = builder.config.bypass_selection
 
 
+class TestIncremental:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.incremental is False
+
+    def test_correct(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"incremental": True}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.incremental is True
+
+    def test_not_boolean(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"incremental": 9000}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match="Field `tool.hatch.build.targets.wheel.incremental` must be a boolean"):
+            _ = builder.config.incremental
+
+
+class TestCompressionLevel:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.compression_level is None
+
+    def test_correct(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-level": 1}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.compression_level == 1
+
+    def test_not_integer(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-level": True}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.wheel.compression-level` must be an integer"
+        ):
+            _ = builder.config.compression_level
+
+    def test_out_of_range(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-level": 10}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match="Field `tool.hatch.build.targets.wheel.compression-level` must be between 0 and 9"
+        ):
+            _ = builder.config.compression_level
+
+
+class TestCompressionRules:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.compression_rules == []
+
+    def test_correct(self, isolation):
+        config = {
+            "tool": {
+                "hatch": {
+                    "build": {
+                        "targets": {"wheel": {"compression-rules": {"*.png": "stored", "*.so": "deflated", "*.py": 1}}}
+                    }
+                }
+            }
+        }
+        builder = WheelBuilder(str(isolation), config=config)
+
+        rules = builder.config.compression_rules
+
+        assert [(method, level) for _, method, level in rules] == [
+            (zipfile.ZIP_STORED, None),
+            (zipfile.ZIP_DEFLATED, None),
+            (zipfile.ZIP_DEFLATED, 1),
+        ]
+        assert rules[0][0].match_file("pkg/images/foo.png")
+        assert not rules[0][0].match_file("pkg/foo.py")
+
+    def test_not_mapping(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-rules": ["*.png"]}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.wheel.compression-rules` must be a mapping"
+        ):
+            _ = builder.config.compression_rules
+
+    def test_empty_pattern(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-rules": {"": "stored"}}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError,
+            match="Pattern #1 in field `tool.hatch.build.targets.wheel.compression-rules` cannot be an empty string",
+        ):
+            _ = builder.config.compression_rules
+
+    @pytest.mark.parametrize("compression", ["bzip2", 10, True])
+    def test_unknown_compression(self, isolation, compression):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"compression-rules": {"*.png": compression}}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError,
+            match=(
+                "Compression for pattern `\\*.png` in field `tool.hatch.build.targets.wheel.compression-rules` "
+                "must be one of `stored`, `deflated` or a level between 0 and 9"
+            ),
+        ):
+            _ = builder.config.compression_rules
+
+
+class TestDetectIncompressible:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.detect_incompressible is True
+
+    def test_correct(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"detect-incompressible": False}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.detect_incompressible is False
+
+    def test_not_boolean(self, isolation):
+        config = {"tool": {"hatch": {"build": {"targets": {"wheel": {"detect-incompressible": 9000}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match="Field `tool.hatch.build.targets.wheel.detect-incompressible` must be a boolean"
+        ):
+            _ = builder.config.detect_incompressible
+
+
 class TestConstructEntryPointsFile:
     def test_default(self, isolation):
         config = {"project": {}}
@@ -884,6 +1020,242 @@ class TestBuildStandard:
             zip_info = zip_archive.getinfo(f"{metadata_directory}/WHEEL")
             assert zip_info.date_time == expected_date_time
 
+    @pytest.mark.parametrize("reproducible", [True, False])
+    def test_incremental(self, hatch, temp_dir, config_file, mocker, reproducible):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        (package_path / "data.bin").write_bytes(os.urandom(100000))
+        (package_path / "lib.py").write_text("foo = 1\n")
+
+        def get_builder(*, incremental):
+            config = {
+                "project": {"name": project_name, "dynamic": ["version"]},
+                "tool": {
+                    "hatch": {
+                        "version": {"path": "my_app/__about__.py"},
+                        "build": {
+                            "targets": {
+                                "wheel": {
+                                    "versions": ["standard"],
+                                    "reproducible": reproducible,
+                                    "incremental": incremental,
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            return WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / "dist"
+        fresh_build_path = project_path / "fresh"
+
+        with project_path.as_cwd():
+            (artifact,) = get_builder(incremental=True).build(directory=str(build_path))
+
+        (package_path / "lib.py").write_text("foo = 2\n")
+        (package_path / "__about__.py").write_text('__version__ = "1.2.3"\n')
+        spy = mocker.spy(WheelArchive, "add_file")
+
+        with project_path.as_cwd():
+            (artifact,) = get_builder(incremental=True).build(directory=str(build_path))
+            (fresh_artifact,) = get_builder(incremental=False).build(directory=str(fresh_build_path))
+
+        archive = spy.call_args_list[0].args[0]
+        assert archive.reused_files == 2
+
+        with zipfile.ZipFile(artifact) as zip_archive, zipfile.ZipFile(fresh_artifact) as fresh_zip_archive:
+            assert zip_archive.testzip() is None
+            assert [zip_info.filename for zip_info in zip_archive.infolist()] == [
+                zip_info.filename for zip_info in fresh_zip_archive.infolist()
+            ]
+            for zip_info in zip_archive.infolist():
+                assert zip_archive.read(zip_info) == fresh_zip_archive.read(zip_info.filename)
+
+            assert zip_archive.read("my_app/lib.py") == b"foo = 2\n"
+
+        if reproducible:
+            with open(artifact, "rb") as f, open(fresh_artifact, "rb") as fresh_f:
+                assert f.read() == fresh_f.read()
+
+    def test_incremental_invalid_previous(self, hatch, temp_dir, config_file):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        config = {
+            "project": {"name": project_name, "dynamic": ["version"]},
+            "tool": {
+                "hatch": {
+                    "version": {"path": "my_app/__about__.py"},
+                    "build": {"targets": {"wheel": {"versions": ["standard"], "incremental": True}}},
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / "dist"
+        build_path.mkdir()
+        (build_path / f"{builder.project_id}-{get_python_versions_tag()}-none-any.whl").write_text("foo")
+
+        with project_path.as_cwd():
+            (artifact,) = builder.build(directory=str(build_path))
+
+        with zipfile.ZipFile(artifact) as zip_archive:
+            assert zip_archive.testzip() is None
+
+    def test_compression_policy(self, hatch, temp_dir, config_file):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        package_path = project_path / "my_app"
+        (package_path / "data.bin").write_bytes(os.urandom(100000))
+        (package_path / "data.txt").write_text("foo\n" * 10000)
+        (package_path / "lib.py").write_text("foo = 1\n" * 1000)
+
+        config = {
+            "project": {"name": project_name, "dynamic": ["version"]},
+            "tool": {
+                "hatch": {
+                    "version": {"path": "my_app/__about__.py"},
+                    "build": {
+                        "targets": {
+                            "wheel": {"versions": ["standard"], "compression-rules": {"*.txt": "stored", "*.py": 1}}
+                        }
+                    },
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / "dist"
+
+        with project_path.as_cwd():
+            (artifact,) = builder.build(directory=str(build_path))
+
+        metadata_directory = f"{builder.project_id}.dist-info"
+        with zipfile.ZipFile(artifact) as zip_archive:
+            assert zip_archive.testzip() is None
+            assert zip_archive.getinfo("my_app/data.bin").compress_type == zipfile.ZIP_STORED
+            assert zip_archive.getinfo("my_app/data.txt").compress_type == zipfile.ZIP_STORED
+            assert zip_archive.getinfo("my_app/lib.py").compress_type == zipfile.ZIP_DEFLATED
+            assert zip_archive.getinfo(f"{metadata_directory}/WHEEL").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_compression_policy_editable(self, hatch, temp_dir, config_file):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        config = {
+            "project": {"name": project_name, "dynamic": ["version"]},
+            "tool": {
+                "hatch": {
+                    "version": {"path": "my_app/__about__.py"},
+                    "build": {"targets": {"wheel": {"versions": ["editable"], "compression-rules": {"*.pth": 9}}}},
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / "dist"
+
+        with project_path.as_cwd():
+            (artifact,) = builder.build(directory=str(build_path))
+
+        with zipfile.ZipFile(artifact) as zip_archive:
+            assert zip_archive.testzip() is None
+            for zip_info in zip_archive.infolist():
+                expected = zipfile.ZIP_DEFLATED if zip_info.filename.endswith(".pth") else zipfile.ZIP_STORED
+                assert zip_info.compress_type == expected, zip_info.filename
+
+    def test_build_cache(self, hatch, helpers, temp_dir, config_file, mocker):
+        config_file.model.template.plugins["default"]["src-layout"] = False
+        config_file.save()
+
+        project_name = "My.App"
+
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / "my-app"
+        (project_path / DEFAULT_BUILD_SCRIPT).write_text(
+            helpers.dedent(
+                """
+                from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+                class CustomHook(BuildHookInterface):
+                    def initialize(self, version, build_data):
+                        build_data['force_include'][__file__] = 'my_app/hook.py'
+                """
+            )
+        )
+
+        def build():
+            config = {
+                "project": {"name": project_name, "dynamic": ["version"]},
+                "tool": {
+                    "hatch": {
+                        "version": {"path": "my_app/__about__.py"},
+                        "build": {"targets": {"wheel": {"versions": ["standard"], "hooks": {"custom": {}}}}},
+                    },
+                },
+            }
+            builder = WheelBuilder(str(project_path), config=config)
+            with project_path.as_cwd(env_vars={"HATCH_BUILD_CACHE": str(temp_dir / "cache")}):
+                (artifact,) = builder.build(directory=str(project_path / "dist"))
+
+            with open(artifact, "rb") as f:
+                return f.read()
+
+        spy = mocker.spy(WheelBuilder, "build_standard")
+        first = build()
+        (project_path / "dist").remove()
+
+        # Build hooks are not run again when reused
+        assert build() == first
+        assert spy.call_count == 1
+
+        (project_path / "my_app" / "lib.py").write_text("foo = 1\n")
+        with zipfile.ZipFile(io.BytesIO(build())) as zip_archive:
+            assert "my_app/lib.py" in zip_archive.namelist()
+            assert "my_app/hook.py" in zip_archive.namelist()
+
+        assert spy.call_count == 2
+
     def test_default_no_reproducible(self, hatch, helpers, temp_dir, config_file):
         config_file.model.template.plugins["default"]["src-layout"] = False
         config_file.save()
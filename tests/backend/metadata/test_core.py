@@ -1885,3 +1885,60 @@ class TestSourceDistributionMetadata:
                 "scripts": {"foo": "bar"},
                 "dynamic": ["scripts"],
             }
+
+
+class TestCoreMetadataSnapshot:
+    @pytest.fixture
+    def constructor(self, latest_spec, mocker):
+        return mocker.MagicMock(side_effect=latest_spec)
+
+    def test_render_once(self, isolation, constructor):
+        metadata = ProjectMetadata(str(isolation), None, {"project": {"name": "foo", "version": "0.1.0"}})
+
+        contents = metadata.render_core_metadata(constructor)
+        assert metadata.render_core_metadata(constructor) == contents
+        assert constructor.call_count == 1
+
+        assert "Requires-Dist: bar" in metadata.render_core_metadata(constructor, ["bar"])
+        assert metadata.render_core_metadata(constructor, ("bar",)) is not contents
+        assert constructor.call_count == 2
+
+    def test_reuse(self, temp_dir, latest_spec):
+        config = {"project": {"name": "foo", "version": "0.1.0"}}
+        metadata_file = temp_dir / "METADATA"
+        contents = ProjectMetadata(str(temp_dir), None, config).render_core_metadata(latest_spec)
+        metadata_file.write_text(f"{contents}Summary: bar\n")
+
+        metadata = ProjectMetadata(str(temp_dir), None, config)
+
+        assert metadata.reuse_core_metadata(latest_spec, str(metadata_file))
+        assert metadata.render_core_metadata(latest_spec) == metadata_file.read_text()
+        assert metadata.render_core_metadata(latest_spec, ["bar"]) != metadata_file.read_text()
+
+    def test_reuse_unknown_constructor(self, temp_dir, latest_spec, constructor):
+        config = {"project": {"name": "foo", "version": "0.1.0"}}
+        metadata_file = temp_dir / "METADATA"
+        metadata_file.write_text(ProjectMetadata(str(temp_dir), None, config).render_core_metadata(latest_spec))
+
+        assert not ProjectMetadata(str(temp_dir), None, config).reuse_core_metadata(constructor, str(metadata_file))
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            pytest.param("Metadata-Version: 1.2\nName: foo\nVersion: 0.1.0\n", id="metadata version"),
+            pytest.param(f"Metadata-Version: {LATEST_METADATA_VERSION}\nName: bar\nVersion: 0.1.0\n", id="name"),
+            pytest.param(f"Metadata-Version: {LATEST_METADATA_VERSION}\nName: foo\nVersion: 0.2.0\n", id="version"),
+        ],
+    )
+    def test_reuse_mismatch(self, temp_dir, latest_spec, contents):
+        metadata_file = temp_dir / "METADATA"
+        metadata_file.write_text(contents)
+        metadata = ProjectMetadata(str(temp_dir), None, {"project": {"name": "foo", "version": "0.1.0"}})
+
+        assert not metadata.reuse_core_metadata(latest_spec, str(metadata_file))
+        assert metadata.render_core_metadata(latest_spec) != contents
+
+    def test_reuse_missing(self, temp_dir, latest_spec):
+        metadata = ProjectMetadata(str(temp_dir), None, {"project": {"name": "foo", "version": "0.1.0"}})
+
+        assert not metadata.reuse_core_metadata(latest_spec, str(temp_dir / "METADATA"))
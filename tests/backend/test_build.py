@@ -1,3 +1,5 @@
+import zipfile
+
 from hatchling.build import build_editable, build_sdist, build_wheel
 
 
@@ -122,3 +124,38 @@ def test_editable(hatch, helpers, temp_dir, config_file):
     assert len(build_artifacts) == 1
     assert expected_artifact == str(build_artifacts[0].name)
     assert expected_artifact.endswith(".whl")
+
+
+def test_wheel_prepared_metadata(helpers, temp_dir):
+    from hatchling.build import prepare_metadata_for_build_wheel
+
+    project_path = temp_dir / "my-app"
+    (project_path / "my_app").mkdir(parents=True)
+    (project_path / "my_app" / "__init__.py").touch()
+    (project_path / "pyproject.toml").write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = 'my-app'
+            version = '0.1.0'
+            """
+        )
+    )
+
+    metadata_path = temp_dir / "metadata"
+    metadata_path.mkdir()
+    build_path = temp_dir / "dist"
+    build_path.mkdir()
+
+    with project_path.as_cwd():
+        metadata_directory = metadata_path / prepare_metadata_for_build_wheel(str(metadata_path))
+        # Prove that the prepared file is used rather than rendered again
+        metadata_file = metadata_directory / "METADATA"
+        metadata_file.write_text(
+            metadata_file.read_text().replace("Version: 0.1.0\n", "Version: 0.1.0\nSummary: foo\n")
+        )
+
+        artifact = build_wheel(str(build_path), metadata_directory=str(metadata_directory))
+
+    with zipfile.ZipFile(str(build_path / artifact)) as wheel:
+        assert wheel.read("my_app-0.1.0.dist-info/METADATA").decode("utf-8") == metadata_file.read_text()
@@ -0,0 +1,84 @@
+import pytest
+from packaging.specifiers import SpecifierSet
+
+from hatchling.utils.specifiers import VersionRanges
+
+
+class TestSupports:
+    @pytest.mark.parametrize(
+        ("specifier", "expected"),
+        [
+            ("", ["2", "3"]),
+            (">3", ["3"]),
+            (">=2.7", ["2", "3"]),
+            ("<3", ["2"]),
+            ("<=3.11.4", ["2", "3"]),
+            ("==3.11.4", ["3"]),
+            ("==3.*", ["3"]),
+            ("!=2.*", ["3"]),
+            ("~=2.7", ["2"]),
+            ("~=3.11.2", ["3"]),
+            (">=3.11.0rc1", ["3"]),
+            ("<3.0.0a1", ["2"]),
+            (">2.7.18,<3", ["2"]),
+            ("==3.12.0rc1", []),
+            ("==3.11+local", []),
+            (">=3,<3", []),
+            ("===3.11", ["3"]),
+            ("===foo", []),
+        ],
+    )
+    def test_major(self, specifier, expected):
+        ranges = VersionRanges.from_specifier_set(specifier)
+
+        assert [major for major in ("2", "3") if ranges.supports(major)] == expected
+
+    def test_minor(self):
+        ranges = VersionRanges.from_specifier_set(">=3.9,!=3.10.*,<3.12.1")
+
+        assert [f"3.{minor}" for minor in range(15) if ranges.supports(f"3.{minor}")] == ["3.9", "3.11", "3.12"]
+
+    def test_invalid_prefix(self):
+        ranges = VersionRanges.from_specifier_set("")
+
+        assert not ranges.supports("3.14t")
+        assert not ranges.supports_latest("3.14t")
+
+    def test_specifier_set(self):
+        assert VersionRanges.from_specifier_set(SpecifierSet(">=3.9")).supports("3")
+
+    def test_empty(self):
+        assert not VersionRanges.from_specifier_set(">=3.11,<3.10")
+        assert VersionRanges.from_specifier_set(">=3.10,<3.11")
+
+
+class TestSupportsLatest:
+    @pytest.mark.parametrize(
+        ("specifier", "expected"),
+        [
+            ("", ["3.10", "3.11", "3.12"]),
+            (">=3.11.4", ["3.11", "3.12"]),
+            (">=3.10,<3.11", ["3.10"]),
+            ("<=3.11.4", ["3.10"]),
+            ("==3.11.4", []),
+            ("~=3.11.2", ["3.11"]),
+            ("!=3.11.*", ["3.10", "3.12"]),
+        ],
+    )
+    def test_minor(self, specifier, expected):
+        ranges = VersionRanges.from_specifier_set(specifier)
+
+        assert [minor for minor in ("3.10", "3.11", "3.12") if ranges.supports_latest(minor)] == expected
+
+    def test_same_as_probing(self):
+        specifiers = [">=3.8", ">=3.11.4", "<3.11.4", "<=3.12", "!=3.11.*", "~=3.10.5", ">3.9,<3.12", "==3.11.*"]
+        for specifier in specifiers:
+            specifier_set = SpecifierSet(specifier)
+            ranges = VersionRanges.from_specifier_set(specifier_set)
+
+            for minor in range(7, 15):
+                distribution = f"3.{minor}"
+                assert ranges.supports_latest(distribution) is specifier_set.contains(f"{distribution}.100"), (
+                    specifier,
+                    distribution,
+                )
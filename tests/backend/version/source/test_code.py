@@ -125,3 +125,119 @@ def test_search_paths(temp_dir, helpers):
 
     with temp_dir.as_cwd():
         assert source.get_version_data()["version"] == "1.0.0.1.dev0"
+
+
+def test_static_no_execution(temp_dir, helpers):
+    source = CodeSource(str(temp_dir), {"path": "a/b.py"})
+
+    file_path = temp_dir / "a" / "b.py"
+    file_path.ensure_parent_dir_exists()
+    file_path.write_text(
+        helpers.dedent(
+            """
+            import this_module_does_not_exist
+
+            __version__: str = "1.2.3"
+            """
+        )
+    )
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "1.2.3"
+
+
+def test_static_custom_expression_unpacking(temp_dir, helpers):
+    source = CodeSource(str(temp_dir), {"path": "a/b.py", "expression": "VERSION"})
+
+    file_path = temp_dir / "a" / "b.py"
+    file_path.ensure_parent_dir_exists()
+    file_path.write_text(
+        helpers.dedent(
+            """
+            import this_module_does_not_exist
+
+            AUTHOR, VERSION = "foo", "1.2.3"
+            """
+        )
+    )
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "1.2.3"
+
+
+def test_static_reassignment_executes(temp_dir, helpers):
+    source = CodeSource(str(temp_dir), {"path": "a/b.py"})
+
+    file_path = temp_dir / "a" / "b.py"
+    file_path.ensure_parent_dir_exists()
+    file_path.write_text(
+        helpers.dedent(
+            """
+            __version__ = "1.2.3"
+            if True:
+                __version__ = "3.2.1"
+            """
+        )
+    )
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "3.2.1"
+
+
+def test_static_star_import_executes(temp_dir, helpers):
+    source = CodeSource(str(temp_dir), {"path": "d/e.py", "search-paths": ["."]})
+
+    parent_dir = temp_dir / "d"
+    parent_dir.mkdir()
+    (parent_dir / "__init__.py").touch()
+    (parent_dir / "e.py").write_text(
+        helpers.dedent(
+            """
+            __version__ = "1.2.3"
+            from d.f import *
+            """
+        )
+    )
+    (parent_dir / "f.py").write_text('__all__ = ["__version__"]\n__version__ = "3.2.1"')
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "3.2.1"
+
+
+def test_cache(temp_dir, helpers):
+    source = CodeSource(str(temp_dir), {"path": "a/b.py", "expression": "foo()"})
+
+    file_path = temp_dir / "a" / "b.py"
+    file_path.ensure_parent_dir_exists()
+    log_path = temp_dir / "log.txt"
+    file_path.write_text(
+        helpers.dedent(
+            f"""
+            with open({str(log_path)!r}, "a") as f:
+                f.write("executed\\n")
+
+            def foo():
+                return "1.2.3"
+            """
+        )
+    )
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "1.2.3"
+        assert CodeSource(str(temp_dir), {"path": "a/b.py", "expression": "foo()"}).get_version_data() == {
+            "version": "1.2.3"
+        }
+
+    assert log_path.read_text() == "executed\n"
+
+    file_path.write_text(
+        helpers.dedent(
+            """
+            def foo():
+                return "3.2.1"
+            """
+        )
+    )
+
+    with temp_dir.as_cwd():
+        assert source.get_version_data()["version"] == "3.2.1"
@@ -1202,6 +1202,33 @@ def test_no_hooks_env_var(hatch, temp_dir, helpers):
     )
 
 
+@pytest.mark.requires_internet
+def test_cache(hatch, temp_dir_cache):
+    project_name = "My.App"
+
+    with temp_dir_cache.as_cwd():
+        result = hatch("new", project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir_cache / "my-app"
+
+    with path.as_cwd():
+        result = hatch("-v", "build", "--cache", "-t", "wheel:standard")
+        assert result.exit_code == 0, result.output
+        assert "Building `wheel` version `standard`" in result.output
+
+        result = hatch("-v", "build", "--cache", "-t", "wheel:standard")
+        assert result.exit_code == 0, result.output
+        assert "Reused `wheel` version `standard` from the build cache" in result.output
+
+    artifacts = list((path / "dist").iterdir())
+    assert len(artifacts) == 1
+
+    cache_directory = temp_dir_cache / "cache" / "builds" / "my-app" / "wheel" / "standard"
+    (entry,) = cache_directory.iterdir()
+    assert [artifact.name for artifact in entry.iterdir()] == [artifacts[0].name]
+
+
 @pytest.mark.requires_internet
 def test_debug_verbosity(hatch, temp_dir, helpers):
     project_name = "My.App"
@@ -121,7 +121,7 @@ def test_dep_sync_aborts_when_pip_locker_cannot_apply(hatch, helpers, temp_dir,
 
     mocker.patch.object(VirtualEnvironment, "safe_activation", skip_activation)
 
-    stub_pylock = "lock-version = 1\n"
+    stub_pylock = 'lock-version = "2.0"\n'
 
     def fake_generate(_environment, output_path, **_kwargs):
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -164,7 +164,7 @@ def test_dep_sync_aborts_when_pip_locker_cannot_apply(hatch, helpers, temp_dir,
 
     assert result.exit_code == 1
     assert "Cannot sync environment `default` from lockfile" in result.output
-    assert "Applying lockfiles with the pip locker is not yet supported." in result.output
+    assert "Unsupported lock version: 2.0" in result.output
     assert "Synced environment" not in result.output
 
 
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 
@@ -309,6 +310,79 @@ def test_new_selected_python(hatch, helpers, temp_dir, config_file, python_on_pa
     assert env_path.name == "test"
 
 
+def test_shared(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    env_paths = []
+    for project_name in ("My.App", "Other.App"):
+        with temp_dir.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / project_name.lower().replace(".", "-")
+        project = Project(project_path)
+        helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+        helpers.update_project_environment(project, "lint", {"shared": True})
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("env", "create", "lint")
+
+        assert result.exit_code == 0, result.output
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("env", "find", "lint")
+
+        assert result.exit_code == 0, result.output
+        env_paths.append(result.output.strip())
+
+    assert env_paths[0] == env_paths[1]
+
+    store_path = data_path / "env" / "virtual" / ".store"
+    env_dirs = list(store_path.iterdir())
+    assert len(env_dirs) == 1
+    assert str(env_dirs[0]) == env_paths[0]
+
+    metadata_files = sorted((data_path / "env" / ".metadata").rglob("lint.json"))
+    assert len(metadata_files) == 2
+    for metadata_file in metadata_files:
+        assert json.loads(metadata_file.read_text())["store_key"] == env_dirs[0].name
+
+
+def test_shared_different_dependencies(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        result = hatch("new", project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+    helpers.update_project_environment(project, "lint", {"shared": True})
+    helpers.update_project_environment(project, "docs", {"shared": True, "python-sources": ["external"]})
+
+    for env_name in ("lint", "docs"):
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch("env", "create", env_name)
+
+        assert result.exit_code == 0, result.output
+
+    store_path = data_path / "env" / "virtual" / ".store"
+    assert len(list(store_path.iterdir())) == 2
+
+
 def test_selected_absolute_directory(hatch, helpers, temp_dir, config_file):
     config_file.model.template.plugins["default"]["tests"] = False
     config_file.model.dirs.env = {"virtual": "$VENVS_DIR"}
@@ -1090,7 +1164,6 @@ def test_install_project_no_dev_mode(hatch, helpers, temp_dir, platform, uv_on_p
         Creating environment: test
         Installing project
         Checking dependencies
-        Syncing dependencies
         """
     )
 
@@ -1316,7 +1389,6 @@ def test_sync_dependencies_uv(hatch, helpers, temp_dir, platform, uv_on_path, ex
         Installing project in development mode
         Running post-installation commands
         Checking dependencies
-        Syncing dependencies
         """
     )
     assert (project_path / "test.txt").is_file()
@@ -1389,7 +1461,6 @@ def test_sync_dependencies_pip(hatch, helpers, temp_dir, platform, extract_insta
         Installing project in development mode
         Running post-installation commands
         Checking dependencies
-        Syncing dependencies
         """
     )
     assert (project_path / "test.txt").is_file()
@@ -2001,7 +2072,6 @@ def test_workspace(hatch, helpers, temp_dir, platform, uv_on_path, extract_insta
         Creating environment: default
         Installing project in development mode
         Checking dependencies
-        Syncing dependencies
         """
     )
 
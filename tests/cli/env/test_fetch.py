@@ -0,0 +1,157 @@
+import hashlib
+
+import pytest
+
+from hatch.project.core import Project
+from hatchling.builders.wheel import WheelBuilder
+
+
+@pytest.fixture
+def index(temp_dir):
+    """A local directory of built wheels that stands in for a package index."""
+    path = temp_dir / "index"
+    project_path = temp_dir / "my-dep"
+    (project_path / "my_dep").mkdir(parents=True)
+    (project_path / "my_dep" / "__init__.py").touch()
+
+    builder = WheelBuilder(str(project_path), config={"project": {"name": "my-dep", "version": "0.0.1"}})
+    with project_path.as_cwd():
+        list(builder.build(directory=str(path), versions=["standard"]))
+
+    return path
+
+
+@pytest.fixture
+def project_path(hatch, temp_dir, config_file, index):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    with temp_dir.as_cwd():
+        result = hatch("new", "My.App")
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / "my-app"
+    (wheel,) = index.iterdir()
+    digest = hashlib.sha256(wheel.read_bytes()).hexdigest()
+    (project_path / "pylock.toml").write_text(
+        f"""\
+lock-version = "1.0"
+created-by = "test"
+
+[[packages]]
+name = "my-dep"
+version = "0.0.1"
+wheels = [{{ path = "{wheel.as_posix()}", hashes = {{ sha256 = "{digest}" }} }}]
+"""
+    )
+
+    return project_path
+
+
+def test_undefined(hatch, helpers, project_path):
+    with project_path.as_cwd():
+        result = hatch("env", "fetch", "test")
+
+    assert result.exit_code == 1
+    assert result.output == helpers.dedent(
+        """
+        Environment `test` is not defined by project config
+        """
+    )
+
+
+def test_lockfile(hatch, helpers, project_path, index):
+    project = Project(project_path)
+    helpers.update_project_environment(
+        project,
+        "default",
+        {"skip-install": True, "locked": True, "dependencies": ["my-dep"], **project.config.envs["default"]},
+    )
+
+    with project_path.as_cwd():
+        result = hatch("env", "fetch")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Fetching distributions: default
+        Fetched 1 distribution for environment `default`
+        """
+    )
+
+    (wheel,) = index.iterdir()
+    wheelhouse = project_path / ".hatch" / "wheelhouse"
+    assert (wheelhouse / wheel.name).read_bytes() == wheel.read_bytes()
+
+    # Nothing is fetched again
+    with project_path.as_cwd():
+        result = hatch("env", "fetch")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Fetching distributions: default
+        Fetched 0 distributions for environment `default`
+        """
+    )
+
+
+def test_offline_install(hatch, helpers, project_path, index):
+    project = Project(project_path)
+    helpers.update_project_environment(
+        project,
+        "default",
+        {"skip-install": True, "locked": True, "dependencies": ["my-dep"], **project.config.envs["default"]},
+    )
+
+    with project_path.as_cwd():
+        result = hatch("env", "fetch")
+
+    assert result.exit_code == 0, result.output
+
+    # The stand-in index is gone, so the distribution can only come from the wheelhouse
+    for path in index.iterdir():
+        path.unlink()
+    (project_path / "pylock.toml").write_text(
+        (project_path / "pylock.toml").read_text().replace(str(index.as_posix()), "https://example.invalid")
+    )
+
+    helpers.update_project_environment(
+        project,
+        "default",
+        {
+            "skip-install": True,
+            "locked": True,
+            "offline": True,
+            "dependencies": ["my-dep"],
+            **project.config.envs["default"],
+        },
+    )
+
+    with project_path.as_cwd():
+        result = hatch("env", "run", "--", "python", "-c", "import my_dep")
+
+    assert result.exit_code == 0, result.output
+
+
+@pytest.mark.requires_internet
+def test_offline_project_install(hatch, helpers, project_path):
+    # The project is installed in dev mode, which also requires what the backend needs for editable builds
+    (project_path / "pylock.toml").unlink()
+
+    with project_path.as_cwd():
+        result = hatch("env", "fetch")
+
+    assert result.exit_code == 0, result.output
+
+    wheelhouse = project_path / ".hatch" / "wheelhouse"
+    assert any(path.name.startswith("editables-") for path in wheelhouse.iterdir())
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"offline": True, **project.config.envs["default"]})
+
+    with project_path.as_cwd():
+        result = hatch("env", "run", "--", "python", "-c", "import my_app")
+
+    assert result.exit_code == 0, result.output
@@ -91,6 +91,61 @@ def test_all(hatch, helpers, temp_dir_data, config_file):
     assert not storage_path.is_dir()
 
 
+def test_shared(hatch, helpers, temp_dir_data, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_paths = []
+    for project_name in ("My.App", "Other.App"):
+        with temp_dir_data.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir_data / project_name.lower().replace(".", "-")
+        project = Project(project_path)
+        helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+        helpers.update_project_environment(project, "lint", {"shared": True})
+        project_paths.append(project_path)
+
+        with project_path.as_cwd():
+            result = hatch("env", "create", "lint")
+
+        assert result.exit_code == 0, result.output
+
+    store_path = temp_dir_data / "data" / "env" / "virtual" / ".store"
+    env_dirs = list(store_path.iterdir())
+    assert len(env_dirs) == 1
+
+    env_path = env_dirs[0]
+
+    # The other project still references the environment
+    with project_paths[0].as_cwd():
+        result = hatch("env", "prune")
+
+    assert result.exit_code == 0, result.output
+    assert not result.output
+    assert env_path.is_dir()
+
+    # References of projects that no longer exist are dropped
+    project_paths[1].remove()
+    # Only the reference of the other project remains after pruning the first
+    metadata_dir = temp_dir_data / "data" / "env" / ".metadata"
+    assert len(list(metadata_dir.rglob("*.json"))) == 1
+
+    with project_paths[0].as_cwd():
+        result = hatch("env", "prune")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        f"""
+        Removing shared environment: {env_path.name}
+        """
+    )
+    assert not env_path.is_dir()
+    assert not list(metadata_dir.rglob("*.json"))
+
+
 def test_incompatible_ok(hatch, helpers, temp_dir_data, config_file):
     config_file.model.template.plugins["default"]["tests"] = False
     config_file.save()
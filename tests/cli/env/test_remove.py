@@ -448,3 +448,50 @@ def test_plugin_dependencies_unmet(hatch, helpers, temp_dir_data, config_file, m
 
     assert foo_env_path.is_dir()
     assert not bar_env_path.is_dir()
+
+
+def test_shared(hatch, helpers, temp_dir_data, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_paths = []
+    for project_name in ("My.App", "Other.App"):
+        with temp_dir_data.as_cwd():
+            result = hatch("new", project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir_data / project_name.lower().replace(".", "-")
+        project = Project(project_path)
+        helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+        helpers.update_project_environment(project, "lint", {"shared": True})
+        project_paths.append(project_path)
+
+        with project_path.as_cwd():
+            result = hatch("env", "create", "lint")
+
+        assert result.exit_code == 0, result.output
+
+    store_path = temp_dir_data / "data" / "env" / "virtual" / ".store"
+    env_dirs = list(store_path.iterdir())
+    assert len(env_dirs) == 1
+
+    env_path = env_dirs[0]
+
+    with project_paths[0].as_cwd():
+        result = hatch("env", "remove", "lint")
+
+    assert result.exit_code == 0, result.output
+    assert not result.output
+    assert env_path.is_dir()
+
+    with project_paths[1].as_cwd():
+        result = hatch("env", "remove", "lint")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Removing environment: lint
+        """
+    )
+    assert not env_path.is_dir()
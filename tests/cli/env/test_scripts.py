@@ -0,0 +1,47 @@
+from hatch.config.constants import ConfigEnvVars
+from hatch.env.store import ScriptCache
+
+
+def create_entry(temp_dir, key):
+    data_path = temp_dir / "data"
+    cache = ScriptCache(data_path / "env" / "virtual" / ".scripts")
+    (cache.directory / key).ensure_dir_exists()
+    cache.add(key, {"script": f"{key}.py", "python": "3.12", "dependencies": ["requests"]})
+    return cache
+
+
+def test_show_empty(hatch, helpers, temp_dir):
+    with temp_dir.as_cwd(env_vars={ConfigEnvVars.DATA: str(temp_dir / "data")}):
+        result = hatch("env", "scripts", "show")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        No script environments
+        """
+    )
+
+
+def test_show(hatch, temp_dir):
+    create_entry(temp_dir, "foo")
+
+    with temp_dir.as_cwd(env_vars={ConfigEnvVars.DATA: str(temp_dir / "data")}):
+        result = hatch("env", "scripts", "show", "--ascii")
+
+    assert result.exit_code == 0, result.output
+    assert "foo" in result.output
+    assert "foo.py" in result.output
+    assert "requests" in result.output
+    assert "0.0 MB" in result.output
+
+
+def test_purge(hatch, temp_dir):
+    cache = create_entry(temp_dir, "foo")
+    create_entry(temp_dir, "bar")
+
+    with temp_dir.as_cwd(env_vars={ConfigEnvVars.DATA: str(temp_dir / "data")}):
+        result = hatch("env", "scripts", "purge")
+
+    assert result.exit_code == 0, result.output
+    assert cache.entries() == []
+    assert not any(cache.directory.iterdir())
@@ -0,0 +1,136 @@
+import json
+
+import pytest
+
+from hatch.config.constants import ConfigEnvVars
+from hatch.env.watch import ERROR, READY
+from hatch.project.core import Project
+
+
+@pytest.fixture
+def project_path(hatch, temp_dir, config_file):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    with temp_dir.as_cwd():
+        result = hatch("new", "My.App")
+
+    assert result.exit_code == 0, result.output
+
+    return temp_dir / "my-app"
+
+
+@pytest.fixture
+def data_path(temp_dir):
+    path = temp_dir / "data"
+    path.mkdir()
+    return path
+
+
+def read_status(data_path):
+    (path,) = data_path.glob("env/.metadata/**/watch.json")
+    return json.loads(path.read_text())
+
+
+def test_undefined(hatch, helpers, project_path, data_path):
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("env", "watch", "test")
+
+    assert result.exit_code == 1
+    assert result.output == helpers.dedent(
+        """
+        Environment `test` is not defined by project config
+        """
+    )
+
+
+def test_sync(hatch, helpers, project_path, data_path, mocker):
+    helpers.update_project_environment(Project(project_path), "default", {"skip-install": True})
+    mocker.patch("hatch.env.watch.PollingWatcher.wait", side_effect=KeyboardInterrupt)
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("env", "watch", "--poll")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Synchronizing environment: default
+        Creating environment: default
+        Checking dependencies
+        Watching for changes: default
+        """
+    )
+    assert read_status(data_path)["states"] == {"default": READY}
+
+    # Commands skip their own checks while the configuration is unchanged
+    prepare_environment = mocker.patch("hatch.project.core.Project.prepare_environment")
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("run", "python", "-c", "")
+
+    assert result.exit_code == 0, result.output
+    prepare_environment.assert_not_called()
+
+    with (project_path / "pyproject.toml").open("a", encoding="utf-8") as f:
+        f.write("\n# changed\n")
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("run", "python", "-c", "")
+
+    assert result.exit_code == 0, result.output
+    prepare_environment.assert_called_once()
+
+
+def test_change(hatch, helpers, project_path, data_path, mocker):
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"skip-install": True})
+
+    def wait():
+        if wait.calls:
+            raise KeyboardInterrupt
+
+        wait.calls += 1
+        helpers.update_project_environment(project, "default", {"skip-install": True, "dependencies": ["foo bar"]})
+
+    wait.calls = 0
+    mocker.patch("hatch.env.watch.PollingWatcher.wait", side_effect=wait)
+    mocker.patch("hatch.cli.env.watch.WATCH_DEBOUNCE", 0)
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("env", "watch", "--poll")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Synchronizing environment: default") == 2
+    assert (
+        "Environment `default` could not be synchronized: "
+        "Dependency #1 of field `tool.hatch.envs.default.dependencies` is invalid"
+    ) in result.output
+    assert result.output.endswith("Watching for changes: default\n")
+    assert read_status(data_path)["states"] == {"default": ERROR}
+
+
+def test_retry_failed(hatch, helpers, project_path, data_path, mocker):
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"skip-install": True})
+    helpers.update_project_environment(project, "other", {"skip-install": True})
+
+    def wait():
+        if wait.calls:
+            raise KeyboardInterrupt
+
+        wait.calls += 1
+        # Only the lockfile of the other environment changes
+        (project_path / "pylock.other.toml").write_text('lock-version = "1.0"\n')
+
+    wait.calls = 0
+    mocker.patch("hatch.env.watch.PollingWatcher.wait", side_effect=wait)
+    mocker.patch("hatch.cli.env.watch.WATCH_DEBOUNCE", 0)
+    sync_environment = mocker.patch(
+        "hatch.cli.env.watch.sync_environment", side_effect=[(ERROR, ""), (READY, "foo"), (READY, "bar"), (READY, "baz")]
+    )
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("env", "watch", "--poll", "default", "other")
+
+    assert result.exit_code == 0, result.output
+    assert [call.args[1].name for call in sync_environment.call_args_list] == ["default", "other", "default", "other"]
+    assert read_status(data_path)["states"] == {"default": READY, "other": READY}
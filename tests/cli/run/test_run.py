@@ -781,6 +781,88 @@ def test_interrupt_signal_not_inherited(hatch, temp_dir, config_file):
     assert signal.getsignal(signal.SIGINT) is original_handler
 
 
+@pytest.mark.requires_unix
+def test_exec_single_command(hatch, helpers, temp_dir, config_file, mocker):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        result = hatch("new", project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, "default", {"skip-install": True, **project.config.envs["default"]})
+
+    original_handler = signal.getsignal(signal.SIGINT)
+    handlers = []
+
+    def execv(*_args):
+        handlers.append(signal.getsignal(signal.SIGINT))
+        raise SystemExit(0)
+
+    execv = mocker.patch("os.execv", side_effect=execv)
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), AppEnvVars.NO_EXEC: ""}):
+        result = hatch("run", "python", "-c", "import sys;print(sys.executable)")
+
+    assert result.exit_code == 0, result.output
+    # The process is replaced with the original handling of interrupts
+    assert handlers == [original_handler]
+
+    env_data_path = data_path / "env" / "virtual"
+    executable, args = execv.call_args.args
+    assert executable.startswith(str(env_data_path))
+    assert args == ["python", "-c", "import sys;print(sys.executable)"]
+
+
+@pytest.mark.requires_unix
+def test_exec_multiple_commands(hatch, helpers, temp_dir, config_file, mocker):
+    config_file.model.template.plugins["default"]["tests"] = False
+    config_file.save()
+
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        result = hatch("new", project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(
+        project,
+        "default",
+        {
+            "skip-install": True,
+            "scripts": {
+                "write": [
+                    "python -c \"import pathlib;pathlib.Path('1.txt').touch()\"",
+                    "python -c \"import pathlib;pathlib.Path('2.txt').touch()\"",
+                ],
+            },
+            **project.config.envs["default"],
+        },
+    )
+
+    execv = mocker.patch("os.execv")
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), AppEnvVars.NO_EXEC: ""}):
+        result = hatch("run", "write")
+
+    assert result.exit_code == 0, result.output
+    assert (project_path / "1.txt").is_file()
+    assert (project_path / "2.txt").is_file()
+    execv.assert_not_called()
+
+
 def test_error(hatch, helpers, temp_dir, config_file):
     config_file.model.template.plugins["default"]["tests"] = False
     config_file.save()
@@ -2478,9 +2560,11 @@ class TestScriptRunner:
         env_data_path = data_path / "env" / "virtual" / ".scripts"
         assert env_data_path.is_dir()
 
-        env_path = env_data_path / script.id
-        assert env_path.is_dir()
-        assert env_path.name == script.id
+        env_dirs = [path for path in env_data_path.iterdir() if path.is_dir()]
+        assert len(env_dirs) == 1
+
+        env_path = env_dirs[0]
+        assert (env_data_path / f".{env_path.name}.json").is_file()
 
         executable_path, unit_conversion = output_file.read_text().splitlines()
         executable = Path(executable_path)
@@ -2534,9 +2618,11 @@ class TestScriptRunner:
         env_data_path = data_path / "env" / "virtual" / ".scripts"
         assert env_data_path.is_dir()
 
-        env_path = env_data_path / script.id
-        assert env_path.is_dir()
-        assert env_path.name == script.id
+        env_dirs = [path for path in env_data_path.iterdir() if path.is_dir()]
+        assert len(env_dirs) == 1
+
+        env_path = env_dirs[0]
+        assert (env_data_path / f".{env_path.name}.json").is_file()
 
         executable_path, unit_conversion = output_file.read_text().splitlines()
         executable = Path(executable_path)
@@ -2614,9 +2700,11 @@ class TestScriptRunner:
         env_data_path = data_path / "env" / "virtual" / ".scripts"
         assert env_data_path.is_dir()
 
-        env_path = env_data_path / script.id
-        assert env_path.is_dir()
-        assert env_path.name == script.id
+        env_dirs = [path for path in env_data_path.iterdir() if path.is_dir()]
+        assert len(env_dirs) == 1
+
+        env_path = env_dirs[0]
+        assert (env_data_path / f".{env_path.name}.json").is_file()
 
         executable = Path(output_file.read_text())
         assert executable.is_file()
@@ -2667,9 +2755,11 @@ class TestScriptRunner:
         env_data_path = data_path / "env" / "virtual" / ".scripts"
         assert env_data_path.is_dir()
 
-        env_path = env_data_path / script.id
-        assert env_path.is_dir()
-        assert env_path.name == script.id
+        env_dirs = [path for path in env_data_path.iterdir() if path.is_dir()]
+        assert len(env_dirs) == 1
+
+        env_path = env_dirs[0]
+        assert (env_data_path / f".{env_path.name}.json").is_file()
 
         executable = Path(output_file.read_text())
         assert executable.is_file()
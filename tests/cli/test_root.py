@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 from hatch.config.constants import ConfigEnvVars
 from hatch.config.user import ConfigFile
@@ -39,3 +41,65 @@ def test_no_config_file(hatch, config_file):
 
     assert result.exit_code == 1
     assert result.output == f"The selected config file `{config_file.path}` does not exist.\n"
+
+
+# The maximum number of modules imported to start the CLI, most of which are from the standard library and Click
+STARTUP_MODULE_BUDGET = 200
+STARTUP_HATCH_MODULE_BUDGET = 12
+
+
+class TestLazyCommands:
+    def test_registered_commands(self, hatch):  # noqa: ARG002
+        from hatch.cli import LAZY_COMMANDS
+        from hatch.cli import hatch as hatch_group
+
+        for cmd_name in LAZY_COMMANDS:
+            command = hatch_group.get_command(None, cmd_name)
+
+            assert command is not None
+            assert command.name == cmd_name
+
+    def test_help(self, hatch):
+        from hatch.cli import LAZY_COMMANDS
+        from hatch.cli import hatch as hatch_group
+
+        result = hatch("--help")
+
+        assert result.exit_code == 0, result.output
+        # The short help of every command is read from the command itself
+        output = " ".join(result.output.split())
+        for cmd_name in LAZY_COMMANDS:
+            assert f"{cmd_name} {hatch_group.get_command(None, cmd_name).short_help}" in output
+
+    def test_startup_imports(self, hatch):  # noqa: ARG002
+        from hatch.cli import LAZY_COMMANDS
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "hatch", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # import time: self [us] | cumulative | imported package
+        import_times = {}
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+
+            _, cumulative, module = line.split("|")
+            import_times[module.strip()] = int(cumulative)
+
+        loaded_commands = sorted(
+            module
+            for module in import_times
+            if module in {import_path.split(":")[0] for import_path in LAZY_COMMANDS.values()}
+        )
+        assert not loaded_commands
+        assert "hatch.cli.application" not in import_times
+        assert "rich" not in import_times
+        assert "hatch.cli" in import_times
+
+        hatch_modules = sorted(module for module in import_times if module.split(".")[0] == "hatch")
+        assert len(hatch_modules) <= STARTUP_HATCH_MODULE_BUDGET, hatch_modules
+        assert len(import_times) <= STARTUP_MODULE_BUDGET, sorted(import_times)
@@ -129,9 +129,49 @@ def test_incompatible_environment(hatch, temp_dir, helpers, build_env_config):
     )
 
 
+def test_show_dynamic(hatch, temp_dir):
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        hatch("new", project_name)
+
+    path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch("version")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "0.0.1\n"
+    assert not (data_path / "env").exists()
+
+
+def test_show_dynamic_env_source(hatch, temp_dir):
+    project_name = "My.App"
+
+    with temp_dir.as_cwd():
+        hatch("new", project_name)
+
+    path = temp_dir / "my-app"
+    data_path = temp_dir / "data"
+    data_path.mkdir()
+
+    project = Project(path)
+    config = dict(project.raw_config)
+    config["tool"]["hatch"]["version"] = {"source": "env", "variable": "MY_APP_VERSION"}
+    project.save_config(config)
+
+    with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), "MY_APP_VERSION": "9.8.7"}):
+        result = hatch("version")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "9.8.7\n"
+
+
 @pytest.mark.requires_internet
 @pytest.mark.usefixtures("mock_backend_process")
-def test_show_dynamic(hatch, helpers, temp_dir):
+def test_show_dynamic_build_environment(hatch, helpers, temp_dir):
     project_name = "My.App"
 
     with temp_dir.as_cwd():
@@ -141,6 +181,12 @@ def test_show_dynamic(hatch, helpers, temp_dir):
     data_path = temp_dir / "data"
     data_path.mkdir()
 
+    # Third-party plugins may only be loaded by the Hatchling installed in the build environment
+    project = Project(path)
+    config = dict(project.raw_config)
+    config["build-system"]["requires"].append("binary")
+    project.save_config(config)
+
     with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
         result = hatch("version")
 
@@ -156,8 +202,51 @@ def test_show_dynamic(hatch, helpers, temp_dir):
     )
 
 
-@pytest.mark.requires_internet
-@pytest.mark.usefixtures("mock_backend_process")
+@pytest.mark.parametrize(
+    ("raw_config", "supported"),
+    [
+        pytest.param({}, True, id="default"),
+        pytest.param({"build-system": {"requires": ["Hatchling>=1"]}}, True, id="compatible hatchling"),
+        pytest.param({"build-system": {"requires": ["hatchling<1"]}}, False, id="incompatible hatchling"),
+        pytest.param({"build-system": {"requires": ["hatchling", "hatch-vcs"]}}, False, id="third-party requirement"),
+        pytest.param({"tool": {"hatch": {"version": {"source": "env"}}}}, True, id="env source"),
+        pytest.param({"tool": {"hatch": {"version": {"source": "code"}}}}, False, id="code source"),
+        pytest.param({"tool": {"hatch": {"version": {"scheme": "foo"}}}}, False, id="third-party scheme"),
+        pytest.param({"tool": {"hatch": {"metadata": {"hooks": {"custom": {}}}}}}, False, id="metadata hook"),
+        pytest.param({"tool": {"hatch": {"build": {"hooks": {"custom": {}}}}}}, False, id="build hook"),
+        pytest.param(
+            {"tool": {"hatch": {"build": {"targets": {"wheel": {"hooks": {"custom": {}}}}}}}},
+            False,
+            id="target build hook",
+        ),
+    ],
+)
+def test_in_process_support(temp_dir, raw_config, supported):
+    from hatch.cli.version import supports_in_process_version
+    from hatchling.metadata.core import ProjectMetadata
+
+    def merge(target, source):
+        for key, value in source.items():
+            if isinstance(value, dict):
+                merge(target.setdefault(key, {}), value)
+            else:
+                target[key] = value
+
+        return target
+
+    raw_config = merge(
+        {
+            "build-system": {"requires": ["hatchling"], "build-backend": "hatchling.build"},
+            "project": {"name": "my-app", "dynamic": ["version"]},
+            "tool": {"hatch": {"version": {"path": "src/my_app/__about__.py"}}},
+        },
+        raw_config,
+    )
+    metadata = ProjectMetadata(str(temp_dir), None, raw_config)
+
+    assert supports_in_process_version(metadata) is supported
+
+
 def test_plugin_dependencies_unmet(hatch, helpers, temp_dir, mock_plugin_installation):
     project_name = "My.App"
 
@@ -185,10 +274,6 @@ def test_plugin_dependencies_unmet(hatch, helpers, temp_dir, mock_plugin_install
     assert result.output == helpers.dedent(
         """
         Syncing environment plugin requirements
-        Creating environment: hatch-build
-        Checking dependencies
-        Syncing dependencies
-        Inspecting build dependencies
         0.0.1
         """
     )
@@ -239,8 +324,6 @@ def test_no_compatibility_check_if_exists(hatch, helpers, temp_dir, mocker):
     )
 
 
-@pytest.mark.requires_internet
-@pytest.mark.usefixtures("mock_backend_process")
 def test_set_dynamic(hatch, helpers, temp_dir):
     project_name = "My.App"
 
@@ -257,10 +340,6 @@ def test_set_dynamic(hatch, helpers, temp_dir):
     assert result.exit_code == 0, result.output
     assert result.output == helpers.dedent(
         """
-        Creating environment: hatch-build
-        Checking dependencies
-        Syncing dependencies
-        Inspecting build dependencies
         Old: 0.0.1
         New: 0.1.0rc0
         """
@@ -270,16 +349,9 @@ def test_set_dynamic(hatch, helpers, temp_dir):
         result = hatch("version")
 
     assert result.exit_code == 0, result.output
-    assert result.output == helpers.dedent(
-        """
-        Inspecting build dependencies
-        0.1.0rc0
-        """
-    )
+    assert result.output == "0.1.0rc0\n"
 
 
-@pytest.mark.requires_internet
-@pytest.mark.usefixtures("mock_backend_process")
 def test_set_dynamic_downgrade(hatch, helpers, temp_dir):
     project_name = "My.App"
 
@@ -306,7 +378,6 @@ def test_set_dynamic_downgrade(hatch, helpers, temp_dir):
     assert result.exit_code == 0, result.output
     assert result.output == helpers.dedent(
         """
-        Inspecting build dependencies
         Old: 21.1.2
         New: 21.1.0
         """
@@ -316,12 +387,7 @@ def test_set_dynamic_downgrade(hatch, helpers, temp_dir):
         result = hatch("version")
 
     assert result.exit_code == 0, result.output
-    assert result.output == helpers.dedent(
-        """
-        Inspecting build dependencies
-        21.1.0
-        """
-    )
+    assert result.output == "21.1.0\n"
 
 
 def test_show_static(hatch, temp_dir):
@@ -444,6 +510,11 @@ def test_verbose_output_to_stderr(hatch, temp_dir):
     data_path = temp_dir / "data"
     data_path.mkdir()
 
+    project = Project(path)
+    config = dict(project.raw_config)
+    config["build-system"]["requires"].append("binary")
+    project.save_config(config)
+
     # Run with verbose flag (-v) and separate stderr from stdout
     with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
         result = hatch("-v", "version")
@@ -87,6 +87,10 @@ def isolation(uv_on_path) -> Generator[Path, None, None]:
 
         default_env_vars = {
             AppEnvVars.NO_COLOR: "1",
+            # Commands run in environments would otherwise replace the test process
+            AppEnvVars.NO_EXEC: "1",
+            # Removed environments would otherwise be deleted by processes that outlive the tests
+            AppEnvVars.NO_DETACH: "1",
             ConfigEnvVars.DATA: str(data_dir),
             ConfigEnvVars.CACHE: str(cache_dir),
             PublishEnvVars.REPO: "dev",
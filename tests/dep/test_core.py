@@ -1,4 +1,14 @@
-from hatch.dep.core import Dependency
+import pytest
+from packaging.markers import Marker
+
+from hatch.dep.core import (
+    Dependency,
+    InvalidDependencyError,
+    evaluate_marker,
+    freeze_environment,
+    get_dependency,
+    normalize_dependency,
+)
 from hatch.utils.fs import Path
 
 
@@ -41,3 +51,46 @@ class TestSubdirectory:
         dep = Dependency("foo @ git+https://example.com/foo@abc#subdirectory=pkg")
 
         assert dep.subdirectory == "pkg"
+
+
+class TestGetDependency:
+    def test_interned(self):
+        dependency = get_dependency("foo>=1")
+
+        assert isinstance(dependency, Dependency)
+        assert get_dependency("foo>=1") is dependency
+        assert get_dependency("foo>=2") is not dependency
+
+    def test_editable(self):
+        dependency = get_dependency("foo @ file:///foo", editable=True)
+
+        assert dependency.editable
+        assert not get_dependency("foo @ file:///foo").editable
+
+    def test_invalid(self):
+        with pytest.raises(InvalidDependencyError):
+            get_dependency("foo >=")
+
+
+class TestEvaluateMarker:
+    def test_environment(self):
+        marker = Marker("sys_platform == 'linux'")
+
+        assert evaluate_marker(marker, freeze_environment({"sys_platform": "linux"}))
+        assert not evaluate_marker(marker, freeze_environment({"sys_platform": "win32"}))
+
+    def test_memoized(self, mocker):
+        marker = Marker("python_version >= '3'")
+        environment = freeze_environment({"python_version": "3.12"})
+        evaluate_marker(marker, environment)
+
+        spy = mocker.spy(Marker, "evaluate")
+        assert evaluate_marker(Marker("python_version >= '3'"), environment)
+        assert spy.call_count == 0
+
+
+def test_normalize_dependency():
+    dependency = get_dependency("Foo_Bar[Baz]>=1.0RC1")
+
+    assert normalize_dependency(str(dependency)) == "foo-bar[baz]>=1.0rc1"
+    assert dependency.name == "Foo_Bar"
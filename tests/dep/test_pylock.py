@@ -0,0 +1,289 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from packaging.markers import default_environment
+
+from hatch.dep.pylock import LockDelta, LockedPackage, Pylock
+from hatch.dep.sync import InstalledDistributions
+from hatch.env.lock import apply_lock_delta
+
+
+def install(site_packages, name, version, direct_url=None):
+    dist_info = site_packages / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+    if direct_url is not None:
+        (dist_info / "direct_url.json").write_text(json.dumps(direct_url))
+
+
+def get_lock(temp_dir, packages, **data):
+    return Pylock({"lock-version": "1.0", "packages": packages, **data}, temp_dir)
+
+
+@pytest.fixture
+def site_packages(temp_dir):
+    path = temp_dir / "site-packages"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def distributions(site_packages):
+    return lambda: InstalledDistributions(sys_path=[str(site_packages)], environment=default_environment())
+
+
+class TestRead:
+    def test_from_path(self, temp_dir):
+        lock_path = temp_dir / "pylock.toml"
+        lock_path.write_text(
+            """\
+lock-version = "1.0"
+created-by = "uv"
+
+[[packages]]
+name = "Foo_Bar"
+version = "1.0"
+wheels = [
+  { url = "https://example.com/foo_bar-1.0-py3-none-any.whl", hashes = { sha256 = "abc" } },
+]
+sdist = { url = "https://example.com/foo_bar-1.0.tar.gz", hashes = { sha256 = "def" } }
+"""
+        )
+
+        lock = Pylock.from_path(lock_path)
+
+        assert lock.packages == [
+            LockedPackage(
+                name="foo-bar",
+                version="1.0",
+                wheels=({"url": "https://example.com/foo_bar-1.0-py3-none-any.whl", "hashes": {"sha256": "abc"}},),
+                sdist={"url": "https://example.com/foo_bar-1.0.tar.gz", "hashes": {"sha256": "def"}},
+                hashes=("sha256:abc", "sha256:def"),
+                root=temp_dir,
+            )
+        ]
+
+    def test_unsupported_lock_version(self, temp_dir):
+        with pytest.raises(ValueError, match="Unsupported lock version: 2.0"):
+            Pylock({"lock-version": "2.0"}, temp_dir)
+
+    def test_missing_lock_version(self, temp_dir):
+        with pytest.raises(ValueError, match="Field `lock-version` must be a version string"):
+            Pylock({}, temp_dir)
+
+    def test_package_without_name(self, temp_dir):
+        with pytest.raises(ValueError, match="Every entry in `packages` must have a `name`"):
+            get_lock(temp_dir, [{"version": "1.0"}])
+
+    def test_incomplete_vcs(self, temp_dir):
+        with pytest.raises(ValueError, match="Field `vcs` of package `foo` must define: commit-id"):
+            get_lock(temp_dir, [{"name": "foo", "vcs": {"type": "git", "url": "https://example.com/foo"}}])
+
+
+class TestSelect:
+    def test_markers(self, temp_dir):
+        lock = get_lock(
+            temp_dir,
+            [
+                {"name": "always", "version": "1"},
+                {"name": "never", "version": "1", "marker": "python_version < '3'"},
+                {"name": "extra", "version": "1", "marker": "'cli' in extras"},
+                {"name": "group", "version": "1", "marker": "'dev' in dependency_groups"},
+            ],
+        )
+        environment = default_environment()
+
+        assert [package.name for package in lock.select(environment)] == ["always"]
+        assert [package.name for package in lock.select(environment, extras=["cli"], dependency_groups=["dev"])] == [
+            "always",
+            "extra",
+            "group",
+        ]
+
+    def test_default_groups(self, temp_dir):
+        lock = get_lock(
+            temp_dir,
+            [{"name": "group", "version": "1", "marker": "'dev' in dependency_groups"}],
+            **{"default-groups": ["dev"]},
+        )
+
+        assert [package.name for package in lock.select(default_environment())] == ["group"]
+
+    def test_unsupported_environment(self, temp_dir):
+        lock = get_lock(temp_dir, [], environments=["python_version < '3'"])
+
+        with pytest.raises(ValueError, match="The lockfile does not support the environment"):
+            lock.select(default_environment())
+
+    def test_unsupported_python(self, temp_dir):
+        lock = get_lock(temp_dir, [], **{"requires-python": "<3"})
+
+        with pytest.raises(ValueError, match="The lockfile requires Python <3"):
+            lock.select(default_environment())
+
+    def test_ambiguous(self, temp_dir):
+        lock = get_lock(temp_dir, [{"name": "foo", "version": "1"}, {"name": "foo", "version": "2"}])
+
+        with pytest.raises(ValueError, match="The lockfile selects more than one entry for package: foo"):
+            lock.select(default_environment())
+
+
+class TestDelta:
+    def test_in_sync(self, temp_dir, site_packages, distributions):
+        install(site_packages, "foo", "1.0")
+        install(site_packages, "Bar_Baz", "2.0")
+        install(site_packages, "pip", "24.0")
+        lock = get_lock(temp_dir, [{"name": "foo", "version": "1.0.0"}, {"name": "bar-baz", "version": "2.0"}])
+
+        assert lock.compute_delta(distributions()) == LockDelta()
+
+    def test_changes(self, temp_dir, site_packages, distributions):
+        install(site_packages, "foo", "1.0")
+        install(site_packages, "extraneous", "1.0")
+        install(site_packages, "my-app", "0.1", {"url": temp_dir.as_uri(), "dir_info": {"editable": True}})
+        lock = get_lock(temp_dir, [{"name": "foo", "version": "1.1"}, {"name": "bar", "version": "2.0"}])
+
+        delta = lock.compute_delta(distributions(), preserve=["My_App"])
+
+        assert [package.name for package in delta.add] == ["bar"]
+        assert [package.name for package in delta.upgrade] == ["foo"]
+        assert delta.remove == ["extraneous"]
+        assert not delta.in_sync
+
+    def test_keep_extraneous(self, temp_dir, site_packages, distributions):
+        install(site_packages, "extraneous", "1.0")
+        lock = get_lock(temp_dir, [])
+
+        assert lock.compute_delta(distributions(), remove_extraneous=False).in_sync
+
+    def test_index_package_installed_from_directory(self, temp_dir, site_packages, distributions):
+        install(site_packages, "foo", "1.0", {"url": temp_dir.as_uri(), "dir_info": {}})
+        lock = get_lock(temp_dir, [{"name": "foo", "version": "1.0"}])
+
+        assert [package.name for package in lock.compute_delta(distributions()).upgrade] == ["foo"]
+
+    def test_directory(self, temp_dir, site_packages, distributions):
+        (temp_dir / "foo").mkdir()
+        install(site_packages, "foo", "1.0", {"url": (temp_dir / "foo").as_uri(), "dir_info": {"editable": True}})
+        editable = get_lock(temp_dir, [{"name": "foo", "directory": {"path": "foo", "editable": True}}])
+        non_editable = get_lock(temp_dir, [{"name": "foo", "directory": {"path": "foo"}}])
+
+        assert editable.compute_delta(distributions()).in_sync
+        assert not non_editable.compute_delta(distributions()).in_sync
+
+    def test_vcs(self, temp_dir, site_packages, distributions):
+        url = "https://github.com/org/foo"
+        install(site_packages, "foo", "1.0", {"url": url, "vcs_info": {"vcs": "git", "commit_id": "abc"}})
+        same = get_lock(temp_dir, [{"name": "foo", "vcs": {"type": "git", "url": url, "commit-id": "abc"}}])
+        other = get_lock(temp_dir, [{"name": "foo", "vcs": {"type": "git", "url": url, "commit-id": "def"}}])
+
+        assert same.compute_delta(distributions()).in_sync
+        assert not other.compute_delta(distributions()).in_sync
+
+    def test_archive(self, temp_dir, site_packages, distributions):
+        url = "https://example.com/foo-1.0.tar.gz"
+        install(site_packages, "foo", "1.0", {"url": url, "archive_info": {"hashes": {"sha256": "abc"}}})
+        same = get_lock(temp_dir, [{"name": "foo", "archive": {"url": url, "hashes": {"sha256": "abc"}}}])
+        other = get_lock(temp_dir, [{"name": "foo", "archive": {"url": url, "hashes": {"sha256": "def"}}}])
+
+        assert same.compute_delta(distributions()).in_sync
+        assert not other.compute_delta(distributions()).in_sync
+
+
+class TestInstallArgs:
+    def test_index(self, temp_dir):
+        package = LockedPackage(name="foo", version="1.0", hashes=("sha256:abc",), root=temp_dir)
+
+        assert package.install_args == ["foo==1.0"]
+        assert package.hashable
+
+    def test_vcs(self, temp_dir):
+        package = LockedPackage(
+            name="foo",
+            vcs={"type": "git", "url": "https://github.com/org/foo", "commit-id": "abc", "subdirectory": "lib"},
+            root=temp_dir,
+        )
+
+        assert package.install_args == ["foo @ git+https://github.com/org/foo@abc#subdirectory=lib"]
+        assert not package.hashable
+
+    def test_editable_directory(self, temp_dir):
+        package = LockedPackage(name="foo", directory={"path": "foo", "editable": True}, root=temp_dir)
+
+        assert package.install_args == ["--editable", (temp_dir / "foo").as_uri()]
+
+
+class TestDistributionFiles:
+    def test_urls(self, temp_dir):
+        package = LockedPackage(
+            name="foo",
+            wheels=(
+                {"url": "https://example.com/foo%2Bbar-1.0-py3-none-any.whl", "hashes": {"sha256": "abc"}},
+                {"name": "foo-1.0-cp313-none-any.whl", "url": "https://example.com/download?id=1"},
+            ),
+            sdist={"url": "https://example.com/foo-1.0.tar.gz"},
+            root=temp_dir,
+        )
+
+        assert package.distribution_files == [
+            ("foo+bar-1.0-py3-none-any.whl", "https://example.com/foo%2Bbar-1.0-py3-none-any.whl", {"sha256": "abc"}),
+            ("foo-1.0-cp313-none-any.whl", "https://example.com/download?id=1", {}),
+            ("foo-1.0.tar.gz", "https://example.com/foo-1.0.tar.gz", {}),
+        ]
+
+    def test_local_path(self, temp_dir):
+        (temp_dir / "dist").mkdir()
+        (temp_dir / "dist" / "foo-1.0-py3-none-any.whl").touch()
+        package = LockedPackage(
+            name="foo",
+            wheels=({"path": "dist/foo-1.0-py3-none-any.whl", "url": "https://example.com/foo-1.0-py3-none-any.whl"},),
+            sdist={"path": "dist/foo-1.0.tar.gz", "url": "https://example.com/foo-1.0.tar.gz"},
+            root=temp_dir,
+        )
+
+        assert package.distribution_files == [
+            ("foo-1.0-py3-none-any.whl", str(temp_dir / "dist" / "foo-1.0-py3-none-any.whl"), {}),
+            ("foo-1.0.tar.gz", "https://example.com/foo-1.0.tar.gz", {}),
+        ]
+
+    def test_none(self, temp_dir):
+        package = LockedPackage(name="foo", directory={"path": "foo"}, root=temp_dir)
+
+        assert package.distribution_files == []
+
+
+def test_apply_delta(temp_dir):
+    environment = MagicMock()
+    environment.get_source_install_args.return_value = []
+    environment.construct_pip_uninstall_command.side_effect = lambda names: ["uninstall", *names]
+
+    requirements = []
+
+    def construct_pip_install_command(args):
+        if "-r" in args:
+            requirements.append((temp_dir / args[args.index("-r") + 1]).read_text())
+        return ["install", *args]
+
+    environment.construct_pip_install_command.side_effect = construct_pip_install_command
+
+    delta = LockDelta(
+        add=[LockedPackage(name="foo", version="1.0", hashes=("sha256:abc",), root=temp_dir)],
+        upgrade=[LockedPackage(name="bar", directory={"path": "bar", "editable": True}, root=temp_dir)],
+        remove=["baz"],
+    )
+    apply_lock_delta(environment, delta)
+
+    commands = [call.args[0] for call in environment.platform.check_command.call_args_list]
+    assert commands[0] == ["uninstall", "baz", "bar"]
+    assert commands[1][:3] == ["install", "--no-deps", "-r"]
+    assert commands[2] == ["install", "--no-deps", "--editable", (temp_dir / "bar").as_uri()]
+    assert requirements == ["foo==1.0 --hash=sha256:abc\n"]
+
+
+def test_apply_delta_in_sync():
+    environment = MagicMock()
+
+    apply_lock_delta(environment, LockDelta())
+
+    environment.platform.check_command.assert_not_called()
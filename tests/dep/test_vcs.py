@@ -0,0 +1,201 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+from packaging.markers import default_environment
+
+from hatch.config.constants import AppEnvVars
+from hatch.dep.core import Dependency
+from hatch.dep.sync import InstalledDistributions
+from hatch.dep.vcs import RevisionResolver, get_remote_command, get_revision_resolver, parse_remote_output
+
+pytestmark = pytest.mark.skipif(not shutil.which("git"), reason="Git is not available")
+
+
+def git(*args, cwd):
+    return subprocess.run(
+        ["git", "-c", "user.name=foo", "-c", "user.email=foo@bar.baz", *args],
+        cwd=str(cwd),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(temp_dir):
+    path = temp_dir / "repo"
+    path.mkdir()
+    git("init", "--initial-branch", "main", cwd=path)
+    git("commit", "--allow-empty", "-m", "initial", cwd=path)
+    return path
+
+
+def commit(repo):
+    git("commit", "--allow-empty", "-m", "update", cwd=repo)
+    return git("rev-parse", "HEAD", cwd=repo)
+
+
+class TestCommands:
+    @pytest.mark.parametrize(
+        ("vcs", "revision", "expected"),
+        [
+            ("git", "", ["git", "ls-remote", "url"]),
+            ("git", "v1", ["git", "ls-remote", "url", "v1"]),
+            ("hg", "v1", ["hg", "--noninteractive", "identify", "--debug", "--id", "url", "--rev", "v1"]),
+            ("svn", "5", ["svn", "info", "--non-interactive", "--show-item", "revision", "url@5"]),
+            ("bzr", "", ["bzr", "revision-info", "--directory", "url"]),
+            ("foo", "", None),
+        ],
+    )
+    def test_command(self, vcs, revision, expected):
+        assert get_remote_command(vcs, "url", revision) == expected
+
+    def test_parse(self):
+        assert parse_remote_output("git", "abc\tHEAD\nabc\trefs/heads/main\n") == "abc"
+        assert parse_remote_output("hg", "abc+\n") == "abc"
+        assert parse_remote_output("git", "") is None
+
+
+class TestResolver:
+    def test_resolve(self, repo):
+        head = git("rev-parse", "HEAD", cwd=repo)
+        git("tag", "v1", cwd=repo)
+        resolver = RevisionResolver()
+
+        resolved = resolver.resolve([
+            ("git", repo.as_uri(), ""),
+            ("git", repo.as_uri(), "v1"),
+            ("git", repo.as_uri(), "missing"),
+        ])
+
+        assert resolved == {
+            ("git", repo.as_uri(), ""): head,
+            ("git", repo.as_uri(), "v1"): head,
+            ("git", repo.as_uri(), "missing"): None,
+        }
+
+    def test_memory_cache(self, repo):
+        head = git("rev-parse", "HEAD", cwd=repo)
+        resolver = RevisionResolver()
+
+        assert resolver.get("git", repo.as_uri()) == head
+        commit(repo)
+        assert resolver.get("git", repo.as_uri()) == head
+
+    def test_disk_cache(self, repo, temp_dir):
+        head = git("rev-parse", "HEAD", cwd=repo)
+        cache_dir = temp_dir / "cache"
+
+        assert RevisionResolver(cache_dir=cache_dir).get("git", repo.as_uri()) == head
+        new_head = commit(repo)
+        assert RevisionResolver(cache_dir=cache_dir).get("git", repo.as_uri()) == head
+        assert RevisionResolver(cache_dir=cache_dir, ttl=0).get("git", repo.as_uri()) == new_head
+
+    def test_disk_cache_expired(self, repo, temp_dir):
+        cache_dir = temp_dir / "cache"
+        RevisionResolver(cache_dir=cache_dir).get("git", repo.as_uri())
+        new_head = commit(repo)
+
+        for cache_file in cache_dir.iterdir():
+            data = json.loads(cache_file.read_text())
+            data["time"] -= 3600
+            cache_file.write_text(json.dumps(data))
+
+        assert RevisionResolver(cache_dir=cache_dir).get("git", repo.as_uri()) == new_head
+
+    def test_failures_not_persisted(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+
+        assert RevisionResolver(cache_dir=cache_dir).get("git", (temp_dir / "missing").as_uri()) is None
+        assert not cache_dir.exists()
+
+    def test_timeout(self, mocker):
+        run = mocker.patch("subprocess.run", side_effect=subprocess.TimeoutExpired(["git"], 5))
+
+        assert RevisionResolver(timeout=5).get("git", "https://example.com/foo") is None
+        assert run.call_args.kwargs["timeout"] == 5
+        assert run.call_args.kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+
+    def test_unsupported_vcs(self):
+        assert RevisionResolver().get("foo", "https://example.com") is None
+
+
+class TestRevisionResolverConfig:
+    def test_default(self, temp_dir, mocker):
+        app = mocker.MagicMock(cache_dir=temp_dir)
+
+        resolver = get_revision_resolver(app)
+
+        assert resolver.cache_dir == temp_dir / "vcs"
+        assert resolver.ttl == 300
+        assert resolver.timeout == 30
+
+    def test_ttl(self, temp_dir, mocker):
+        app = mocker.MagicMock(cache_dir=temp_dir)
+
+        with temp_dir.as_cwd(env_vars={AppEnvVars.VCS_REVISION_TTL: "0"}):
+            assert get_revision_resolver(app).ttl == 0
+
+    def test_timeout(self, temp_dir, mocker):
+        app = mocker.MagicMock(cache_dir=temp_dir)
+
+        with temp_dir.as_cwd(env_vars={AppEnvVars.VCS_REVISION_TIMEOUT: "2.5"}):
+            assert get_revision_resolver(app).timeout == 2.5
+
+    def test_ttl_invalid(self, temp_dir, mocker):
+        app = mocker.MagicMock(cache_dir=temp_dir)
+
+        with (
+            temp_dir.as_cwd(env_vars={AppEnvVars.VCS_REVISION_TTL: "foo"}),
+            pytest.raises(ValueError, match="Environment variable `HATCH_VCS_REVISION_TTL` must be a number"),
+        ):
+            get_revision_resolver(app)
+
+
+class TestDependencySync:
+    def install(self, site_packages, repo, commit_id, requested_revision=None):
+        dist_info = site_packages / "foo-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: foo\nVersion: 1.0\n")
+        vcs_info = {"vcs": "git", "commit_id": commit_id}
+        if requested_revision:
+            vcs_info["requested_revision"] = requested_revision
+        (dist_info / "direct_url.json").write_text(json.dumps({"url": repo.as_uri(), "vcs_info": vcs_info}))
+
+    def test_branch(self, repo, temp_dir, mocker):
+        site_packages = temp_dir / "site-packages"
+        self.install(site_packages, repo, git("rev-parse", "HEAD", cwd=repo), "main")
+        dependency = Dependency(f"foo @ git+{repo.as_uri()}@main")
+        resolve = mocker.spy(RevisionResolver, "_query")
+
+        distributions = InstalledDistributions(sys_path=[str(site_packages)], environment=default_environment())
+        assert distributions.dependencies_in_sync([dependency])
+        assert resolve.call_count == 1
+
+        commit(repo)
+        distributions = InstalledDistributions(sys_path=[str(site_packages)], environment=default_environment())
+        assert distributions.missing_dependencies([dependency]) == [dependency]
+
+    def test_shared_cache(self, repo, temp_dir):
+        site_packages = temp_dir / "site-packages"
+        self.install(site_packages, repo, git("rev-parse", "HEAD", cwd=repo))
+        dependency = Dependency(f"foo @ git+{repo.as_uri()}")
+        cache_dir = temp_dir / "cache"
+
+        distributions = InstalledDistributions(
+            sys_path=[str(site_packages)],
+            environment=default_environment(),
+            revision_resolver=RevisionResolver(cache_dir=cache_dir),
+        )
+        assert distributions.dependencies_in_sync([dependency])
+
+        # The remote is not queried again until the cached result expires
+        commit(repo)
+        distributions = InstalledDistributions(
+            sys_path=[str(site_packages)],
+            environment=default_environment(),
+            revision_resolver=RevisionResolver(cache_dir=cache_dir),
+        )
+        assert distributions.dependencies_in_sync([dependency])
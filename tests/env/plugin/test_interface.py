@@ -4156,6 +4156,46 @@ version = "0.0.1"
             pass
 
 
+class TestInstallProjectWithDependencies:
+    def test_default(self, isolation, isolated_data_dir, platform, global_application):
+        config = {"project": {"name": "my_app", "version": "0.0.1"}}
+        project = Project(isolation, config=config)
+        environment = MockEnvironment(
+            isolation,
+            project.metadata,
+            "default",
+            project.config.envs["default"],
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            global_application,
+        )
+
+        assert environment.install_project_with_dependencies() is False
+
+
+class TestOffline:
+    def test_default(self, isolation, isolated_data_dir, platform, global_application):
+        config = {"project": {"name": "my_app", "version": "0.0.1"}}
+        project = Project(isolation, config=config)
+        environment = MockEnvironment(
+            isolation,
+            project.metadata,
+            "default",
+            project.config.envs["default"],
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            global_application,
+        )
+
+        assert environment.offline is False
+
+
 class TestFileSystemContext:
     def test_join_creates_new_context(self, temp_dir, isolated_data_dir, platform, temp_application):
         """Test FileSystemContext.join creates proper paths."""
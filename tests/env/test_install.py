@@ -0,0 +1,107 @@
+from contextlib import nullcontext
+
+import pytest
+
+from hatch.dep.core import Dependency
+from hatch.env.install import InstallationPlan
+from hatch.env.virtual import VirtualEnvironment
+from hatch.project.core import Project
+
+
+class TestInstallationPlan:
+    def test_empty(self):
+        plan = InstallationPlan()
+        plan.add_options(["--extra-index-url", "https://example.com/simple"])
+
+        assert not plan
+
+    def test_order(self):
+        plan = InstallationPlan()
+        plan.add_dependency(Dependency("foo @ file:///foo", editable=True))
+        plan.add_dependency(Dependency("bar>=1"))
+        plan.add_local("my-app", "/my-app[dev]", editable=True)
+        plan.add_local("member", "/member", editable=False)
+        plan.add_options(["--extra-index-url", "https://example.com/simple"])
+
+        assert plan
+        assert plan.get_install_args() == [
+            "--extra-index-url",
+            "https://example.com/simple",
+            "--editable",
+            "/my-app[dev]",
+            "/member",
+            "bar>=1",
+            "--editable",
+            str(Dependency("foo @ file:///foo").path),
+        ]
+
+    def test_planned_once(self):
+        plan = InstallationPlan()
+        plan.add_local("My.App", "/my-app", editable=True)
+        plan.add_local("my-app", "/other", editable=False)
+        plan.add_dependency(Dependency("my_app @ file:///my-app"))
+
+        assert plan.get_install_args() == ["--editable", "/my-app"]
+
+
+class TestVirtualEnvironment:
+    @pytest.fixture
+    def environment(self, temp_dir, isolated_data_dir, platform, temp_application, mocker):
+        (temp_dir / "pyproject.toml").write_text(
+            """\
+[project]
+name = "my-app"
+version = "0.0.1"
+dependencies = ["foo", "bar>=1"]
+optional-dependencies = {dev = ["baz"]}
+"""
+        )
+
+        project = Project(temp_dir)
+        project.set_app(temp_application)
+        temp_application.project = project
+        environment = VirtualEnvironment(
+            temp_dir,
+            project.metadata,
+            "default",
+            {"features": ["dev"]},
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            temp_application,
+        )
+        mocker.patch.object(VirtualEnvironment, "safe_activation", return_value=nullcontext())
+        mocker.patch.object(VirtualEnvironment, "construct_pip_install_command", side_effect=lambda args: args)
+
+        return environment
+
+    def test_single_transaction(self, environment, temp_dir, platform, mocker):
+        check_command = mocker.patch.object(platform, "check_command")
+        environment.__dict__["missing_dependencies"] = list(environment.all_dependencies_complex)
+
+        assert environment.install_project_with_dependencies()
+
+        check_command.assert_called_once_with([
+            "--editable",
+            f"{temp_dir}[dev]",
+            "foo",
+            "bar>=1",
+            "baz",
+        ])
+        assert "missing_dependencies" not in environment.__dict__
+
+    def test_locked(self, environment, platform, mocker):
+        check_command = mocker.patch.object(platform, "check_command")
+        environment.config["locked"] = True
+
+        assert not environment.install_project_with_dependencies()
+        check_command.assert_not_called()
+
+    def test_dynamic_dependencies(self, environment, platform, mocker):
+        check_command = mocker.patch.object(platform, "check_command")
+        environment.metadata.core_raw_metadata["dynamic"] = ["dependencies"]
+
+        assert not environment.install_project_with_dependencies()
+        check_command.assert_not_called()
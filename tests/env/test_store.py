@@ -0,0 +1,140 @@
+import json
+import os
+
+import pytest
+
+from hatch.config.constants import AppEnvVars
+from hatch.env.store import EnvironmentStore, ScriptCache, get_script_cache_size
+
+
+def create_entry(cache, key, size, last_used):
+    path = cache.directory / key
+    path.ensure_dir_exists()
+    (path / "data").write_bytes(b"0" * size)
+    cache.add(key, {"script": key})
+    os.utime(cache.directory / f".{key}.json", (last_used, last_used))
+
+
+class TestEnvironmentStore:
+    @pytest.fixture
+    def store(self, temp_dir):
+        store = EnvironmentStore(temp_dir / "env")
+        project_path = temp_dir / "my-app"
+        project_path.mkdir()
+        for name, project in (("live", project_path), ("dead", temp_dir / "unmounted" / "other-app")):
+            metadata_file = store.metadata_dir / name / "lint.json"
+            metadata_file.parent.mkdir(parents=True)
+            metadata_file.write_text(json.dumps({"store_key": "abc", "project": str(project)}))
+
+        return store
+
+    def test_references(self, store):
+        assert store.references() == {"abc": [store.metadata_dir / "live" / "lint.json"]}
+        assert store.dead_references() == [store.metadata_dir / "dead" / "lint.json"]
+
+    def test_queries_keep_dead_references(self, store):
+        store.references()
+        store.unreferenced_entries()
+
+        # Projects may only be unavailable for now, so only pruning removes their references
+        assert (store.metadata_dir / "dead" / "lint.json").is_file()
+
+
+class TestScriptCache:
+    def test_entries(self, temp_dir):
+        cache = ScriptCache(temp_dir)
+        create_entry(cache, "foo", 1, 100)
+        create_entry(cache, "bar", 1, 200)
+
+        entries = cache.entries()
+
+        assert [entry.key for entry in entries] == ["bar", "foo"]
+        assert entries[0].data == {"script": "bar"}
+        assert entries[0].last_used == 200
+        assert entries[0].size is None
+
+    def test_entries_missing(self, temp_dir):
+        assert ScriptCache(temp_dir / "missing").entries() == []
+
+    def test_entry_without_record(self, temp_dir):
+        cache = ScriptCache(temp_dir)
+        (temp_dir / "foo").mkdir()
+
+        (entry,) = cache.entries()
+
+        assert entry.key == "foo"
+        assert entry.data == {}
+
+    def test_touch(self, temp_dir):
+        cache = ScriptCache(temp_dir)
+        create_entry(cache, "foo", 1, 100)
+        create_entry(cache, "bar", 1, 200)
+
+        cache.touch("foo")
+
+        assert [entry.key for entry in cache.entries()] == ["foo", "bar"]
+
+    def test_measure_retains_last_use(self, temp_dir):
+        cache = ScriptCache(temp_dir)
+        create_entry(cache, "foo", 10, 100)
+
+        (entry,) = cache.entries()
+
+        assert cache.measure(entry) == 10
+        assert json.loads((temp_dir / ".foo.json").read_text())["size"] == 10
+        assert cache.entries()[0].last_used == 100
+
+    def test_prune(self, temp_dir):
+        cache = ScriptCache(temp_dir, max_size=25)
+        create_entry(cache, "foo", 10, 100)
+        create_entry(cache, "bar", 10, 200)
+        create_entry(cache, "baz", 10, 300)
+
+        assert [entry.key for entry in cache.prune()] == ["foo"]
+        assert [entry.key for entry in cache.entries()] == ["baz", "bar"]
+        assert not (temp_dir / "foo").exists()
+        assert not (temp_dir / ".foo.json").exists()
+
+    def test_prune_keep(self, temp_dir):
+        cache = ScriptCache(temp_dir, max_size=15)
+        create_entry(cache, "foo", 10, 100)
+        create_entry(cache, "bar", 10, 200)
+
+        assert [entry.key for entry in cache.prune(keep="foo")] == ["bar"]
+        assert [entry.key for entry in cache.entries()] == ["foo"]
+
+    def test_prune_keep_not_recorded(self, temp_dir):
+        cache = ScriptCache(temp_dir, max_size=100)
+        create_entry(cache, "foo", 10, 100)
+        create_entry(cache, "bar", 10, 200)
+
+        cache.prune(keep="foo")
+
+        assert "size" not in json.loads((temp_dir / ".foo.json").read_text())
+        assert json.loads((temp_dir / ".bar.json").read_text())["size"] == 10
+
+    def test_prune_no_limit(self, temp_dir):
+        cache = ScriptCache(temp_dir, max_size=0)
+        create_entry(cache, "foo", 10, 100)
+
+        assert cache.prune() == []
+        assert len(cache.entries()) == 1
+
+
+class TestScriptCacheSize:
+    def test_default(self, temp_dir):
+        with temp_dir.as_cwd(exclude=[AppEnvVars.SCRIPT_CACHE_SIZE]):
+            assert get_script_cache_size() == 5120 * 1024 * 1024
+
+    def test_set(self, temp_dir):
+        with temp_dir.as_cwd(env_vars={AppEnvVars.SCRIPT_CACHE_SIZE: "0.5"}):
+            assert get_script_cache_size() == 512 * 1024
+
+    def test_invalid(self, temp_dir):
+        with (
+            temp_dir.as_cwd(env_vars={AppEnvVars.SCRIPT_CACHE_SIZE: "foo"}),
+            pytest.raises(
+                ValueError, match="Environment variable `HATCH_SCRIPT_CACHE_SIZE` must be a number of megabytes: foo"
+            ),
+        ):
+            get_script_cache_size()
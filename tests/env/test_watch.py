@@ -0,0 +1,231 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from hatch.env.virtual import VirtualEnvironment
+from hatch.env.watch import (
+    ERROR,
+    READY,
+    SYNCING,
+    PollingWatcher,
+    WatchStatus,
+    get_config_hash,
+    get_environment_fingerprint,
+    get_file_digests,
+    get_file_watcher,
+    get_watched_files,
+    sync_lock,
+)
+from hatch.project.core import Project
+from hatch.utils.structures import EnvVars
+
+
+@pytest.fixture
+def project(temp_dir, temp_application):
+    (temp_dir / "pyproject.toml").write_text(
+        """\
+[project]
+name = "my-app"
+version = "0.0.1"
+"""
+    )
+
+    project = Project(temp_dir)
+    project.set_app(temp_application)
+    temp_application.project = project
+    return project
+
+
+@pytest.fixture
+def environment(project, temp_dir, isolated_data_dir, platform, temp_application):
+    def get_environment(name, config=None):
+        return VirtualEnvironment(
+            temp_dir,
+            project.metadata,
+            name,
+            config or {},
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            temp_application,
+        )
+
+    return get_environment
+
+
+def modify_later(path, delay=0.2):
+    def modify():
+        time.sleep(delay)
+        path.write_text("changed")
+
+    thread = threading.Thread(target=modify)
+    thread.start()
+    return thread
+
+
+def test_watched_files(project, environment, temp_dir):
+    environments = [environment("default"), environment("test", {"lock-filename": "locks/test.toml"})]
+
+    assert get_watched_files(project, environments) == {
+        str(temp_dir / "pyproject.toml"): None,
+        str(temp_dir / "hatch.toml"): None,
+        str(temp_dir / "pylock.toml"): {"default"},
+        str(temp_dir / "locks" / "test.toml"): {"test"},
+    }
+
+
+def test_file_digests(temp_dir):
+    path = temp_dir / "foo.txt"
+    path.write_text("foo")
+    missing = temp_dir / "bar.txt"
+
+    digests = get_file_digests([str(path), str(missing)])
+
+    assert digests == {
+        str(path): "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae",
+        str(missing): "",
+    }
+    assert get_config_hash(digests) == get_config_hash(dict(reversed(digests.items())))
+
+
+class TestWatchStatus:
+    @pytest.fixture
+    def watched(self, project, environment):
+        return get_watched_files(project, [environment("default")])
+
+    def test_ready(self, environment, temp_dir, watched, mocker):
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.exists", return_value=True)
+        env = environment("default")
+        status = WatchStatus(temp_dir / "status" / "watch.json")
+
+        assert not status.is_ready(env)
+
+        status.publish(get_file_digests(watched), {"default": SYNCING}, {})
+        assert not status.is_ready(env)
+
+        status.publish(get_file_digests(watched), {"default": READY}, {"default": get_environment_fingerprint(env)})
+        assert status.is_ready(env)
+        assert status.read()["states"] == {"default": READY}
+
+        status.publish(get_file_digests(watched), {"default": ERROR}, {})
+        assert not status.is_ready(env)
+
+    def test_configuration_changed(self, environment, temp_dir, watched, mocker):
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.exists", return_value=True)
+        env = environment("default")
+        status = WatchStatus(temp_dir / "watch.json")
+        status.publish(get_file_digests(watched), {"default": READY}, {"default": get_environment_fingerprint(env)})
+
+        (temp_dir / "pylock.toml").write_text('lock-version = "1.0"\n')
+
+        assert not status.is_ready(env)
+
+    def test_environment_missing(self, environment, temp_dir, watched, mocker):
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.exists", return_value=False)
+        env = environment("default")
+        status = WatchStatus(temp_dir / "watch.json")
+        status.publish(get_file_digests(watched), {"default": READY}, {"default": get_environment_fingerprint(env)})
+
+        assert not status.is_ready(env)
+
+    def test_watcher_stopped(self, environment, temp_dir, watched, mocker):
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.exists", return_value=True)
+        env = environment("default")
+        status = WatchStatus(temp_dir / "watch.json")
+        status.publish(get_file_digests(watched), {"default": READY}, {"default": get_environment_fingerprint(env)})
+
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        data = status.read()
+        data["pid"] = process.pid
+        status.path.write_text(json.dumps(data))
+
+        assert not status.is_ready(env)
+
+    def test_effective_configuration_changed(self, environment, temp_dir, watched, mocker):
+        mocker.patch("hatch.env.virtual.VirtualEnvironment.exists", return_value=True)
+        env = environment("default")
+        status = WatchStatus(temp_dir / "watch.json")
+        status.publish(get_file_digests(watched), {"default": READY}, {"default": get_environment_fingerprint(env)})
+
+        with EnvVars({"HATCH_ENV_TYPE_VIRTUAL_OFFLINE": "1"}):
+            assert not status.is_ready(env)
+
+        assert not status.is_ready(environment("default", {"dependencies": ["foo"]}))
+        assert status.is_ready(env)
+
+    def test_corrupt(self, environment, temp_dir):
+        status = WatchStatus(temp_dir / "watch.json")
+        status.path.write_text("{")
+
+        assert status.read() == {}
+        assert not status.is_ready(environment("default"))
+
+
+def test_sync_lock(temp_dir):
+    path = temp_dir / "locks" / "default.lock"
+    acquired = threading.Event()
+
+    def acquire():
+        with sync_lock(path):
+            acquired.set()
+
+    with sync_lock(path):
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.2)
+
+    thread.join()
+    assert acquired.is_set()
+
+
+class TestWatcher:
+    def test_polling(self, temp_dir):
+        path = temp_dir / "pyproject.toml"
+        path.write_text("foo")
+        watcher = get_file_watcher([str(path)], interval=0.05, poll=True)
+        assert isinstance(watcher, PollingWatcher)
+
+        thread = modify_later(path)
+        watcher.wait()
+        thread.join()
+
+        watcher.close()
+
+    def test_polling_file_created(self, temp_dir):
+        path = temp_dir / "pylock.toml"
+        watcher = PollingWatcher([str(path)], interval=0.05)
+
+        thread = modify_later(path)
+        watcher.wait()
+        thread.join()
+
+        assert path.is_file()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Filesystem events are only used on Linux")
+    def test_inotify(self, temp_dir):
+        from hatch.env.watch import InotifyWatcher
+
+        path = temp_dir / "pyproject.toml"
+        path.write_text("foo")
+        watcher = get_file_watcher([str(path)], interval=60)
+        assert isinstance(watcher, InotifyWatcher)
+
+        try:
+            thread = modify_later(path)
+            watcher.wait()
+            thread.join()
+        finally:
+            watcher.close()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Filesystem events are only used on Linux")
+    def test_inotify_unavailable(self, temp_dir, mocker):
+        mocker.patch("hatch.env.watch.InotifyWatcher.__init__", side_effect=OSError)
+
+        assert isinstance(get_file_watcher([str(temp_dir / "pyproject.toml")], interval=1), PollingWatcher)
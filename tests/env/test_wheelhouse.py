@@ -0,0 +1,203 @@
+import hashlib
+
+import pytest
+
+from hatch.dep.pylock import Pylock
+from hatch.env.virtual import VirtualEnvironment
+from hatch.env.wheelhouse import Wheelhouse, WheelhouseError, get_wheelhouse_path, lock_environment_distributions
+from hatch.project.core import Project
+from hatch.utils.structures import EnvVars
+
+
+def get_digest(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.fixture
+def index(temp_dir):
+    path = temp_dir / "index"
+    path.mkdir()
+    (path / "foo-1.0-py3-none-any.whl").write_bytes(b"foo")
+    (path / "bar-1.0.tar.gz").write_bytes(b"bar")
+    return path
+
+
+@pytest.fixture
+def wheelhouse(temp_dir):
+    return Wheelhouse(temp_dir / "wheelhouse")
+
+
+def test_path(temp_dir):
+    assert get_wheelhouse_path(temp_dir) == temp_dir / ".hatch" / "wheelhouse"
+
+    script = temp_dir / "script.py"
+    script.touch()
+    assert get_wheelhouse_path(script) == temp_dir / ".hatch" / "wheelhouse"
+
+
+class TestWheelhouse:
+    def test_add(self, index, wheelhouse):
+        source = index / "foo-1.0-py3-none-any.whl"
+        digest = get_digest(source)
+
+        assert wheelhouse.add(source.name, str(source), {"sha256": digest})
+        assert (wheelhouse.path / source.name).read_bytes() == b"foo"
+        assert wheelhouse.manifest == {source.name: digest}
+        assert wheelhouse.contains(source.name, {"sha256": digest})
+
+        # Stored files are not fetched again
+        source.unlink()
+        assert not wheelhouse.add(source.name, str(source), {"sha256": digest})
+
+    def test_file_url(self, index, wheelhouse):
+        source = index / "foo-1.0-py3-none-any.whl"
+
+        assert wheelhouse.add(source.name, source.as_uri(), {})
+        assert wheelhouse.manifest == {source.name: get_digest(source)}
+
+    def test_hash_mismatch(self, index, wheelhouse):
+        source = index / "foo-1.0-py3-none-any.whl"
+
+        with pytest.raises(WheelhouseError, match="Hash mismatch for `foo-1.0-py3-none-any.whl`, expected sha256:abc"):
+            wheelhouse.add(source.name, str(source), {"sha256": "abc"})
+
+        assert not list(wheelhouse.path.iterdir())
+        assert not wheelhouse.manifest
+
+    def test_different_contents(self, index, wheelhouse):
+        source = index / "foo-1.0-py3-none-any.whl"
+        wheelhouse.add(source.name, str(source), {})
+
+        with pytest.raises(WheelhouseError, match="already stored with a different hash"):
+            wheelhouse.add(source.name, str(source), {"sha256": "abc"})
+
+    def test_save(self, index, wheelhouse):
+        source = index / "foo-1.0-py3-none-any.whl"
+        wheelhouse.add(source.name, str(source), {})
+        wheelhouse.save()
+
+        assert Wheelhouse(wheelhouse.path).manifest == {source.name: get_digest(source)}
+
+    def test_add_lock(self, index, wheelhouse, temp_dir):
+        lock = Pylock(
+            {
+                "lock-version": "1.0",
+                "packages": [
+                    {
+                        "name": "foo",
+                        "version": "1.0",
+                        "wheels": [
+                            {
+                                "path": "index/foo-1.0-py3-none-any.whl",
+                                "hashes": {"sha256": get_digest(index / "foo-1.0-py3-none-any.whl")},
+                            }
+                        ],
+                        "marker": "sys_platform == 'never'",
+                    },
+                    {"name": "bar", "version": "1.0", "sdist": {"path": "index/bar-1.0.tar.gz"}},
+                    {"name": "baz", "directory": {"path": "baz"}},
+                    {"name": "qux", "vcs": {"type": "git", "url": "https://example.com/qux", "commit-id": "abc"}},
+                ],
+            },
+            temp_dir,
+        )
+
+        assert wheelhouse.add_lock(lock) == (2, ["qux"])
+        assert sorted(wheelhouse.manifest) == ["bar-1.0.tar.gz", "foo-1.0-py3-none-any.whl"]
+        assert wheelhouse.add_lock(lock) == (0, ["qux"])
+
+
+@pytest.fixture
+def environment(temp_dir, isolated_data_dir, platform, temp_application):
+    (temp_dir / "pyproject.toml").write_text(
+        """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "my-app"
+version = "0.0.1"
+"""
+    )
+
+    project = Project(temp_dir)
+    project.set_app(temp_application)
+    temp_application.project = project
+
+    def get_environment(config):
+        return VirtualEnvironment(
+            temp_dir,
+            project.metadata,
+            "default",
+            config,
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            temp_application,
+        )
+
+    return get_environment
+
+
+class TestOffline:
+    def test_default(self, environment):
+        assert environment({}).construct_pip_install_command(["foo"])[-1:] == ["foo"]
+        assert "--no-index" not in environment({}).construct_pip_install_command(["foo"])
+
+    def test_option(self, environment, temp_dir):
+        command = environment({"offline": True}).construct_pip_install_command(["foo"])
+
+        assert command[-4:] == ["--no-index", "--find-links", str(temp_dir / ".hatch" / "wheelhouse"), "foo"]
+
+    def test_uv(self, environment, temp_dir):
+        command = environment({"offline": True, "installer": "uv"}).construct_pip_install_command(["foo"])
+
+        assert command[1:3] == ["pip", "install"]
+        assert command[-4:] == ["--no-index", "--find-links", str(temp_dir / ".hatch" / "wheelhouse"), "foo"]
+
+    def test_env_var(self, environment):
+        with EnvVars({"HATCH_ENV_TYPE_VIRTUAL_OFFLINE": "true"}):
+            assert environment({}).offline
+
+        with EnvVars({"HATCH_ENV_TYPE_VIRTUAL_OFFLINE": "0"}):
+            assert not environment({"offline": True}).offline
+
+    def test_not_boolean(self, environment):
+        with pytest.raises(TypeError, match="Field `tool.hatch.envs.default.offline` must be a boolean"):
+            _ = environment({"offline": 9000}).offline
+
+
+class TestLockEnvironmentDistributions:
+    @pytest.fixture
+    def locker(self, mocker):
+        locker = mocker.MagicMock()
+        mocker.patch("hatch.env.lock.get_locker_plugin_class", return_value=locker)
+        mocker.patch.object(Project, "prepare_environment")
+        mocker.patch.object(Project, "prepare_build_environment")
+        mocker.patch.object(Project, "build_env", new=mocker.MagicMock())
+        return locker
+
+    @pytest.mark.parametrize(("config", "build"), [({}, "editable"), ({"dev-mode": False}, "wheel")])
+    def test_backend_requirements(self, environment, temp_dir, locker, mocker, config, build):
+        build_frontend = mocker.MagicMock()
+        build_frontend.get_requires.return_value = ["editables~=0.3", "hook-dep"]
+        mocker.patch.object(Project, "build_frontend", new=build_frontend)
+
+        assert lock_environment_distributions(environment(config), temp_dir) == []
+
+        build_frontend.get_requires.assert_called_once_with(build)
+        call = locker.generate.call_args_list[-1]
+        assert call.args[1] == ["hatchling", "editables~=0.3", "hook-dep"]
+        assert call.args[2] == temp_dir / "pylock.build.toml"
+
+    def test_skip_install(self, environment, temp_dir, locker, mocker):
+        build_frontend = mocker.MagicMock()
+        mocker.patch.object(Project, "build_frontend", new=build_frontend)
+
+        assert lock_environment_distributions(environment({"skip-install": True}), temp_dir) == []
+
+        build_frontend.get_requires.assert_not_called()
+        locker.generate.assert_not_called()
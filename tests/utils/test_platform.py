@@ -1,10 +1,11 @@
 import os
+import signal
 import stat
 
 import pytest
 
 from hatch.utils.fs import Path
-from hatch.utils.platform import Platform
+from hatch.utils.platform import Platform, split_simple_command
 from hatch.utils.structures import EnvVars
 
 
@@ -120,3 +121,69 @@ class TestLinux:
         kwargs["executable"] = "foo"
         platform.populate_default_popen_kwargs(kwargs, shell=True)
         assert kwargs["executable"] == "foo"
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        ("foo", ["foo"]),
+        ("foo --bar=baz 'a b' \"c d\"", ["foo", "--bar=baz", "a b", "c d"]),
+        ("python -c 'import sys; print(sys.argv[1:])'", ["python", "-c", "import sys; print(sys.argv[1:])"]),
+        ("foo $BAR", None),
+        ('foo "$BAR"', None),
+        ("foo && bar", None),
+        ("foo | bar", None),
+        ("foo > bar", None),
+        ("foo *.py", None),
+        ("FOO=bar foo", None),
+        ("foo 'bar", None),
+        ("", None),
+    ],
+)
+def test_split_simple_command(command, expected):
+    assert split_simple_command(command) == expected
+
+
+def test_ignore_interrupts():
+    original_handler = signal.getsignal(signal.SIGINT)
+
+    def run():
+        with Platform.ignore_interrupts():
+            handlers.append(signal.getsignal(signal.SIGINT))
+            raise RuntimeError
+
+    handlers = []
+    with pytest.raises(RuntimeError):
+        run()
+
+    assert handlers[0] not in {original_handler, signal.SIG_IGN}
+    assert signal.getsignal(signal.SIGINT) is original_handler
+
+
+@pytest.mark.requires_unix
+class TestExitWithShellCommand:
+    def test_direct(self, temp_dir, mocker):
+        executable = temp_dir / "foo"
+        executable.touch()
+        executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+        execv = mocker.patch("os.execv")
+
+        with EnvVars({"PATH": str(temp_dir)}):
+            Platform().exit_with_shell_command("foo 'bar baz'")
+
+        execv.assert_called_once_with(str(executable), ["foo", "bar baz"])
+
+    def test_shell(self, mocker):
+        execv = mocker.patch("os.execv")
+
+        Platform().exit_with_shell_command("foo && bar")
+
+        execv.assert_called_once_with("/bin/sh", ["/bin/sh", "-c", "foo && bar"])
+
+    def test_not_found(self, temp_dir, mocker):
+        execv = mocker.patch("os.execv")
+
+        with EnvVars({"PATH": str(temp_dir)}):
+            Platform().exit_with_shell_command("foo")
+
+        execv.assert_called_once_with("/bin/sh", ["/bin/sh", "-c", "foo"])
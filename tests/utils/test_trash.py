@@ -0,0 +1,207 @@
+import subprocess
+import sys
+
+import pytest
+
+from hatch.config.constants import AppEnvVars
+from hatch.utils.structures import EnvVars
+from hatch.utils.trash import TRASH_DIRECTORY_NAME, Trash, reap_leftovers, start_reaper
+
+
+def populate(path, files=10):
+    (path / "lib" / "site-packages").mkdir(parents=True)
+    for i in range(files):
+        (path / "lib" / "site-packages" / f"{i}.py").write_text(str(i))
+    (path / "pyvenv.cfg").touch()
+
+
+@pytest.fixture
+def trash(temp_dir):
+    return Trash(temp_dir / TRASH_DIRECTORY_NAME)
+
+
+@pytest.fixture
+def detached(mocker):
+    register = mocker.patch("atexit.register")
+    popen = mocker.patch("subprocess.Popen")
+    with EnvVars(exclude=[AppEnvVars.NO_DETACH]):
+        yield register, popen
+
+    start_reaper()
+
+
+class TestDiscard:
+    def test_directory(self, temp_dir, trash, mocker):
+        reap_later = mocker.patch.object(Trash, "reap_later")
+        path = temp_dir / "venv"
+        populate(path)
+
+        trash.discard(path)
+
+        assert not path.exists()
+        (entry,) = trash.directory.iterdir()
+        assert entry.name.startswith("venv-")
+        assert (entry / "pyvenv.cfg").is_file()
+        reap_later.assert_called_once()
+
+    def test_file(self, temp_dir, trash, mocker):
+        reap_later = mocker.patch.object(Trash, "reap_later")
+        path = temp_dir / "foo.txt"
+        path.touch()
+
+        trash.discard(path)
+
+        assert not path.exists()
+        assert not trash.directory.exists()
+        reap_later.assert_not_called()
+
+    def test_rename_failure(self, temp_dir, trash, mocker):
+        mocker.patch("os.rename", side_effect=OSError)
+        reap_later = mocker.patch.object(Trash, "reap_later")
+        path = temp_dir / "venv"
+        populate(path)
+
+        trash.discard(path)
+
+        assert not path.exists()
+        reap_later.assert_not_called()
+
+    def test_inline(self, temp_dir, trash):
+        path = temp_dir / "venv"
+        populate(path)
+
+        with EnvVars({AppEnvVars.NO_DETACH: "1"}):
+            trash.discard(path)
+
+        assert not path.exists()
+        assert not trash.directory.exists()
+
+    def test_detached(self, temp_dir, trash, detached):
+        register, popen = detached
+        path = temp_dir / "venv"
+        populate(path)
+
+        trash.discard(path)
+
+        assert not path.exists()
+        register.assert_called_once_with(start_reaper)
+        popen.assert_not_called()
+
+        start_reaper()
+
+        popen.assert_called_once()
+        assert popen.call_args.args[0] == [sys.executable, "-m", "hatch.utils.trash", str(trash.directory)]
+
+    def test_single_reaper(self, temp_dir, detached):
+        register, popen = detached
+        trash1 = Trash(temp_dir / "env1" / TRASH_DIRECTORY_NAME)
+        trash2 = Trash(temp_dir / "env2" / TRASH_DIRECTORY_NAME)
+        for i, trash in enumerate((trash1, trash1, trash2)):
+            path = temp_dir / f"venv{i}"
+            populate(path)
+            trash.discard(path)
+
+        start_reaper()
+        start_reaper()
+
+        register.assert_called_once()
+        popen.assert_called_once()
+        assert popen.call_args.args[0] == [
+            sys.executable,
+            "-m",
+            "hatch.utils.trash",
+            str(trash1.directory),
+            str(trash2.directory),
+        ]
+
+
+class TestLeftovers:
+    @pytest.fixture
+    def root(self, temp_dir):
+        root = temp_dir / "env"
+        populate(root / "virtual" / TRASH_DIRECTORY_NAME / "venv-1")
+        populate(root / "virtual" / ".scripts" / TRASH_DIRECTORY_NAME / "venv-2")
+        populate(root / "virtual" / "my-app" / "default")
+        return root
+
+    def test_detached(self, root, detached):
+        register, popen = detached
+
+        reap_leftovers(root)
+        register.assert_called_once_with(start_reaper)
+        start_reaper()
+
+        popen.assert_called_once()
+        assert popen.call_args.args[0][3:] == [
+            str(root / "virtual" / ".scripts" / TRASH_DIRECTORY_NAME),
+            str(root / "virtual" / TRASH_DIRECTORY_NAME),
+        ]
+
+    def test_nothing(self, temp_dir, detached):
+        _, popen = detached
+
+        reap_leftovers(temp_dir / "env")
+        start_reaper()
+
+        popen.assert_not_called()
+
+    def test_inline(self, root):
+        reap_leftovers(root)
+
+        assert not (root / "virtual" / TRASH_DIRECTORY_NAME).exists()
+        assert not (root / "virtual" / ".scripts" / TRASH_DIRECTORY_NAME).exists()
+        assert (root / "virtual" / "my-app" / "default" / "pyvenv.cfg").is_file()
+
+
+class TestReap:
+    def test_leftovers(self, trash):
+        # Interrupted reapers leave partially deleted entries behind
+        trash.directory.mkdir()
+        populate(trash.directory / "venv-1", files=100)
+        populate(trash.directory / "venv-2", files=0)
+        (trash.directory / "venv-2" / "pyvenv.cfg").unlink()
+
+        trash.reap(workers=4)
+
+        assert not trash.directory.exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Symbolic links require privileges on Windows")
+    def test_symlinks_not_followed(self, temp_dir, trash):
+        target = temp_dir / "python"
+        target.mkdir()
+        (target / "python3").touch()
+
+        entry = trash.directory / "venv-1"
+        (entry / "bin").mkdir(parents=True)
+        (entry / "bin" / "python").symlink_to(target / "python3")
+        (entry / "lib").symlink_to(target, target_is_directory=True)
+
+        trash.reap()
+
+        assert not trash.directory.exists()
+        assert (target / "python3").is_file()
+
+    def test_removal_failure(self, trash, mocker):
+        trash.directory.mkdir()
+        populate(trash.directory / "venv-1")
+        mocker.patch("os.rmdir", side_effect=OSError)
+
+        trash.reap()
+
+        # Directories that cannot be removed are left for the next reaper
+        assert (trash.directory / "venv-1" / "lib" / "site-packages").is_dir()
+        assert not list((trash.directory / "venv-1" / "lib" / "site-packages").iterdir())
+
+    def test_process(self, trash):
+        trash.directory.mkdir()
+        populate(trash.directory / "venv-1")
+
+        other = Trash(trash.directory.parent / "other" / TRASH_DIRECTORY_NAME)
+        populate(other.directory / "venv-2")
+
+        subprocess.run(
+            [sys.executable, "-m", "hatch.utils.trash", str(trash.directory), str(other.directory)], check=True
+        )
+
+        assert not trash.directory.exists()
+        assert not other.directory.exists()